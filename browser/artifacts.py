@@ -0,0 +1,260 @@
+import base64
+import gzip
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+
+
+@dataclass
+class ArtifactLimits:
+    """
+    Size limits of the artifacts captured for a failed UI test.
+
+    Attributes:
+        screenshot_quality (int): JPEG quality of screenshots (1-100); 0 keeps lossless PNG.
+        max_screenshot_kb (int): Larger screenshots are left out.
+        max_dom_kb (int): The DOM snapshot is cut off after this much HTML (before compression).
+        max_console_kb (int): Only the last entries of the console log that fit are kept.
+        max_total_mb (int): Once this much has been attached in a session, only the console log is attached.
+        attach_timeout (float): Seconds a test's teardown waits for its artifacts to be encoded.
+    """
+    screenshot_quality: int = 60
+    max_screenshot_kb: int = 1024
+    max_dom_kb: int = 512
+    max_console_kb: int = 64
+    max_total_mb: int = 200
+    attach_timeout: float = 10
+
+
+@dataclass
+class FailureArtifacts:
+    """
+    What was read from the browser when a test failed, still in its raw form.
+
+    Attributes:
+        screenshot (str | None): The base64-encoded screenshot.
+        screenshot_format (str): "jpeg" or "png".
+        dom (str | None): The page's HTML.
+        console (list[dict]): Browser console entries ({"level", "timestamp", "message"}).
+        notes (list[str]): What could not be captured or was left out, and why.
+    """
+    screenshot: str | None = None
+    screenshot_format: str = "png"
+    dom: str | None = None
+    console: list = field(default_factory=list)
+    notes: list = field(default_factory=list)
+
+
+@dataclass
+class EncodedArtifact:
+    """
+    One artifact ready to be attached to a report.
+
+    Attributes:
+        name (str): The attachment's name, e.g. "screenshot".
+        body (bytes): The encoded content.
+        mime_type (str): e.g. "image/jpeg".
+        extension (str): The file extension, e.g. "jpg".
+    """
+    name: str
+    body: bytes
+    mime_type: str
+    extension: str
+
+
+class ArtifactWriter:
+    """
+    Captures a failed test's screenshot, DOM snapshot and console log, and
+    encodes and compresses them on a background thread.
+
+    Only the reads from the browser happen on the test's thread, and they
+    stay cheap: the screenshot is taken as JPEG by the browser itself and kept
+    base64-encoded, so its size is known without decoding it. Decoding,
+    truncating and gzip-compressing the DOM is left to a single worker thread
+    while the test tears down, so a failing test hands over its browser almost
+    as quickly as a passing one; `collect()` then returns the encoded
+    artifacts for attaching. `ArtifactLimits` keep each artifact, and the
+    session as a whole, within a configurable size.
+    """
+
+    def __init__(self, limits=None):
+        """
+        Args:
+            limits (ArtifactLimits, optional): Size limits; the defaults if omitted.
+        """
+        self.limits = limits or ArtifactLimits()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="artifacts")
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._stats = {"failures": 0, "capture_seconds": 0.0, "encoded_bytes": 0, "omitted": 0, "errors": 0}
+
+    def capture(self, driver, since=None):
+        """
+        Reads the failure artifacts from a browser (on the calling thread).
+
+        Args:
+            driver: The failed test's WebDriver.
+            since (float, optional): Epoch seconds; older console entries, e.g.
+                                     from a previous test in a reused browser, are skipped.
+
+        Returns:
+            FailureArtifacts: The raw artifacts.
+        """
+        started = time.perf_counter()
+        artifacts = FailureArtifacts()
+        try:
+            if self.limits.screenshot_quality and hasattr(driver, "execute_cdp_cmd"):
+                artifacts.screenshot = driver.execute_cdp_cmd(
+                    "Page.captureScreenshot", {"format": "jpeg", "quality": self.limits.screenshot_quality}
+                )["data"]
+                artifacts.screenshot_format = "jpeg"
+            else:
+                artifacts.screenshot = driver.get_screenshot_as_base64()
+        except Exception as e:
+            artifacts.notes.append(f"screenshot not captured: {e}")
+        try:
+            artifacts.dom = driver.page_source
+        except Exception as e:
+            artifacts.notes.append(f"DOM not captured: {e}")
+        try:
+            artifacts.console = [entry for entry in driver.get_log("browser")
+                                 if since is None or entry.get("timestamp", 0) >= since * 1000]
+        except Exception as e:
+            artifacts.notes.append(f"console log not captured: {e}")
+        with self._lock:
+            self._stats["failures"] += 1
+            self._stats["capture_seconds"] += time.perf_counter() - started
+        return artifacts
+
+    def submit(self, artifacts):
+        """
+        Plans which artifacts fit the limits and encodes them in the background.
+
+        Args:
+            artifacts (FailureArtifacts): The output of `capture()`.
+
+        Returns:
+            Future: Resolves to the list of `EncodedArtifact`s; pass it to `collect()`.
+        """
+        with self._lock:
+            budget_left = self.limits.max_total_mb * 1024 * 1024 - self._stats["encoded_bytes"]
+
+        planned = []
+        if artifacts.screenshot is not None:
+            # Exact decoded size of the base64 data, without decoding it
+            size = len(artifacts.screenshot) * 3 // 4 - artifacts.screenshot.count("=", -2)
+            if size > self.limits.max_screenshot_kb * 1024:
+                self._omit(artifacts, f"screenshot omitted: {size // 1024} KB is over the "
+                                      f"{self.limits.max_screenshot_kb} KB limit")
+            elif size > budget_left:
+                self._omit(artifacts, f"screenshot omitted: the session's "
+                                      f"{self.limits.max_total_mb} MB limit is used up")
+            else:
+                extension = "jpg" if artifacts.screenshot_format == "jpeg" else "png"
+                planned.append(("screenshot", f"image/{artifacts.screenshot_format}", extension,
+                                base64.b64decode, artifacts.screenshot))
+                budget_left -= size
+
+        if artifacts.dom is not None:
+            if budget_left <= 0:
+                self._omit(artifacts, f"DOM omitted: the session's {self.limits.max_total_mb} MB limit is used up")
+            else:
+                planned.append(("page DOM", "application/gzip", "html.gz", self._encode_dom, artifacts.dom))
+
+        # Always attached: it is small and explains anything left out
+        planned.append(("browser console", "text/plain", "txt", self._encode_console, artifacts))
+
+        future = self._executor.submit(self._encode, planned)
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._done)
+        return future
+
+    def collect(self, future, timeout=None):
+        """
+        Waits for artifacts submitted with `submit()` to be encoded.
+
+        Args:
+            future (Future): The return value of `submit()`.
+            timeout (float, optional): Seconds to wait; defaults to the limits' attach_timeout.
+
+        Returns:
+            list[EncodedArtifact]: The artifacts, or an empty list if encoding
+                                   did not finish in time or failed.
+        """
+        try:
+            return future.result(self.limits.attach_timeout if timeout is None else timeout)
+        except Exception:
+            with self._lock:
+                self._stats["errors"] += 1
+            return []
+
+    def drain(self, timeout=None):
+        """
+        Waits until every submitted artifact has been encoded.
+        """
+        with self._lock:
+            pending = set(self._pending)
+        wait(pending, timeout=timeout)
+
+    def close(self, timeout=None):
+        """
+        Encodes everything still queued and stops the background thread.
+        """
+        self.drain(timeout)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self):
+        """
+        Returns the number of failures captured, the time spent reading from the
+        browser on the test threads, the bytes encoded for attaching, the
+        artifacts left out and the ones that could not be encoded in time.
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def _omit(self, artifacts, note):
+        artifacts.notes.append(note)
+        with self._lock:
+            self._stats["omitted"] += 1
+
+    def _done(self, future):
+        with self._lock:
+            self._pending.discard(future)
+
+    def _encode(self, planned):
+        encoded = []
+        for name, mime_type, extension, encode, raw in planned:
+            try:
+                body = encode(raw)
+            except Exception:
+                with self._lock:
+                    self._stats["errors"] += 1
+                continue
+            with self._lock:
+                self._stats["encoded_bytes"] += len(body)
+            encoded.append(EncodedArtifact(name, body, mime_type, extension))
+        return encoded
+
+    def _encode_dom(self, dom):
+        limit = self.limits.max_dom_kb * 1024
+        body = dom.encode("utf-8", errors="replace")
+        if len(body) > limit:
+            note = f"\n<!-- cut off after {self.limits.max_dom_kb} KB of {len(body) // 1024} KB -->"
+            body = body[:limit] + note.encode()
+        return gzip.compress(body, compresslevel=6)
+
+    def _encode_console(self, artifacts):
+        lines = [f"# {note}" for note in artifacts.notes]
+        for entry in artifacts.console:
+            timestamp = time.strftime("%H:%M:%S", time.localtime(entry.get("timestamp", 0) / 1000))
+            lines.append(f"{timestamp} {entry.get('level', 'INFO')} {entry.get('message', '')}")
+        if not artifacts.console:
+            lines.append("(no console output)")
+        text = "\n".join(lines).encode("utf-8", errors="replace")
+        limit = self.limits.max_console_kb * 1024
+        if len(text) > limit:
+            # The latest entries are the ones closest to the failure
+            text = b"# earlier entries cut off\n" + text[-limit:]
+        return text
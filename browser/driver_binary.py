@@ -0,0 +1,161 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.core.os_manager import ChromeType, OperationSystemManager
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+# Where the resolved driver path is shared between workers and sessions
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "qa_automation")
+
+# Re-check for a newer matching driver at most this often (seconds)
+DEFAULT_MAX_AGE = 24 * 60 * 60
+
+
+class DriverResolutionStats:
+    """
+    Collects how long chromedriver resolution took in this process and where
+    the binary came from ("env", "memory", "disk" or "webdriver-manager").
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.seconds = 0.0
+        self.sources = {}
+
+    def record(self, source, seconds):
+        with self._lock:
+            self.calls += 1
+            self.seconds += seconds
+            self.sources[source] = self.sources.get(source, 0) + 1
+
+    def summary(self):
+        with self._lock:
+            return {"calls": self.calls, "seconds": self.seconds, "sources": dict(self.sources)}
+
+
+# Process-wide resolution statistics, reported at the end of the test session
+resolution_stats = DriverResolutionStats()
+
+_resolved_path = None
+_resolve_lock = threading.Lock()
+
+
+def resolve_chromedriver(cache_dir=None, max_age=DEFAULT_MAX_AGE):
+    """
+    Returns the path of a chromedriver matching the installed Chrome.
+
+    `ChromeDriverManager().install()` does a version lookup (usually over the
+    network) and a cache check on every call, and parallel workers race on its
+    cache directory. Here the resolved path is memoized per process and shared
+    per machine through a small JSON record guarded by a file lock, so only the
+    first worker of a session talks to webdriver-manager. The record is reused
+    while the binary exists, the Chrome major version matches and it is younger
+    than `max_age`; if refreshing it fails (e.g. offline), the existing binary
+    is used. Set CHROMEDRIVER_PATH to bypass resolution entirely.
+
+    Args:
+        cache_dir (str, optional): Where the record and lock file live.
+                                   Defaults to CHROMEDRIVER_CACHE_DIR or ~/.cache/qa_automation.
+        max_age (float, optional): Seconds before webdriver-manager is consulted again.
+
+    Returns:
+        str: The chromedriver executable path.
+    """
+    global _resolved_path
+    started = time.perf_counter()
+    with _resolve_lock:
+        if os.getenv("CHROMEDRIVER_PATH"):
+            path, source = os.environ["CHROMEDRIVER_PATH"], "env"
+        elif _resolved_path is not None:
+            path, source = _resolved_path, "memory"
+        else:
+            path, source = _resolve_shared(cache_dir or os.getenv("CHROMEDRIVER_CACHE_DIR", DEFAULT_CACHE_DIR),
+                                           max_age)
+            _resolved_path = path
+    resolution_stats.record(source, time.perf_counter() - started)
+    return path
+
+
+def _resolve_shared(cache_dir, max_age):
+    os.makedirs(cache_dir, exist_ok=True)
+    record_path = os.path.join(cache_dir, "chromedriver.json")
+    with _file_lock(os.path.join(cache_dir, "chromedriver.lock")):
+        record = _read_record(record_path)
+        browser_version = _browser_major_version()
+        usable = record is not None and os.access(record.get("path", ""), os.X_OK)
+        if usable and record.get("browser_version") == browser_version \
+                and time.time() - record.get("resolved_at", 0) < max_age:
+            return record["path"], "disk"
+        try:
+            path = ChromeDriverManager().install()
+        except Exception:
+            # Offline or rate limited: a previously downloaded driver beats failing the session
+            if usable:
+                return record["path"], "disk"
+            raise
+        _write_record(record_path, {"path": path, "browser_version": browser_version, "resolved_at": time.time()})
+        return path, "webdriver-manager"
+
+
+def _browser_major_version():
+    """
+    Returns the installed Chrome's major version (e.g. "126"), or None if it can't be determined.
+    """
+    try:
+        version = OperationSystemManager().get_browser_version_from_os(ChromeType.GOOGLE)
+    except Exception:
+        return None
+    return version.split(".")[0] if version else None
+
+
+def _read_record(record_path):
+    try:
+        with open(record_path) as record_file:
+            return json.load(record_file)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_record(record_path, record):
+    # Write to a temporary file first so readers never see a partial record
+    temp_path = f"{record_path}.{os.getpid()}.tmp"
+    with open(temp_path, "w") as record_file:
+        json.dump(record, record_file)
+    os.replace(temp_path, record_path)
+
+
+@contextmanager
+def _file_lock(lock_path):
+    """
+    Holds an exclusive, cross-process lock on `lock_path` (blocking until it is free).
+    """
+    with open(lock_path, "a+") as lock_file:
+        if os.name == "nt":
+            lock_file.seek(0)
+            # LK_LOCK retries for ~10 s before raising; keep waiting like flock does
+            while True:
+                try:
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+            try:
+                yield
+            finally:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
@@ -0,0 +1,76 @@
+import os
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service as ChromeService
+
+from browser.driver_binary import resolve_chromedriver
+
+# Viewport every browser starts with (and is reset to between tests)
+WINDOW_SIZE = (1920, 1080)
+
+CHROME_ARGUMENTS = [
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    f"--window-size={WINDOW_SIZE[0]},{WINDOW_SIZE[1]}",
+    "--disable-popup-blocking",
+    "--disable-extensions",
+    "--disable-save-password-bubble",
+    "--disable-password-manager-reauthentication",
+    "--incognito",
+    "--disable-blink-features=AutomationControlled",
+    "--headless",
+]
+
+CHROME_PREFS = {
+    "credentials_enable_service": False,
+    "profile.password_manager_enabled": False,
+    "profile.default_content_setting_values.notifications": 2,
+    "profile.default_content_setting_values.automatic_downloads": 1,
+    "profile.default_content_setting_values.popups": 0,
+}
+
+
+def chrome_options(user_data_dir, performance_log=False):
+    """
+    Builds the Chrome options used for every UI test browser.
+
+    Args:
+        user_data_dir (str): A profile directory unique to this browser, to
+                             prevent 'SessionNotCreatedException' errors.
+        performance_log (bool, optional): Record DevTools network events, readable
+                                          through get_log("performance").
+
+    Returns:
+        Options: The configured Chrome options.
+    """
+    options = Options()
+    options.add_argument(f"--user-data-dir={user_data_dir}")
+    for argument in CHROME_ARGUMENTS:
+        options.add_argument(argument)
+    options.add_experimental_option("prefs", CHROME_PREFS)
+    # Keep the console log readable through get_log("browser") for failure artifacts
+    logging_prefs = {"browser": "ALL"}
+    if performance_log:
+        # Network events for the resource blocking counters
+        logging_prefs["performance"] = "ALL"
+        options.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True})
+    options.set_capability("goog:loggingPrefs", logging_prefs)
+    return options
+
+
+def create_chrome_driver(user_data_dir, performance_log=False):
+    """
+    Launches a headless Chrome with its own profile directory.
+
+    Args:
+        user_data_dir (str): The profile directory; created if missing.
+        performance_log (bool, optional): Record DevTools network events (see `chrome_options()`).
+
+    Returns:
+        webdriver.Chrome: The new browser session.
+    """
+    os.makedirs(user_data_dir, exist_ok=True)
+    service = ChromeService(resolve_chromedriver())
+    return webdriver.Chrome(service=service, options=chrome_options(user_data_dir, performance_log))
@@ -0,0 +1,355 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import NoAlertPresentException, WebDriverException
+
+from browser.driver_factory import WINDOW_SIZE
+
+# Default number of tests a browser serves before it is replaced
+DEFAULT_MAX_USES = 50
+
+# Memory assumed for one headless Chrome until a real one has been measured
+DEFAULT_BROWSER_MB = 350
+
+# Reports whatever state survived a reset; everything must be empty
+_LEFTOVER_STATE_SCRIPT = "return [document.cookie, window.localStorage.length, window.sessionStorage.length];"
+
+# Pulls every static asset listed in the app's build manifest (JS, CSS and the
+# product images) into the browser's HTTP cache; resolves with the number fetched
+_WARM_ASSETS_SCRIPT = """
+const done = arguments[arguments.length - 1];
+fetch('/asset-manifest.json')
+    .then(response => response.ok ? response.json() : {files: {}})
+    .then(manifest => Promise.all(Object.values(manifest.files || {})
+        .filter(url => typeof url === 'string' && !url.endsWith('.map'))
+        .map(url => fetch(url, {cache: 'force-cache'}).then(() => 1, () => 0))))
+    .then(fetched => done(fetched.reduce((total, ok) => total + ok, 0)), () => done(0));
+"""
+
+
+class DriverPool:
+    """
+    A pool of long-lived browsers that hands out one driver per test.
+
+    Launching Chrome dominates the cost of a short UI test, so browsers are
+    kept alive between tests and thoroughly reset before each one is handed
+    out: extra windows and alerts are closed, cookies and all origin storage
+    (localStorage, sessionStorage, IndexedDB, caches - including SauceDemo's
+    cart) are cleared and the base URL is reloaded. A browser is replaced once
+    it has served `max_uses` tests, or as soon as it crashes or cannot be
+    verifiably reset, so every test starts from the same state as a freshly
+    launched one.
+
+    With `spares` greater than zero the pool also works ahead of the tests:
+    released browsers are reset in the background, and new browsers are
+    launched, loaded with the base URL and SauceDemo's static assets while the
+    current test runs, so `acquire()` usually hands out a ready browser at
+    once. Spares are only launched while the pool's browsers fit within
+    `memory_limit_mb`; a test that finds no spare still gets a browser the
+    ordinary way.
+
+    The pool is thread-safe; the pytest fixture keeps one per session, i.e.
+    one per xdist worker.
+    """
+
+    def __init__(self, factory, base_url, max_uses=DEFAULT_MAX_USES, spares=0, memory_limit_mb=None):
+        """
+        Args:
+            factory (callable): Launches a new browser and returns its WebDriver.
+            base_url (str): The page every handed-out browser is left on.
+            max_uses (int, optional): Tests a browser may serve before it is
+                                      replaced; 1 launches a fresh browser per test.
+            spares (int, optional): Browsers to keep warmed up in the background;
+                                    0 prepares every browser on the test's critical path.
+            memory_limit_mb (float, optional): Memory all of the pool's browsers may
+                                               use before no more spares are launched.
+        """
+        if max_uses < 1:
+            raise ValueError("max_uses must be at least 1")
+        if spares < 0:
+            raise ValueError("spares must not be negative")
+        self.factory = factory
+        self.base_url = base_url
+        self.max_uses = max_uses
+        self.spares = spares
+        self.memory_limit_mb = memory_limit_mb
+        self._idle = []
+        self._ready = []
+        self._uses = {}
+        self._warming = 0
+        self._launching = 0
+        self._browser_mb = DEFAULT_BROWSER_MB
+        self._measured = False
+        self._closed = False
+        self._lock = threading.Lock()
+        self._ready_changed = threading.Condition(self._lock)
+        self._executor = ThreadPoolExecutor(max_workers=spares, thread_name_prefix="prewarm") if spares else None
+        self._stats = {"launched": 0, "reused": 0, "recycled": 0, "crashed": 0, "prewarmed": 0,
+                       "memory_skips": 0}
+        self._replenish()
+
+    def acquire(self):
+        """
+        Returns a browser that is reset and showing the base URL.
+
+        A browser warmed up in the background is handed out at once, waiting
+        for one still being prepared if necessary. Otherwise idle browsers are
+        reused; one that fails its reset is discarded and the next (or a newly
+        launched) browser is tried instead.
+        """
+        with self._ready_changed:
+            while not self._ready and self._warming and not self._closed:
+                self._ready_changed.wait()
+            driver = self._ready.pop() if self._ready else None
+            if driver is not None:
+                self._stats["prewarmed"] += 1
+        if driver is not None:
+            self._replenish()
+            return driver
+
+        while True:
+            with self._lock:
+                driver = self._idle.pop() if self._idle else None
+            if driver is None:
+                break
+            try:
+                self.reset(driver)
+            except Exception:
+                # Unresponsive browsers raise WebDriverException; a dead driver
+                # process surfaces as a connection error instead
+                self._discard(driver, "crashed")
+                continue
+            with self._lock:
+                self._stats["reused"] += 1
+            return driver
+
+        driver = self._launch()
+        try:
+            self.reset(driver)
+        except Exception:
+            self._discard(driver, "crashed")
+            raise
+        self._replenish()
+        return driver
+
+    def release(self, driver, broken=False):
+        """
+        Returns a browser to the pool after a test.
+
+        Args:
+            driver: A driver obtained from `acquire()`.
+            broken (bool, optional): Discard the browser instead of reusing it,
+                                     e.g. when it is known to have crashed.
+        """
+        with self._lock:
+            self._uses[driver] += 1
+            worn_out = self._uses[driver] >= self.max_uses
+            if not broken and not worn_out:
+                if self._executor is None or self._closed:
+                    self._idle.append(driver)
+                    return
+                # Reset it for the next test while the current one finishes
+                self._warming += 1
+                self._executor.submit(self._warm_up, driver)
+                return
+        self._discard(driver, "crashed" if broken else "recycled")
+        self._replenish()
+
+    def reset(self, driver):
+        """
+        Restores a browser to the state of a freshly launched one on the base URL.
+
+        Raises:
+            WebDriverException: If the browser is unresponsive or state survived the reset.
+        """
+        # A leftover alert would block every other command
+        try:
+            driver.switch_to.alert.dismiss()
+        except NoAlertPresentException:
+            pass
+
+        # Close any windows or tabs the previous test opened
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+
+        # Clear cookies and every kind of origin storage before loading the page,
+        # so the app never boots with the previous test's state
+        if hasattr(driver, "execute_cdp_cmd"):
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            origins = {_origin(self.base_url), _origin(driver.current_url)}
+            for origin in origins - {None}:
+                driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+
+        size = driver.get_window_size()
+        if (size["width"], size["height"]) != WINDOW_SIZE:
+            driver.set_window_size(*WINDOW_SIZE)
+
+        driver.get(self.base_url)
+        # Clear all cookies and storage to ensure a clean state
+        driver.delete_all_cookies()
+        driver.execute_script("window.localStorage.clear();")
+        driver.execute_script("window.sessionStorage.clear();")
+
+        cookies, local_items, session_items = driver.execute_script(_LEFTOVER_STATE_SCRIPT)
+        if cookies or local_items or session_items:
+            raise WebDriverException("Browser state survived the reset")
+
+    def warm_assets(self, driver):
+        """
+        Loads SauceDemo's static assets into a browser's HTTP cache, so the
+        first page a test opens does not have to download them. Best effort:
+        a page without a build manifest simply warms nothing.
+
+        Returns:
+            int: The number of assets fetched.
+        """
+        try:
+            return driver.execute_async_script(_WARM_ASSETS_SCRIPT) or 0
+        except WebDriverException:
+            return 0
+
+    def _launch(self):
+        driver = self.factory()
+        with self._lock:
+            self._uses[driver] = 0
+            self._stats["launched"] += 1
+        return driver
+
+    def _replenish(self):
+        """
+        Starts warming up new browsers until `spares` are ready or on their way.
+        """
+        if self._executor is None:
+            return
+        with self._lock:
+            while not self._closed and len(self._ready) + self._warming < self.spares:
+                if not self._memory_allows_another():
+                    self._stats["memory_skips"] += 1
+                    break
+                self._warming += 1
+                self._launching += 1
+                self._executor.submit(self._warm_up, None)
+
+    def _memory_allows_another(self):
+        if self.memory_limit_mb is None:
+            return True
+        # Every browser the pool owns or is launching, plus the one about to start
+        return (len(self._uses) + self._launching + 1) * self._browser_mb <= self.memory_limit_mb
+
+    def _warm_up(self, driver):
+        """
+        Runs on a background thread: launches a browser (if `driver` is None)
+        or takes a released one, resets it and adds it to the ready browsers.
+        """
+        reused = driver is not None
+        try:
+            if driver is None:
+                try:
+                    driver = self._launch()
+                finally:
+                    with self._lock:
+                        self._launching -= 1
+                self.reset(driver)
+                self.warm_assets(driver)
+                self._measure(driver)
+            else:
+                self.reset(driver)
+        except Exception:
+            if driver is not None:
+                self._discard(driver, "crashed")
+            with self._ready_changed:
+                self._warming -= 1
+                self._ready_changed.notify_all()
+            return
+        with self._ready_changed:
+            self._warming -= 1
+            self._stats["reused"] += reused
+            closed = self._closed
+            if not closed:
+                self._ready.append(driver)
+            self._ready_changed.notify_all()
+        if closed:
+            self._discard(driver)
+
+    def _measure(self, driver):
+        """
+        Updates the per-browser memory estimate from a freshly launched browser.
+        """
+        service = getattr(driver, "service", None)
+        process = getattr(service, "process", None)
+        if process is None:
+            return
+        megabytes = _process_tree_mb(process.pid)
+        if megabytes:
+            with self._lock:
+                # The first measurement replaces the default; later ones can only raise it
+                self._browser_mb = max(self._browser_mb, megabytes) if self._measured else megabytes
+                self._measured = True
+
+    def _discard(self, driver, reason=None):
+        with self._lock:
+            self._uses.pop(driver, None)
+            if reason is not None:
+                self._stats[reason] += 1
+        try:
+            driver.quit()
+        except Exception:
+            # The browser is already gone
+            pass
+
+    def close(self):
+        """
+        Stops warming up browsers and quits every idle and ready browser.
+        """
+        with self._ready_changed:
+            self._closed = True
+            self._ready_changed.notify_all()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+        with self._lock:
+            idle, self._idle, self._ready = self._idle + self._ready, [], []
+        for driver in idle:
+            self._discard(driver)
+
+    def stats(self):
+        """
+        Returns how many browsers were launched, reused, recycled and crashed,
+        how many tests got a browser warmed up in the background, and how
+        often the memory limit held back a spare.
+        """
+        with self._lock:
+            return dict(self._stats)
+
+
+def _origin(url):
+    parts = urlsplit(url or "")
+    if parts.scheme not in ("http", "https"):
+        return None
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def _process_tree_mb(pid):
+    """
+    Returns the resident memory of a process and all of its descendants in MB
+    (chromedriver plus its Chrome processes), or 0 where /proc is unavailable.
+    """
+    total_kb, pending, seen = 0, [pid], set()
+    while pending:
+        current = pending.pop()
+        if current in seen:
+            continue
+        seen.add(current)
+        try:
+            with open(f"/proc/{current}/status") as status:
+                total_kb += next((int(line.split()[1]) for line in status if line.startswith("VmRSS:")), 0)
+            for task in os.listdir(f"/proc/{current}/task"):
+                with open(f"/proc/{current}/task/{task}/children") as children:
+                    pending.extend(int(child) for child in children.read().split())
+        except (OSError, ValueError):
+            continue
+    return total_kb / 1024
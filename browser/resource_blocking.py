@@ -0,0 +1,183 @@
+import json
+import threading
+from statistics import fmean
+from urllib.parse import urlsplit
+
+# URL patterns (with `*` wildcards) blocked for each resource type
+RESOURCE_TYPE_PATTERNS = {
+    "image": ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico"],
+    "font": ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"],
+    "media": ["*.mp4", "*.webm", "*.ogg", "*.mp3", "*.wav"],
+    "stylesheet": ["*.css"],
+}
+
+
+def blocked_url_patterns(resource_types=(), url_patterns=()):
+    """
+    Returns the URL patterns to block for the given resource types
+    (keys of RESOURCE_TYPE_PATTERNS) and additional URL patterns.
+
+    Raises:
+        ValueError: If a resource type is unknown.
+    """
+    patterns = []
+    for resource_type in resource_types:
+        if resource_type not in RESOURCE_TYPE_PATTERNS:
+            raise ValueError(
+                f"Unknown resource type {resource_type!r}; expected one of {', '.join(RESOURCE_TYPE_PATTERNS)}"
+            )
+        patterns.extend(RESOURCE_TYPE_PATTERNS[resource_type])
+    return patterns + [pattern for pattern in url_patterns if pattern]
+
+
+# The URL and load time (request to load event, in seconds) of the page's last full load
+_NAVIGATION_SCRIPT = """
+const [entry] = performance.getEntriesByType('navigation');
+return entry && entry.loadEventEnd > 0 ? [entry.name, (entry.loadEventEnd - entry.startTime) / 1000] : null;
+"""
+
+
+class ResourceBlocker:
+    """
+    Blocks chosen resources (e.g. product images and fonts) in the test
+    browsers through the Chrome DevTools Protocol, and measures what that saves.
+
+    Blocking uses `Network.setBlockedURLs`, so blocked requests fail inside
+    Chrome's network stack without ever being sent. The savings are read from
+    the DevTools network events in ChromeDriver's performance log (browsers
+    must be launched with it enabled): every blocked request is counted, and
+    priced with the size of the same URL when a test that loads everything
+    (e.g. an image check) downloaded it from the network; responses served
+    from a cache (e.g. assets the pool preloaded) say nothing about the size.
+    Full page loads made during a test are timed from the document request to
+    the load event, separately with and without blocking, so the difference
+    per page shows the load time saved.
+
+    One blocker is shared by all browsers of a session; it is thread-safe.
+    """
+
+    def __init__(self, patterns):
+        """
+        Args:
+            patterns (list[str]): URL patterns to block, see `blocked_url_patterns()`.
+        """
+        self.patterns = list(patterns)
+        self._lock = threading.Lock()
+        # Bytes on the wire per URL, learned from requests that were not blocked
+        self._sizes = {}
+        # Page load times in seconds per (path, blocked)
+        self._loads = {}
+        self._blocked_urls = []
+        self._tests = {"blocked": 0, "unblocked": 0}
+
+    def start(self, driver, block=True):
+        """
+        Prepares a browser for a test: discards the network events of earlier
+        tests and blocks the configured resources, or nothing for a test that
+        needs all of them.
+
+        Args:
+            driver: The test's WebDriver.
+            block (bool, optional): Whether to block the configured resources.
+        """
+        driver.get_log("performance")
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.patterns if block else []})
+        with self._lock:
+            self._tests["blocked" if block else "unblocked"] += 1
+
+    def finish(self, driver, blocked=True):
+        """
+        Records the network events of the test that ran since `start()`.
+
+        Args:
+            driver: The test's WebDriver.
+            blocked (bool, optional): Whether the test ran with blocking, as passed to `start()`.
+        """
+        events = [json.loads(entry["message"])["message"] for entry in driver.get_log("performance")]
+        self.record(events, blocked, driver.execute_script(_NAVIGATION_SCRIPT))
+
+    def record(self, events, blocked, navigation=None):
+        """
+        Adds the requests found in DevTools events, and the page load if it happened among them.
+
+        Args:
+            events (list[dict]): DevTools events ({"method", "params"}) in the order they were emitted.
+            blocked (bool): Whether blocking was enabled while they happened.
+            navigation (list, optional): [url, seconds] of the page's last full load.
+        """
+        urls, documents, sizes, blocked_urls, cached = {}, set(), {}, [], set()
+        for event in events:
+            method, params = event.get("method"), event.get("params", {})
+            if method == "Network.requestWillBeSent":
+                urls[params["requestId"]] = params["request"]["url"]
+                if params.get("type") == "Document":
+                    documents.add(params["request"]["url"])
+            elif method == "Network.requestServedFromCache":
+                cached.add(params["requestId"])
+            elif method == "Network.responseReceived":
+                response = params.get("response", {})
+                if response.get("fromDiskCache") or response.get("fromPrefetchCache"):
+                    cached.add(params["requestId"])
+            elif method == "Network.loadingFinished" and params["requestId"] in urls:
+                # A cached response transfers (next to) nothing, so it cannot price a blocked request
+                if params["requestId"] not in cached:
+                    sizes[urls[params["requestId"]]] = params.get("encodedDataLength", 0)
+            elif method == "Network.loadingFailed" and params.get("blockedReason") == "inspector":
+                # Blocked through Network.setBlockedURLs
+                if params["requestId"] in urls:
+                    blocked_urls.append(urls[params["requestId"]])
+        with self._lock:
+            self._sizes.update(sizes)
+            self._blocked_urls.extend(blocked_urls)
+            # A load that started before the test (e.g. the pool's reset) is not attributed to it
+            if navigation is not None and navigation[0] in documents:
+                self._loads.setdefault((urlsplit(navigation[0]).path, blocked), []).append(navigation[1])
+
+    def dump(self):
+        """
+        Returns the raw measurements, e.g. to send them from a parallel worker.
+        """
+        with self._lock:
+            return {
+                "sizes": dict(self._sizes),
+                "loads": [[path, blocked, list(seconds)] for (path, blocked), seconds in self._loads.items()],
+                "blocked_urls": list(self._blocked_urls),
+                "tests": dict(self._tests),
+            }
+
+    def merge(self, dumped):
+        """
+        Adds measurements produced by `dump()` (e.g. in a parallel worker).
+        """
+        with self._lock:
+            self._sizes.update(dumped["sizes"])
+            for path, blocked, seconds in dumped["loads"]:
+                self._loads.setdefault((path, blocked), []).extend(seconds)
+            self._blocked_urls.extend(dumped["blocked_urls"])
+            for key, count in dumped["tests"].items():
+                self._tests[key] += count
+
+    def summary(self):
+        """
+        Returns what blocking saved: "requests_blocked", "bytes_saved" (of the
+        blocked URLs whose size is known), "unpriced" (blocked requests of
+        unknown size), "load_seconds_saved" (per page, the mean load time
+        without blocking minus the mean with it, times the blocked loads, for
+        pages loaded both ways) and the tests run with and without blocking.
+        """
+        with self._lock:
+            priced = [self._sizes[url] for url in self._blocked_urls if url in self._sizes]
+            load_seconds_saved = 0.0
+            for (path, blocked), seconds in self._loads.items():
+                baseline = self._loads.get((path, False))
+                if blocked and baseline:
+                    load_seconds_saved += (fmean(baseline) - fmean(seconds)) * len(seconds)
+            return {
+                "requests_blocked": len(self._blocked_urls),
+                "bytes_saved": sum(priced),
+                "unpriced": len(self._blocked_urls) - len(priced),
+                "load_seconds_saved": load_seconds_saved,
+                "blocked_tests": self._tests["blocked"],
+                "unblocked_tests": self._tests["unblocked"],
+            }
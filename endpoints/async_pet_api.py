@@ -0,0 +1,251 @@
+import os
+from endpoints.base_api import AsyncBaseAPI
+from endpoints.bulk import DEFAULT_CONCURRENCY, run_bulk_async
+from endpoints.polling import DEFAULT_TIMEOUT, wait_until_async
+from endpoints.streaming import aiter_json_array
+
+
+class AsyncPetAPI(AsyncBaseAPI):
+    """
+    Asynchronous client for interacting with the Pet Store API's /pet endpoint.
+    This class is the `httpx.AsyncClient` based twin of `PetAPI`: it exposes the
+    same methods as coroutines for all HTTP requests related to pet management
+    (create, read, update, delete).
+    """
+
+    def __init__(self, base_url=None, api_key=None, **client_options):
+        """
+        Initializes the AsyncPetAPI client.
+
+        Args:
+            base_url (str, optional): The base URL of the Pet Store API.
+                                      Defaults to "https://petstore.swagger.io/v2"
+                                      if not provided.
+            api_key (str, optional): The key sent when deleting pets. Defaults
+                                     to the API_SPECIAL_KEY environment variable.
+            **client_options: Connection pool and timeout settings forwarded
+                              to `AsyncBaseAPI` (e.g. `timeout`, `max_connections`).
+        """
+        super().__init__(base_url, **client_options)
+        self.api_key = api_key
+        # Construct the specific endpoint URL for pet operations
+        self.pet_endpoint = f"{self.base_url}/pet"
+
+    async def create_pet(self, pet_data):
+        """
+        Sends a POST request to create a new pet in the store.
+
+        Args:
+            pet_data (dict): A dictionary containing the pet's data,
+                             e.g., {"id": 1, "name": "doggie", "status": "available"}.
+
+        Returns:
+            httpx.Response: The response object from the API.
+        """
+        # Define the necessary headers for JSON content
+        headers = {
+            "Content-type": "application/json",  # Specifies that the request body is JSON
+            "accept": "application/json"  # Indicates that the client expects a JSON response
+        }
+        # Send the POST request with the pet data as JSON
+        response = await self._request("POST", self.pet_endpoint, "POST /pet", json=pet_data, headers=headers)
+        self._invalidate(f"{self.pet_endpoint}/{pet_data.get('id')}", f"{self.pet_endpoint}/findByStatus")
+        return response
+
+    async def update_pet(self, pet_data):
+        """
+        Sends a PUT request to update an existing pet's information.
+        The pet is identified by its ID within the `pet_data`.
+
+        Args:
+            pet_data (dict): A dictionary containing the updated pet's data,
+                             e.g., {"id": 1, "name": "updated_doggie", "status": "sold"}.
+
+        Returns:
+            httpx.Response: The response object from the API.
+        """
+        # Define the necessary headers for JSON content
+        headers = {
+            "Content-type": "application/json",
+            "accept": "application/json"
+        }
+        # Send the PUT request with the updated pet data as JSON
+        response = await self._request("PUT", self.pet_endpoint, "PUT /pet", json=pet_data, headers=headers)
+        self._invalidate(f"{self.pet_endpoint}/{pet_data.get('id')}", f"{self.pet_endpoint}/findByStatus")
+        return response
+
+    async def get_pet_by_id(self, pet_id, use_cache=True):
+        """
+        Sends a GET request to retrieve a pet by its unique ID.
+
+        Args:
+            pet_id (int): The ID of the pet to retrieve.
+            use_cache (bool, optional): Serve the response from the client's
+                                        cache, if one is configured.
+
+        Returns:
+            httpx.Response: The response object from the API.
+        """
+        # Construct the URL for fetching a specific pet by ID
+        url = f"{self.pet_endpoint}/{pet_id}"
+        # Send the GET request (possibly served from the cache)
+        response = await self._get(url, "GET /pet/{petId}", use_cache=use_cache)
+        return response
+
+    async def get_pet_by_status(self, status, use_cache=True):
+        """
+        Sends a GET request to find pets by their status.
+
+        Args:
+            status (str): The status of the pet(s) to find (e.g., "available", "pending", "sold").
+                          Can be a comma-separated string for multiple statuses.
+            use_cache (bool, optional): Serve the response from the client's
+                                        cache, if one is configured.
+
+        Returns:
+            httpx.Response: The response object from the API.
+        """
+        # Construct the URL for finding pets by status
+        url = f"{self.pet_endpoint}/findByStatus"
+        # Define headers, although often not strictly required for GET with params, good practice
+        headers = {
+            "Content-type": "application/json",
+            "accept": "application/json"
+        }
+        # Define query parameters
+        params = {"status": status}
+        # Send the GET request with parameters (possibly served from the cache)
+        response = await self._get(url, "GET /pet/findByStatus", params=params, headers=headers, use_cache=use_cache)
+        return response
+
+    async def iter_pets_by_status(self, status):
+        """
+        Streams pets with the given status one at a time as the response body arrives.
+
+        Unlike `get_pet_by_status`, the (potentially huge) JSON array is never
+        buffered or parsed as a whole, so memory stays flat on busy catalogs.
+        Stopping the iteration early closes the response. Responses are never
+        served from the cache.
+
+        Args:
+            status (str): The status of the pet(s) to find (e.g., "available", "pending", "sold").
+                          Can be a comma-separated string for multiple statuses.
+
+        Yields:
+            dict: One pet at a time.
+
+        Raises:
+            httpx.HTTPStatusError: If the API does not answer with a 2xx status.
+        """
+        url = f"{self.pet_endpoint}/findByStatus"
+        headers = {"accept": "application/json"}
+        params = {"status": status}
+        async with self._stream("GET", url, "GET /pet/findByStatus", params=params, headers=headers) as response:
+            if not response.is_success:
+                await response.aread()
+                response.raise_for_status()
+            async for pet in aiter_json_array(response.aiter_bytes()):
+                yield pet
+
+    async def find_pet_by_status(self, status, predicate):
+        """
+        Returns the first pet with the given status that matches `predicate`,
+        stopping the download as soon as it is found.
+
+        Args:
+            status (str): The status of the pet(s) to search.
+            predicate (callable): Takes a pet dict and returns True for a match,
+                                  e.g. `lambda pet: pet.get("id") == pet_id`.
+
+        Returns:
+            dict | None: The first matching pet, or None if no pet matches.
+        """
+        pets = self.iter_pets_by_status(status)
+        try:
+            async for pet in pets:
+                if predicate(pet):
+                    return pet
+        finally:
+            # Close the stream right away instead of when the generator is collected
+            await pets.aclose()
+        return None
+
+    async def wait_for_pet(self, pet_id, condition=None, timeout=DEFAULT_TIMEOUT):
+        """
+        Polls a pet by ID until it reaches the expected state.
+
+        Absorbs the Pet Store's read-after-write lag: the first GET is sent
+        immediately, later ones back off exponentially (with jitter) until
+        `condition` holds or `timeout` seconds pass. The time to converge is
+        recorded in `endpoints.polling.convergence_stats`.
+
+        Args:
+            pet_id (int): The ID of the pet to poll.
+            condition (callable, optional): Takes the `httpx.Response` and returns
+                                            True once converged. Defaults to the
+                                            pet being found (status 200).
+            timeout (float, optional): Overall deadline in seconds.
+
+        Returns:
+            PollResult: The last response (`.value`) and convergence details.
+        """
+        condition = condition or (lambda response: response.status_code == 200)
+        return await wait_until_async(lambda: self.get_pet_by_id(pet_id, use_cache=False), condition, timeout,
+                                      label="GET /pet/{petId}")
+
+    async def delete_pet(self, pet_id):
+        """
+        Sends a DELETE request to remove a pet from the store by its ID.
+        Requires an API key for authentication.
+
+        Args:
+            pet_id (int): The ID of the pet to delete.
+
+        Returns:
+            httpx.Response: The response object from the API.
+
+        Raises:
+            ValueError: If no API key was given and none is found in environment variables.
+        """
+        # Use the client's API key, or retrieve it from environment variables for authentication
+        api_key = self.api_key or os.getenv("API_SPECIAL_KEY")
+        # Ensure the API key is present
+        if not api_key:
+            raise ValueError("API key not found in environment variables!")
+
+        # Construct the URL for deleting a specific pet by ID
+        url = f"{self.pet_endpoint}/{pet_id}"
+        # Define headers, including the API key for authorization
+        headers = {
+            "api_key": api_key
+        }
+        # Send the DELETE request with the API key
+        response = await self._request("DELETE", url, "DELETE /pet/{petId}", headers=headers)
+        self._invalidate(url, f"{self.pet_endpoint}/findByStatus")
+        return response
+
+    def create_pets_bulk(self, pets_data, concurrency=DEFAULT_CONCURRENCY):
+        """
+        Creates many pets concurrently, streaming back each result as it finishes.
+
+        Args:
+            pets_data (iterable[dict]): The pet payloads to create.
+            concurrency (int, optional): Maximum number of requests in flight.
+
+        Returns:
+            AsyncIterator[BulkResult]: A lazy async iterator of per-pet results, including failures.
+        """
+        return run_bulk_async(self.create_pet, pets_data, concurrency)
+
+    def delete_pets_bulk(self, pet_ids, concurrency=DEFAULT_CONCURRENCY):
+        """
+        Deletes many pets concurrently, streaming back each result as it finishes.
+
+        Args:
+            pet_ids (iterable[int]): The IDs of the pets to delete.
+            concurrency (int, optional): Maximum number of requests in flight.
+
+        Returns:
+            AsyncIterator[BulkResult]: A lazy async iterator of per-pet results, including failures.
+        """
+        return run_bulk_async(self.delete_pet, pet_ids, concurrency)
@@ -0,0 +1,155 @@
+from endpoints.base_api import AsyncBaseAPI
+from endpoints.bulk import DEFAULT_CONCURRENCY, run_bulk_async
+from endpoints.polling import DEFAULT_TIMEOUT, wait_until_async
+
+
+class AsyncUserAPI(AsyncBaseAPI):
+    """
+    Asynchronous client for interacting with the Pet Store API's /user endpoint.
+    This class is the `httpx.AsyncClient` based twin of `UserAPI`: it exposes the
+    same methods as coroutines for all HTTP requests related to user management
+    (create, read, update, delete).
+    """
+
+    def __init__(self, base_url=None, **client_options):
+        """
+        Initializes the AsyncUserAPI client.
+
+        Args:
+            base_url (str, optional): The base URL of the Pet Store API.
+                                      Defaults to "https://petstore.swagger.io/v2"
+                                      if not provided.
+            **client_options: Connection pool and timeout settings forwarded
+                              to `AsyncBaseAPI` (e.g. `timeout`, `max_connections`).
+        """
+        super().__init__(base_url, **client_options)
+        # Construct the specific endpoint URL for user operations
+        self.user_endpoint = f"{self.base_url}/user"
+
+    async def create_user(self, user_data):
+        """
+        Sends a POST request to create a new user.
+
+        Args:
+            user_data (dict): A dictionary containing the user's data,
+                              e.g., {"id": 1, "username": "johndoe", "email": "john@example.com"}.
+
+        Returns:
+            httpx.Response: The response object from the API.
+        """
+        # Define the necessary headers for JSON content
+        headers = {
+            "Content-type": "application/json",  # Specifies that the request body is JSON
+            "accept": "application/json"         # Indicates that the client expects a JSON response
+        }
+        # Send the POST request with the user data as JSON
+        response = await self._request("POST", self.user_endpoint, "POST /user", json=user_data, headers=headers)
+        self._invalidate(f"{self.user_endpoint}/{user_data.get('username')}")
+        return response
+
+    async def update_user_by_username(self, username, updated_user_data):
+        """
+        Sends a PUT request to update an existing user by their username.
+
+        Args:
+            username (str): The username of the user to update.
+            updated_user_data (dict): A dictionary with the updated user data.
+
+        Returns:
+            httpx.Response: The response object from the API.
+        """
+        # Define the necessary headers for JSON content
+        headers = {
+            "Content-type": "application/json",
+            "accept": "application/json"
+        }
+        # Construct the URL for updating a specific user by username
+        url = f"{self.user_endpoint}/{username}"
+        # Send the PUT request with the updated user data as JSON
+        response = await self._request("PUT", url, "PUT /user/{username}", json=updated_user_data, headers=headers)
+        self._invalidate(url, f"{self.user_endpoint}/{updated_user_data.get('username', username)}")
+        return response
+
+    async def get_user_by_username(self, username, use_cache=True):
+        """
+        Sends a GET request to retrieve a user by their username.
+
+        Args:
+            username (str): The username of the user to retrieve.
+            use_cache (bool, optional): Serve the response from the client's
+                                        cache, if one is configured.
+
+        Returns:
+            httpx.Response: The response object from the API.
+        """
+        # Construct the URL for fetching a specific user by username
+        url = f"{self.user_endpoint}/{username}"
+        # Send the GET request (possibly served from the cache)
+        response = await self._get(url, "GET /user/{username}", use_cache=use_cache)
+        return response
+
+    async def wait_for_user(self, username, condition=None, timeout=DEFAULT_TIMEOUT):
+        """
+        Polls a user by username until it reaches the expected state.
+
+        Absorbs the Pet Store's read-after-write lag: the first GET is sent
+        immediately, later ones back off exponentially (with jitter) until
+        `condition` holds or `timeout` seconds pass. The time to converge is
+        recorded in `endpoints.polling.convergence_stats`.
+
+        Args:
+            username (str): The username of the user to poll.
+            condition (callable, optional): Takes the `httpx.Response` and returns
+                                            True once converged. Defaults to the
+                                            user being found (status 200).
+            timeout (float, optional): Overall deadline in seconds.
+
+        Returns:
+            PollResult: The last response (`.value`) and convergence details.
+        """
+        condition = condition or (lambda response: response.status_code == 200)
+        return await wait_until_async(lambda: self.get_user_by_username(username, use_cache=False), condition, timeout,
+                                      label="GET /user/{username}")
+
+    async def delete_user(self, username):
+        """
+        Sends a DELETE request to remove a user by their username.
+
+        Args:
+            username (str): The username of the user to delete.
+
+        Returns:
+            httpx.Response: The response object from the API.
+        """
+        # Construct the URL for deleting a specific user by username
+        url = f"{self.user_endpoint}/{username}"
+        # Send the DELETE request
+        response = await self._request("DELETE", url, "DELETE /user/{username}")
+        self._invalidate(url)
+        return response
+
+    def create_users_bulk(self, users_data, concurrency=DEFAULT_CONCURRENCY):
+        """
+        Creates many users concurrently, streaming back each result as it finishes.
+
+        Args:
+            users_data (iterable[dict]): The user payloads to create.
+            concurrency (int, optional): Maximum number of requests in flight.
+
+        Returns:
+            AsyncIterator[BulkResult]: A lazy async iterator of per-user results, including failures.
+        """
+        return run_bulk_async(self.create_user, users_data, concurrency)
+
+    def delete_users_bulk(self, usernames, concurrency=DEFAULT_CONCURRENCY):
+        """
+        Deletes many users concurrently, streaming back each result as it finishes.
+
+        Args:
+            usernames (iterable[str]): The usernames of the users to delete.
+            concurrency (int, optional): Maximum number of requests in flight.
+
+        Returns:
+            AsyncIterator[BulkResult]: A lazy async iterator of per-user results, including failures.
+        """
+        return run_bulk_async(self.delete_user, usernames, concurrency)
@@ -0,0 +1,392 @@
+import importlib.util
+import inspect
+import warnings
+from contextlib import asynccontextmanager, contextmanager
+
+import httpx
+
+from endpoints.metrics import RequestSample, RequestTimer
+
+# Default Pet Store API location used when no base URL is configured
+DEFAULT_BASE_URL = "https://petstore.swagger.io/v2"
+
+
+class BaseAPI:
+    """
+    A base class for all API clients.
+
+    It owns a single long-lived `httpx.Client`, so every request made by a
+    client instance reuses pooled keep-alive connections instead of opening
+    (and tearing down) a new TCP+TLS connection per call. Pool limits and
+    timeouts are configurable per instance. Call `close()` (or use the client
+    as a context manager) to release the pooled connections.
+    """
+
+    def __init__(self, base_url=None, timeout=10.0, max_connections=20,
+                 max_keepalive_connections=10, keepalive_expiry=30.0, transport=None, cache=None,
+                 hooks=None, http2=False, request_hooks=None):
+        """
+        Initializes the API client and its connection pool.
+
+        Args:
+            base_url (str, optional): The base URL of the Pet Store API.
+                                      Defaults to "https://petstore.swagger.io/v2"
+                                      if not provided.
+            timeout (float, optional): Timeout in seconds applied to connect,
+                                       read, write and pool acquisition.
+            max_connections (int, optional): Maximum number of concurrent
+                                             connections in the pool.
+            max_keepalive_connections (int, optional): Maximum number of idle
+                                                       connections kept alive.
+            keepalive_expiry (float, optional): Seconds an idle connection is
+                                                kept before being closed.
+            transport (httpx.BaseTransport, optional): A custom transport, e.g.
+                                                       `PetstoreStubTransport` to
+                                                       serve requests in-process.
+            cache (ResponseCache, optional): Cache for idempotent GET responses.
+                                             Disabled when not provided.
+            hooks (list[callable], optional): Called with a `RequestSample`
+                                              (route, status, bytes, timings)
+                                              after every request, e.g. a
+                                              `LatencyRecorder`.
+            request_hooks (list[callable], optional): Called with the route before
+                                                      every request is sent, e.g. to
+                                                      pace requests with a `Pacer`.
+                                                      Their time is not counted in
+                                                      the request's latency.
+            http2 (bool | str, optional): Opt in to HTTP/2, multiplexing concurrent
+                                          requests over one connection. True
+                                          negotiates it via TLS ALPN and falls
+                                          back to HTTP/1.1 if the server (or a
+                                          missing `h2` package) can't do HTTP/2;
+                                          "h2c" speaks cleartext HTTP/2 with
+                                          prior knowledge, for local servers.
+        """
+        # Set the base URL for API requests, defaulting if not provided
+        self.base_url = base_url or DEFAULT_BASE_URL
+        self.timeout = httpx.Timeout(timeout)
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        # One persistent client per API object: connections are pooled and reused
+        self.client = httpx.Client(timeout=self.timeout, limits=self.limits, transport=transport,
+                                   **_http_versions(http2))
+        self.cache = cache
+        self.hooks = list(hooks or [])
+        self.request_hooks = list(request_hooks or [])
+
+    def _request(self, method, url, route, **kwargs):
+        """
+        Sends a request through the shared client and reports it to the hooks.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The request URL.
+            route (str): The route template used to group metrics, e.g. "GET /pet/{petId}".
+            **kwargs: Forwarded to `httpx.Client.build_request` (json, params, headers, ...).
+
+        Returns:
+            httpx.Response: The response object from the API.
+        """
+        self._before_request(route)
+        if not self.hooks:
+            return self.client.request(method, url, **kwargs)
+        timer = RequestTimer()
+        request = self.client.build_request(method, url, extensions={"trace": timer.trace}, **kwargs)
+        try:
+            response = self.client.send(request)
+        except Exception as error:
+            self._notify(_sample(route, request, None, timer, error))
+            raise
+        self._notify(_sample(route, request, response, timer))
+        return response
+
+    @contextmanager
+    def _stream(self, method, url, route, **kwargs):
+        """
+        Sends a request whose response body is streamed rather than read upfront.
+        The hooks are notified once the response is closed.
+
+        Yields:
+            httpx.Response: The open response; iterate it with `iter_bytes()`.
+        """
+        self._before_request(route)
+        timer = RequestTimer()
+        extensions = {"trace": timer.trace} if self.hooks else {}
+        request = self.client.build_request(method, url, extensions=extensions, **kwargs)
+        response, error = None, None
+        try:
+            response = self.client.send(request, stream=True)
+            yield response
+        except Exception as exc:
+            error = exc
+            raise
+        finally:
+            if response is not None:
+                response.close()
+            if self.hooks:
+                self._notify(_sample(route, request, response, timer, error))
+
+    def _before_request(self, route):
+        for hook in self.request_hooks:
+            hook(route)
+
+    def _notify(self, sample):
+        for hook in self.hooks:
+            hook(sample)
+
+    def _get(self, url, route, params=None, headers=None, use_cache=True):
+        """
+        Sends a GET request, serving it from the response cache when possible.
+        Only successful responses are cached.
+
+        Args:
+            url (str): The request URL.
+            route (str): The route template used to group metrics.
+            params (dict, optional): Query parameters.
+            headers (dict, optional): Request headers.
+            use_cache (bool, optional): Set to False to always hit the API.
+
+        Returns:
+            httpx.Response: The response object from the API (or the cache).
+        """
+        key = None
+        if self.cache is not None and use_cache:
+            key = self.cache.key(url, params)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        response = self._request("GET", url, route, params=params, headers=headers)
+        if key is not None and response.is_success:
+            self.cache.put(key, response)
+        return response
+
+    def _invalidate(self, *urls):
+        """
+        Drops cached GET responses for the given URLs after a write.
+        """
+        if self.cache is not None:
+            for url in urls:
+                self.cache.invalidate(url)
+
+    def close(self):
+        """
+        Closes the underlying HTTP client and all pooled connections.
+        """
+        self.client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class AsyncBaseAPI:
+    """
+    A base class for all asynchronous API clients.
+
+    The asynchronous counterpart of `BaseAPI`: it owns a single long-lived
+    `httpx.AsyncClient` with the same pool limits and timeouts, so many
+    requests can be awaited concurrently on one event loop. Call `aclose()`
+    (or use the client as an async context manager) to release the pooled
+    connections.
+    """
+
+    def __init__(self, base_url=None, timeout=10.0, max_connections=20,
+                 max_keepalive_connections=10, keepalive_expiry=30.0, transport=None, cache=None,
+                 hooks=None, http2=False, request_hooks=None):
+        """
+        Initializes the asynchronous API client and its connection pool.
+
+        Args:
+            base_url (str, optional): The base URL of the Pet Store API.
+                                      Defaults to "https://petstore.swagger.io/v2"
+                                      if not provided.
+            timeout (float, optional): Timeout in seconds applied to connect,
+                                       read, write and pool acquisition.
+            max_connections (int, optional): Maximum number of concurrent
+                                             connections in the pool.
+            max_keepalive_connections (int, optional): Maximum number of idle
+                                                       connections kept alive.
+            keepalive_expiry (float, optional): Seconds an idle connection is
+                                                kept before being closed.
+            transport (httpx.AsyncBaseTransport, optional): A custom transport,
+                                                            e.g. `PetstoreStubTransport`
+                                                            to serve requests in-process.
+            cache (ResponseCache, optional): Cache for idempotent GET responses.
+                                             Disabled when not provided.
+            hooks (list[callable], optional): Called with a `RequestSample`
+                                              (route, status, bytes, timings)
+                                              after every request, e.g. a
+                                              `LatencyRecorder`.
+            request_hooks (list[callable], optional): Called with the route before
+                                                      every request is sent, like
+                                                      `BaseAPI`'s; a hook may also
+                                                      return an awaitable.
+            http2 (bool | str, optional): Opt in to HTTP/2, multiplexing concurrent
+                                          requests over one connection. True
+                                          negotiates it via TLS ALPN and falls
+                                          back to HTTP/1.1 if the server (or a
+                                          missing `h2` package) can't do HTTP/2;
+                                          "h2c" speaks cleartext HTTP/2 with
+                                          prior knowledge, for local servers.
+        """
+        # Set the base URL for API requests, defaulting if not provided
+        self.base_url = base_url or DEFAULT_BASE_URL
+        self.timeout = httpx.Timeout(timeout)
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        # One persistent async client per API object, shared by all coroutines
+        self.client = httpx.AsyncClient(timeout=self.timeout, limits=self.limits, transport=transport,
+                                        **_http_versions(http2))
+        self.cache = cache
+        self.hooks = list(hooks or [])
+        self.request_hooks = list(request_hooks or [])
+
+    async def _request(self, method, url, route, **kwargs):
+        """
+        Sends a request through the shared client and reports it to the hooks.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The request URL.
+            route (str): The route template used to group metrics, e.g. "GET /pet/{petId}".
+            **kwargs: Forwarded to `httpx.AsyncClient.build_request` (json, params, headers, ...).
+
+        Returns:
+            httpx.Response: The response object from the API.
+        """
+        await self._before_request(route)
+        if not self.hooks:
+            return await self.client.request(method, url, **kwargs)
+        timer = RequestTimer()
+        request = self.client.build_request(method, url, extensions={"trace": timer.atrace}, **kwargs)
+        try:
+            response = await self.client.send(request)
+        except Exception as error:
+            self._notify(_sample(route, request, None, timer, error))
+            raise
+        self._notify(_sample(route, request, response, timer))
+        return response
+
+    @asynccontextmanager
+    async def _stream(self, method, url, route, **kwargs):
+        """
+        Sends a request whose response body is streamed rather than read upfront.
+        The hooks are notified once the response is closed.
+
+        Yields:
+            httpx.Response: The open response; iterate it with `aiter_bytes()`.
+        """
+        await self._before_request(route)
+        timer = RequestTimer()
+        extensions = {"trace": timer.atrace} if self.hooks else {}
+        request = self.client.build_request(method, url, extensions=extensions, **kwargs)
+        response, error = None, None
+        try:
+            response = await self.client.send(request, stream=True)
+            yield response
+        except Exception as exc:
+            error = exc
+            raise
+        finally:
+            if response is not None:
+                await response.aclose()
+            if self.hooks:
+                self._notify(_sample(route, request, response, timer, error))
+
+    async def _before_request(self, route):
+        for hook in self.request_hooks:
+            result = hook(route)
+            if inspect.isawaitable(result):
+                await result
+
+    def _notify(self, sample):
+        for hook in self.hooks:
+            hook(sample)
+
+    async def _get(self, url, route, params=None, headers=None, use_cache=True):
+        """
+        Sends a GET request, serving it from the response cache when possible.
+        Only successful responses are cached.
+
+        Args:
+            url (str): The request URL.
+            route (str): The route template used to group metrics.
+            params (dict, optional): Query parameters.
+            headers (dict, optional): Request headers.
+            use_cache (bool, optional): Set to False to always hit the API.
+
+        Returns:
+            httpx.Response: The response object from the API (or the cache).
+        """
+        key = None
+        if self.cache is not None and use_cache:
+            key = self.cache.key(url, params)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        response = await self._request("GET", url, route, params=params, headers=headers)
+        if key is not None and response.is_success:
+            self.cache.put(key, response)
+        return response
+
+    def _invalidate(self, *urls):
+        """
+        Drops cached GET responses for the given URLs after a write.
+        """
+        if self.cache is not None:
+            for url in urls:
+                self.cache.invalidate(url)
+
+    async def aclose(self):
+        """
+        Closes the underlying asynchronous HTTP client and all pooled connections.
+        """
+        await self.client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+
+def _http_versions(http2):
+    """
+    Translates the `http2` client option into httpx's `http1`/`http2` flags.
+    """
+    if http2 not in (False, True, "h2c"):
+        raise ValueError(f"http2 must be True, False or 'h2c', not {http2!r}")
+    if not http2:
+        return {"http1": True, "http2": False}
+    if importlib.util.find_spec("h2") is None:
+        warnings.warn("HTTP/2 requested but the 'h2' package is not installed "
+                      "(install 'httpx[http2]'); falling back to HTTP/1.1", RuntimeWarning, stacklevel=3)
+        return {"http1": True, "http2": False}
+    # Without HTTP/1.1 enabled, httpx uses HTTP/2 prior knowledge on cleartext connections
+    return {"http1": http2 != "h2c", "http2": True}
+
+
+def _sample(route, request, response, timer, error=None):
+    """
+    Builds the `RequestSample` passed to the client hooks.
+    """
+    return RequestSample(
+        method=request.method,
+        route=route,
+        url=str(request.url),
+        status=response.status_code if response is not None else None,
+        request_bytes=int(request.headers.get("content-length", 0)),
+        # In-process transports hand over pre-read bodies, which httpx does not count
+        response_bytes=(response.num_bytes_downloaded or int(response.headers.get("content-length", 0))
+                        if response is not None else 0),
+        timings=timer.timings(),
+        error=error,
+    )
@@ -0,0 +1,124 @@
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+# Default number of requests kept in flight by the bulk helpers
+DEFAULT_CONCURRENCY = 10
+
+
+@dataclass
+class BulkResult:
+    """
+    The outcome of a single item of a bulk operation.
+
+    Attributes:
+        item: The payload (or identifier) the operation was called with.
+        response (httpx.Response | None): The API response, if one was received.
+        error (Exception | None): The exception raised by the call, if any.
+    """
+    item: Any
+    response: httpx.Response | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self):
+        """
+        bool: True if the call completed without an exception and returned a 2xx status.
+        """
+        return self.error is None and self.response is not None and self.response.is_success
+
+
+def run_bulk(operation, items, concurrency=DEFAULT_CONCURRENCY):
+    """
+    Calls `operation` for every item using a bounded pool of worker threads.
+
+    At most `concurrency` calls are in flight at any time and items are pulled
+    from the iterable lazily, so arbitrarily large inputs can be streamed.
+    Results are yielded in completion order, not input order. Exceptions are
+    captured in the yielded `BulkResult` instead of aborting the whole batch.
+
+    Args:
+        operation (callable): A function taking one item and returning an `httpx.Response`.
+        items (iterable): The payloads or identifiers to process.
+        concurrency (int, optional): Maximum number of concurrent calls.
+
+    Yields:
+        BulkResult: One result per item, as soon as its call finishes.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    items = iter(items)
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        in_flight = {}
+
+        def submit_next():
+            # Returns False once the input iterable is exhausted
+            for item in items:
+                in_flight[executor.submit(operation, item)] = item
+                return True
+            return False
+
+        # Fill the window, then top it up each time a call finishes
+        while len(in_flight) < concurrency and submit_next():
+            pass
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                item = in_flight.pop(future)
+                try:
+                    yield BulkResult(item, response=future.result())
+                except Exception as error:
+                    yield BulkResult(item, error=error)
+                submit_next()
+
+
+async def run_bulk_async(operation, items, concurrency=DEFAULT_CONCURRENCY):
+    """
+    Awaits `operation` for every item with at most `concurrency` calls in flight.
+
+    The asynchronous counterpart of `run_bulk`: results are yielded in
+    completion order and exceptions are captured in the yielded `BulkResult`.
+
+    Args:
+        operation (callable): A coroutine function taking one item and returning an `httpx.Response`.
+        items (iterable): The payloads or identifiers to process.
+        concurrency (int, optional): Maximum number of concurrent calls.
+
+    Yields:
+        BulkResult: One result per item, as soon as its call finishes.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    items = iter(items)
+    in_flight = {}
+
+    def submit_next():
+        # Returns False once the input iterable is exhausted
+        for item in items:
+            in_flight[asyncio.ensure_future(operation(item))] = item
+            return True
+        return False
+
+    try:
+        while len(in_flight) < concurrency and submit_next():
+            pass
+        while in_flight:
+            done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                item = in_flight.pop(task)
+                try:
+                    yield BulkResult(item, response=task.result())
+                except Exception as error:
+                    yield BulkResult(item, error=error)
+                submit_next()
+    finally:
+        # Cancel outstanding calls if the consumer stops iterating early, and
+        # wait for them to unwind so none is left running (or unretrieved)
+        for task in in_flight:
+            task.cancel()
+        await asyncio.gather(*in_flight, return_exceptions=True)
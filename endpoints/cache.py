@@ -0,0 +1,106 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class ResponseCache:
+    """
+    A thread-safe TTL + LRU cache for idempotent GET responses.
+
+    Entries are keyed by URL and query parameters. They expire `ttl` seconds
+    after being stored, and the least recently used entry is evicted once
+    `max_entries` is reached. Write operations on the API clients call
+    `invalidate()` for every URL they affect, so tests never read their own
+    stale data from the cache. Hit and miss counters are kept for reporting.
+    """
+
+    def __init__(self, ttl=5.0, max_entries=256):
+        """
+        Args:
+            ttl (float, optional): Seconds a cached response stays valid.
+            max_entries (int, optional): Maximum number of cached responses.
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def key(url, params=None):
+        """
+        Builds the cache key for a GET request.
+
+        Args:
+            url (str): The request URL.
+            params (dict, optional): The query parameters.
+
+        Returns:
+            tuple: A hashable key independent of parameter order.
+        """
+        return str(url), tuple(sorted((params or {}).items()))
+
+    def get(self, key):
+        """
+        Returns the cached response for `key`, or None if absent or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key, response):
+        """
+        Stores a response under `key`, evicting the least recently used entry if full.
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, url):
+        """
+        Drops every cached response for `url`, whatever its query parameters.
+        """
+        url = str(url)
+        with self._lock:
+            stale = [key for key in self._entries if key[0] == url]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+
+    def clear(self):
+        """
+        Drops all cached responses; counters are kept.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """
+        Returns the cache counters.
+
+        Returns:
+            dict: hits, misses, hit_rate, evictions, invalidations and current size.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "size": len(self._entries),
+            }
@@ -0,0 +1,141 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
+
+from endpoints.bulk import DEFAULT_CONCURRENCY
+from endpoints.polling import backoff_delays
+
+# Attempts per deletion before it is reported as failed
+DEFAULT_ATTEMPTS = 4
+
+
+@dataclass
+class CleanupFailure:
+    """
+    A deletion that still failed after all attempts.
+
+    Attributes:
+        description (str): What was being deleted, e.g. "pet 123456700000001".
+        attempts (int): How many times the deletion was tried.
+        status (int | None): The last response status, if a response was received.
+        error (str | None): The last exception, if the call raised.
+    """
+    description: str
+    attempts: int
+    status: int | None = None
+    error: str | None = None
+
+
+class CleanupQueue:
+    """
+    Deletes test data in the background instead of on each test's critical path.
+
+    `defer()` hands a deletion to a small thread pool and returns at once; the
+    pool works through deletions concurrently while later tests run. Failed
+    deletions (exceptions or non-2xx responses, e.g. a 404 caused by the
+    Petstore's read-after-write lag) are retried with jittered exponential
+    backoff. `drain()` waits for everything still queued, and `failures` lists
+    what could not be cleaned up. `run_now()` performs a deletion synchronously
+    for tests that need it gone before they finish.
+    """
+
+    def __init__(self, concurrency=DEFAULT_CONCURRENCY, attempts=DEFAULT_ATTEMPTS, initial_delay=0.25,
+                 max_delay=2.0):
+        """
+        Args:
+            concurrency (int, optional): Maximum number of deletions in flight.
+            attempts (int, optional): Tries per deletion before giving up.
+            initial_delay (float, optional): First retry delay in seconds.
+            max_delay (float, optional): Upper bound of the retry delay in seconds.
+        """
+        self.attempts = attempts
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.failures = []
+        self.deleted = 0
+        self.retried = 0
+        self._executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="cleanup")
+        self._pending = set()
+        self._lock = threading.Lock()
+
+    def defer(self, description, operation, *args):
+        """
+        Queues `operation(*args)` (returning an `httpx.Response`) to run in the background.
+
+        Args:
+            description (str): What is being deleted, used in the failure report.
+            operation (callable): The deletion, e.g. `pet_api_client.delete_pet`.
+            *args: Arguments for the deletion, e.g. the pet ID.
+        """
+        future = self._executor.submit(self._run, description, operation, args)
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._done)
+
+    def run_now(self, description, operation, *args):
+        """
+        Performs a deletion synchronously, with the same retries.
+
+        Raises:
+            RuntimeError: If the deletion still failed after all attempts.
+        """
+        failure = self._run(description, operation, args)
+        if failure is not None:
+            raise RuntimeError(f"Could not clean up {description}: {failure.error or f'status {failure.status}'}")
+
+    def drain(self, timeout=None):
+        """
+        Waits until every queued deletion has finished.
+
+        Args:
+            timeout (float, optional): Maximum seconds to wait.
+
+        Returns:
+            list[CleanupFailure]: Everything that could not be cleaned up so far.
+        """
+        with self._lock:
+            pending = set(self._pending)
+        wait(pending, timeout=timeout)
+        return list(self.failures)
+
+    def close(self, timeout=None):
+        """
+        Drains the queue and stops its threads.
+        """
+        failures = self.drain(timeout)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        return failures
+
+    def stats(self):
+        """
+        Returns the number of deleted, retried, failed and still pending deletions.
+        """
+        with self._lock:
+            return {"deleted": self.deleted, "retried": self.retried, "failed": len(self.failures),
+                    "pending": len(self._pending)}
+
+    def _done(self, future):
+        with self._lock:
+            self._pending.discard(future)
+
+    def _run(self, description, operation, args):
+        delays = backoff_delays(self.initial_delay, self.max_delay)
+        status, error = None, None
+        for attempt in range(1, self.attempts + 1):
+            try:
+                response = operation(*args)
+                status, error = response.status_code, None
+                if response.is_success:
+                    with self._lock:
+                        self.deleted += 1
+                        self.retried += attempt > 1
+                    return None
+            except Exception as exc:
+                status, error = None, f"{type(exc).__name__}: {exc}"
+            if attempt < self.attempts:
+                time.sleep(next(delays))
+        failure = CleanupFailure(description=description, attempts=self.attempts, status=status, error=error)
+        with self._lock:
+            self.failures.append(failure)
+        return failure
@@ -0,0 +1,123 @@
+import argparse
+import asyncio
+import time
+from dataclasses import dataclass
+
+from endpoints.async_pet_api import AsyncPetAPI
+from endpoints.bulk import run_bulk, run_bulk_async
+from endpoints.metrics import LatencyRecorder
+from endpoints.pet_api import PetAPI
+from endpoints.petstore_stub import PetstoreStub, PetstoreStubH2Server, PetstoreStubServer
+
+# (label, server class, http2 client option, use one connection per concurrent request)
+CASES = [
+    ("HTTP/1.1, 1 connection", PetstoreStubServer, False, False),
+    ("HTTP/1.1, pooled connections", PetstoreStubServer, False, True),
+    ("HTTP/2, 1 connection", PetstoreStubH2Server, "h2c", False),
+]
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    The outcome of one benchmark case.
+
+    Attributes:
+        label (str): The protocol and connection setup that was measured.
+        requests (int): Requests completed successfully.
+        failures (int): Requests that raised or did not return 200.
+        elapsed (float): Wall-clock seconds for all requests.
+        connections (int): TCP connections the client opened.
+        p50 (float): Median request latency in milliseconds.
+        p99 (float): 99th percentile request latency in milliseconds.
+    """
+    label: str
+    requests: int
+    failures: int
+    elapsed: float
+    connections: int
+    p50: float
+    p99: float
+
+    @property
+    def throughput(self):
+        return self.requests / self.elapsed if self.elapsed else 0.0
+
+
+def run_case(label, server_class, http2, pooled, requests=500, concurrency=50, latency=0.02, use_async=False):
+    """
+    Sends `requests` GET /pet/{petId} calls with `concurrency` in flight against a local stand-in.
+
+    Args:
+        label (str): Name of the case in the report.
+        server_class (type): `PetstoreStubServer` (HTTP/1.1) or `PetstoreStubH2Server` (h2c).
+        http2 (bool | str): The client's `http2` option.
+        pooled (bool): Allow one connection per concurrent request instead of a single one.
+        requests (int, optional): Number of requests to send.
+        concurrency (int, optional): Number of requests in flight at a time.
+        latency (float, optional): Server-side delay per response in seconds.
+        use_async (bool, optional): Use `AsyncPetAPI` on one event loop instead of threads.
+
+    Returns:
+        BenchmarkResult: Throughput, latency and connection count of the case.
+    """
+    recorder = LatencyRecorder()
+    connections = concurrency if pooled else 1
+    client_options = {"http2": http2, "max_connections": connections,
+                      "max_keepalive_connections": connections, "hooks": [recorder], "timeout": 30.0}
+    with server_class(PetstoreStub(latency=latency)) as server:
+        if use_async:
+            results, elapsed = asyncio.run(_run_async(server.base_url, client_options, requests, concurrency))
+        else:
+            with PetAPI(server.base_url, **client_options) as client:
+                client.create_pet({"id": 1, "name": "BenchPet", "status": "available"})
+                started = time.perf_counter()
+                results = list(run_bulk(lambda _: client.get_pet_by_id(1), range(requests), concurrency))
+                elapsed = time.perf_counter() - started
+
+    route = recorder.summary()["GET /pet/{petId}"]
+    connects = sum(stats["phases"].get("connect", {}).get("count", 0) for stats in recorder.summary().values())
+    failures = sum(1 for result in results if not result.ok or result.response.status_code != 200)
+    return BenchmarkResult(label=label, requests=len(results) - failures, failures=failures, elapsed=elapsed,
+                           connections=connects, p50=route["phases"]["total"]["p50"],
+                           p99=route["phases"]["total"]["p99"])
+
+
+async def _run_async(base_url, client_options, requests, concurrency):
+    async with AsyncPetAPI(base_url, **client_options) as client:
+        await client.create_pet({"id": 1, "name": "BenchPet", "status": "available"})
+        started = time.perf_counter()
+        results = [result async for result in run_bulk_async(lambda _: client.get_pet_by_id(1),
+                                                              range(requests), concurrency)]
+        return results, time.perf_counter() - started
+
+
+def main():
+    """
+    Compares HTTP/1.1 and HTTP/2 throughput against local stand-ins, e.g.
+    `python -m endpoints.http2_benchmark --requests 1000 --concurrency 100 --latency 0.02 --async`.
+
+    Note that the two protocols are served by different local servers (a
+    threaded HTTP/1.1 server and an asyncio h2c server), so only large
+    differences are meaningful.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark HTTP/1.1 against multiplexed HTTP/2.")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.02, help="Server-side delay per response in seconds.")
+    parser.add_argument("--async", dest="use_async", action="store_true",
+                        help="Use the async client instead of a thread pool.")
+    args = parser.parse_args()
+
+    print(f"{args.requests} requests, {args.concurrency} in flight, {args.latency * 1000:g} ms server latency, "
+          f"{'async' if args.use_async else 'threaded'} client")
+    print(f"{'case':<30} {'req/s':>9} {'conns':>6} {'p50 ms':>8} {'p99 ms':>8} {'failed':>7}")
+    for label, server_class, http2, pooled in CASES:
+        result = run_case(label, server_class, http2, pooled, requests=args.requests,
+                          concurrency=args.concurrency, latency=args.latency, use_async=args.use_async)
+        print(f"{result.label:<30} {result.throughput:>9.1f} {result.connections:>6} "
+              f"{result.p50:>8.1f} {result.p99:>8.1f} {result.failures:>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+import hashlib
+import itertools
+import threading
+
+# Decimal layout of an allocated ID: RRRRRRR WWW SSSSS (run, worker, sequence).
+# 15 digits stay below 2**53, so IDs survive any JSON consumer unchanged.
+RUN_MIN, RUN_MAX = 1_000_000, 9_999_999
+WORKER_SPACE = 1_000
+SEQUENCE_SPACE = 100_000
+
+
+class IdAllocator:
+    """
+    Hands out entity IDs and usernames that never collide between the workers
+    of a run and are traceable to the run that created them.
+
+    Each run seed maps to a 7-digit run number, and every worker owns its own
+    block of 100,000 IDs within it, so parallel workers never share an ID and
+    the same seed reproduces the same IDs. Leftover entities on a shared
+    backend can be traced back with `describe()`.
+    """
+
+    def __init__(self, seed, worker=0, prefix="qa"):
+        """
+        Args:
+            seed (str | int): The run seed; all workers of one run must use the same seed.
+            worker (int, optional): The worker index (0 for "gw0" or a non-distributed run).
+            prefix (str, optional): Prefix of generated usernames.
+        """
+        if not 0 <= worker < WORKER_SPACE:
+            raise ValueError(f"worker must be in [0, {WORKER_SPACE})")
+        self.seed = str(seed)
+        self.worker = worker
+        self.prefix = prefix
+        self.run = run_number(self.seed)
+        self._sequence = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def next_id(self):
+        """
+        Returns the next unused ID of this worker's block.
+
+        Raises:
+            RuntimeError: Once the worker's block of 99,999 IDs is used up.
+        """
+        with self._lock:
+            sequence = next(self._sequence)
+        if sequence >= SEQUENCE_SPACE:
+            raise RuntimeError(f"Worker {self.worker} used up its {SEQUENCE_SPACE - 1} IDs for run {self.run}")
+        return (self.run * WORKER_SPACE + self.worker) * SEQUENCE_SPACE + sequence
+
+    def next_ids(self, count):
+        """
+        Returns a list of `count` unused IDs.
+        """
+        return [self.next_id() for _ in range(count)]
+
+    def username(self, entity_id, label="user"):
+        """
+        Builds the prefixed username for an allocated ID, e.g. "qa_user_123456700300042".
+        """
+        return f"{self.prefix}_{label}_{entity_id}"
+
+    @staticmethod
+    def describe(entity_id):
+        """
+        Decodes an allocated ID (or a username ending in one).
+
+        Returns:
+            dict | None: {"run", "worker", "sequence"}, or None if the value was not allocated here.
+        """
+        digits = str(entity_id).rsplit("_", 1)[-1]
+        if not digits.isdigit():
+            return None
+        entity_id = int(digits)
+        run, rest = divmod(entity_id, WORKER_SPACE * SEQUENCE_SPACE)
+        if not RUN_MIN <= run <= RUN_MAX:
+            return None
+        worker, sequence = divmod(rest, SEQUENCE_SPACE)
+        return {"run": run, "worker": worker, "sequence": sequence}
+
+
+def run_number(seed):
+    """
+    Maps a run seed to its 7-digit run number.
+    """
+    digest = int.from_bytes(hashlib.sha256(str(seed).encode()).digest()[:8], "big")
+    return RUN_MIN + digest % (RUN_MAX - RUN_MIN + 1)
+
+
+def worker_index(worker_id):
+    """
+    Converts an xdist worker name ("gw3") to its index; any other name maps to 0.
+    """
+    return int(worker_id[2:]) if worker_id.startswith("gw") and worker_id[2:].isdigit() else 0
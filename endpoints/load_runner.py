@@ -0,0 +1,361 @@
+import argparse
+import itertools
+import json
+import math
+import os
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from endpoints.metrics import LatencyRecorder
+from endpoints.pet_api import PetAPI
+from endpoints.petstore_stub import STUB_API_KEY, STUB_BASE_URL, PetstoreStub, PetstoreStubTransport
+from endpoints.user_api import UserAPI
+
+
+class VirtualUser:
+    """
+    The context handed to a scenario on every iteration.
+
+    Attributes:
+        pet_api (PetAPI): The shared, pooled Pet client.
+        user_api (UserAPI): The shared, pooled User client.
+        vu_id (int): The index of this virtual user (0-based).
+        iteration (int): The number of iterations this virtual user has started.
+    """
+
+    def __init__(self, pet_api, user_api, vu_id, id_source):
+        self.pet_api = pet_api
+        self.user_api = user_api
+        self.vu_id = vu_id
+        self.iteration = 0
+        self._id_source = id_source
+
+    def next_id(self):
+        """
+        Returns an entity ID that is unique across all virtual users of the run.
+        """
+        return next(self._id_source)
+
+
+class Pacer:
+    """
+    Schedules HTTP request starts for an open workload model.
+
+    The request rate ramps up linearly from 0 to `target_rps` over `ramp_up`
+    seconds and then stays constant. Request n is due at the time t where
+    the integral of the rate reaches n, so the schedule does not drift when
+    individual requests are slow. One pacer is shared by all virtual users,
+    which call `acquire()` before every request they send.
+    """
+
+    def __init__(self, target_rps, ramp_up, start):
+        self.target_rps = target_rps
+        self.ramp_up = ramp_up
+        self.start = start
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def due_at(self, n):
+        """
+        Returns the offset in seconds from the start at which request `n` is due.
+        """
+        ramp_requests = self.target_rps * self.ramp_up / 2
+        if n < ramp_requests:
+            return math.sqrt(2 * n * self.ramp_up / self.target_rps)
+        return self.ramp_up + (n - ramp_requests) / self.target_rps
+
+    def acquire(self):
+        """
+        Blocks until the next request is due.
+        """
+        with self._lock:
+            due = self.start + self.due_at(self._next)
+            self._next += 1
+        delay = due - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+
+@dataclass
+class LoadReport:
+    """
+    The aggregated outcome of a load run.
+
+    Attributes:
+        duration (float): Wall-clock seconds the run took.
+        users (int): Number of concurrent virtual users.
+        target_rps (float | None): Requested HTTP requests per second (None for a closed model).
+        iterations (int): Scenario iterations completed.
+        failed_iterations (int): Iterations that raised (including failed assertions).
+        requests (int): HTTP requests sent.
+        failed_requests (int): Requests that raised or returned a 5xx status.
+        errors (dict): Iteration failure messages and how often they occurred.
+        routes (dict): Per-route latency summary, see `LatencyRecorder.summary()`.
+    """
+    duration: float
+    users: int
+    target_rps: float | None
+    iterations: int
+    failed_iterations: int
+    requests: int
+    failed_requests: int
+    errors: dict = field(default_factory=dict)
+    routes: dict = field(default_factory=dict)
+
+    @property
+    def throughput(self):
+        """
+        float: Requests per second.
+        """
+        return self.requests / self.duration if self.duration else 0.0
+
+    @property
+    def requests_per_iteration(self):
+        """
+        float: Average HTTP requests one iteration made.
+        """
+        return self.requests / self.iterations if self.iterations else 0.0
+
+    @property
+    def iteration_rate(self):
+        """
+        float: Iterations per second.
+        """
+        return self.iterations / self.duration if self.duration else 0.0
+
+    @property
+    def error_rate(self):
+        """
+        float: Share of requests that failed.
+        """
+        return self.failed_requests / self.requests if self.requests else 0.0
+
+    def to_dict(self):
+        return {
+            "duration": self.duration,
+            "users": self.users,
+            "target_rps": self.target_rps,
+            "requests": self.requests,
+            "failed_requests": self.failed_requests,
+            "throughput": self.throughput,
+            "error_rate": self.error_rate,
+            "iterations": self.iterations,
+            "failed_iterations": self.failed_iterations,
+            "iteration_rate": self.iteration_rate,
+            "requests_per_iteration": self.requests_per_iteration,
+            "errors": self.errors,
+            "routes": self.routes,
+        }
+
+    def format(self):
+        """
+        Renders the report as a human-readable table.
+        """
+        lines = [
+            f"Load run: {self.users} virtual users, {self.duration:.1f}s"
+            + (f", target {self.target_rps:g} req/s" if self.target_rps else ""),
+            f"Requests:   {self.requests} ({self.throughput:.1f} req/s achieved), "
+            f"{self.failed_requests} failed ({self.error_rate:.2%})",
+            f"Iterations: {self.iterations} ({self.iteration_rate:.1f} it/s, "
+            f"{self.requests_per_iteration:.1f} requests each), {self.failed_iterations} failed",
+            "",
+            f"{'route':<28} {'count':>7} {'errors':>7} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}",
+        ]
+        for route, stats in self.routes.items():
+            total = stats["phases"]["total"]
+            lines.append(f"{route:<28} {stats['count']:>7} {stats['errors']:>7} "
+                         f"{total['p50']:>9.1f} {total['p95']:>9.1f} {total['p99']:>9.1f}")
+        if self.errors:
+            lines += ["", "Iteration failures:"]
+            lines += [f"  {count:>6} x {message}" for message, count in self.errors.items()]
+        return "\n".join(lines)
+
+
+class LoadRunner:
+    """
+    Runs a scenario built from `PetAPI`/`UserAPI` calls with concurrent virtual users.
+
+    Each virtual user is a thread that repeatedly calls `scenario(vu)` until
+    the time limit. All virtual users share one pair of pooled clients. With
+    `target_rps`, every HTTP request is paced by one `Pacer` hooked into those
+    clients (open model, with linear ramp-up), so the request rate holds
+    whatever the scenario's mix of calls; without it, every virtual user loops
+    as fast as it can (closed model) and users are started evenly over the
+    ramp-up period.
+    """
+
+    def __init__(self, scenario, users=1, duration=10.0, target_rps=None, ramp_up=0.0,
+                 base_url=None, api_key=None, first_id=None, **client_options):
+        """
+        Args:
+            scenario (callable): Takes a `VirtualUser` and runs one iteration.
+            users (int, optional): Number of concurrent virtual users.
+            duration (float, optional): Time limit of the run in seconds.
+            target_rps (float, optional): HTTP requests sent per second across all users.
+            ramp_up (float, optional): Seconds over which the load reaches its target.
+            base_url (str, optional): The API base URL (defaults to the live Petstore).
+            api_key (str, optional): The key for deleting pets (defaults to API_SPECIAL_KEY).
+            first_id (int, optional): First entity ID handed out by `VirtualUser.next_id()`.
+            **client_options: Forwarded to the API clients (e.g. `transport`, `timeout`).
+        """
+        if users < 1:
+            raise ValueError("users must be at least 1")
+        self.scenario = scenario
+        self.users = users
+        self.duration = duration
+        self.target_rps = target_rps
+        self.ramp_up = ramp_up
+        self.base_url = base_url
+        self.api_key = api_key
+        self.first_id = first_id if first_id is not None else int(time.time() * 1000) % 10 ** 9 * 1000
+        # Every virtual user may hold a connection, so size the pool accordingly
+        client_options.setdefault("max_connections", users)
+        client_options.setdefault("max_keepalive_connections", users)
+        self.client_options = client_options
+
+    def run(self):
+        """
+        Executes the load run and blocks until it finishes.
+
+        Returns:
+            LoadReport: Throughput, error rates and latency percentiles.
+        """
+        recorder = LatencyRecorder()
+        failures = Counter()
+        counters = {"iterations": 0, "failed": 0}
+        lock = threading.Lock()
+        id_source = itertools.count(self.first_id)
+
+        start = time.monotonic()
+        deadline = start + self.duration
+        request_hooks = []
+        if self.target_rps:
+            pacer = Pacer(self.target_rps, self.ramp_up, start)
+            request_hooks.append(lambda route: pacer.acquire())
+        client_options = {"hooks": [recorder], "request_hooks": request_hooks, **self.client_options}
+
+        with PetAPI(self.base_url, api_key=self.api_key, **client_options) as pet_api, \
+                UserAPI(self.base_url, **client_options) as user_api:
+
+            def virtual_user(vu_id):
+                vu = VirtualUser(pet_api, user_api, vu_id, id_source)
+                if not self.target_rps and self.ramp_up:
+                    # Closed model: stagger user start times over the ramp-up period
+                    time.sleep(min(self.ramp_up * vu_id / self.users, self.duration))
+                while time.monotonic() < deadline:
+                    vu.iteration += 1
+                    try:
+                        self.scenario(vu)
+                        failed = False
+                    except Exception as error:
+                        failed = True
+                        with lock:
+                            failures[f"{type(error).__name__}: {error}".splitlines()[0][:200]] += 1
+                    with lock:
+                        counters["iterations"] += 1
+                        counters["failed"] += failed
+
+            with ThreadPoolExecutor(max_workers=self.users, thread_name_prefix="vu") as executor:
+                for future in [executor.submit(virtual_user, vu_id) for vu_id in range(self.users)]:
+                    future.result()
+            elapsed = time.monotonic() - start
+
+        routes = recorder.summary()
+        return LoadReport(
+            duration=elapsed,
+            users=self.users,
+            target_rps=self.target_rps,
+            iterations=counters["iterations"],
+            failed_iterations=counters["failed"],
+            requests=sum(route["count"] for route in routes.values()),
+            failed_requests=sum(route["errors"] for route in routes.values()),
+            errors=dict(failures.most_common()),
+            routes=routes,
+        )
+
+
+# --- Built-in scenarios, mirroring the created_pet_id / created_username fixtures ---
+
+def pet_crud_scenario(vu):
+    """
+    Creates a pet, reads it back, updates it, finds it by status and deletes it.
+    """
+    pet_id = vu.next_id()
+    pet_data = {"id": pet_id, "name": f"LoadPet_{pet_id}", "status": "available"}
+    create_response = vu.pet_api.create_pet(pet_data)
+    assert create_response.status_code == 200, f"create_pet returned {create_response.status_code}"
+    vu.pet_api.get_pet_by_id(pet_id)
+    vu.pet_api.update_pet({**pet_data, "status": "sold"})
+    vu.pet_api.get_pet_by_status("sold")
+    vu.pet_api.delete_pet(pet_id)
+
+
+def user_crud_scenario(vu):
+    """
+    Creates a user, reads it back, updates it and deletes it.
+    """
+    user_id = vu.next_id()
+    username = f"Load_User_{user_id}"
+    user_data = {
+        "id": user_id,
+        "username": username,
+        "firstName": f"Load_First_{user_id}",
+        "lastName": f"Load_Second_{user_id}",
+        "email": f"load_{user_id}@test.com",
+        "password": str(user_id),
+        "phone": f"093{user_id}",
+        "userStatus": 0
+    }
+    create_response = vu.user_api.create_user(user_data)
+    assert create_response.status_code == 200, f"create_user returned {create_response.status_code}"
+    vu.user_api.get_user_by_username(username)
+    vu.user_api.update_user_by_username(username, {**user_data, "firstName": f"Updated_{user_id}"})
+    vu.user_api.delete_user(username)
+
+
+SCENARIOS = {
+    "pet_crud": pet_crud_scenario,
+    "user_crud": user_crud_scenario,
+}
+
+
+def main():
+    """
+    Command line entry point, e.g.
+    `python -m endpoints.load_runner --scenario pet_crud --users 20 --rps 500 --stub`.
+    """
+    parser = argparse.ArgumentParser(description="Drive PetAPI/UserAPI scenarios with concurrent virtual users.")
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), default="pet_crud")
+    parser.add_argument("--users", type=int, default=10, help="Number of concurrent virtual users.")
+    parser.add_argument("--duration", type=float, default=30.0, help="Time limit in seconds.")
+    parser.add_argument("--rps", dest="target_rps", type=float, default=None,
+                        help="Target HTTP requests per second across all users, reached over --ramp-up "
+                             "(default: as fast as possible).")
+    parser.add_argument("--ramp-up", type=float, default=0.0, help="Seconds to reach the target load.")
+    parser.add_argument("--base-url", default=os.getenv("API_BASE_URL"), help="API base URL.")
+    parser.add_argument("--stub", action="store_true", help="Run against the in-process Petstore stand-in.")
+    parser.add_argument("--stub-latency", type=float, default=0.0, help="Stand-in response delay in seconds.")
+    parser.add_argument("--json", dest="json_path", help="Also write the report as JSON to this path.")
+    args = parser.parse_args()
+
+    client_options = {}
+    base_url = args.base_url
+    if args.stub:
+        client_options["api_key"] = STUB_API_KEY
+        client_options["transport"] = PetstoreStubTransport(PetstoreStub(latency=args.stub_latency))
+        base_url = STUB_BASE_URL
+
+    report = LoadRunner(SCENARIOS[args.scenario], users=args.users, duration=args.duration,
+                        target_rps=args.target_rps, ramp_up=args.ramp_up, base_url=base_url, **client_options).run()
+    print(report.format())
+    if args.json_path:
+        with open(args.json_path, "w") as report_file:
+            json.dump(report.to_dict(), report_file, indent=2)
+    return 1 if report.failed_iterations else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
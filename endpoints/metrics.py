@@ -0,0 +1,273 @@
+import bisect
+import math
+import threading
+import time
+from dataclasses import dataclass, field
+
+# Request phases reported per route; "connect" includes DNS resolution, which
+# httpcore performs as part of opening the TCP connection
+PHASES = ("connect", "tls", "ttfb", "total")
+
+# httpcore trace events (HTTP/1.1 and HTTP/2) that delimit each phase
+_PHASE_EVENTS = {
+    "connection.connect_tcp.started": ("connect", "start"),
+    "connection.connect_tcp.complete": ("connect", "end"),
+    "connection.start_tls.started": ("tls", "start"),
+    "connection.start_tls.complete": ("tls", "end"),
+    "http11.send_request_headers.started": ("ttfb", "start"),
+    "http11.receive_response_headers.complete": ("ttfb", "end"),
+    "http2.send_request_headers.started": ("ttfb", "start"),
+    "http2.receive_response_headers.complete": ("ttfb", "end"),
+}
+
+
+class RequestTimer:
+    """
+    Collects phase timings for one request from httpcore's `trace` extension.
+
+    Pass `timer.trace` (sync clients) or `timer.atrace` (async clients) as the
+    request's `trace` extension. Phases the transport does not report (e.g.
+    connect/tls on a reused connection, or everything on an in-process
+    transport) are simply absent.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self._marks = {}
+
+    def trace(self, event_name, info):
+        phase_mark = _PHASE_EVENTS.get(event_name)
+        if phase_mark is not None:
+            self._marks[phase_mark] = time.perf_counter()
+
+    async def atrace(self, event_name, info):
+        self.trace(event_name, info)
+
+    def timings(self):
+        """
+        Returns the measured phases in seconds, with "total" measured up to now.
+        """
+        timings = {}
+        for phase in PHASES[:-1]:
+            start, end = self._marks.get((phase, "start")), self._marks.get((phase, "end"))
+            if start is not None and end is not None:
+                timings[phase] = end - start
+        timings["total"] = time.perf_counter() - self.started
+        return timings
+
+
+@dataclass
+class RequestSample:
+    """
+    Everything recorded about one API call, as passed to the client hooks.
+
+    Attributes:
+        method (str): The HTTP method.
+        route (str): The route template, e.g. "GET /pet/{petId}".
+        url (str): The requested URL.
+        status (int | None): The response status, or None if the request failed.
+        request_bytes (int): Size of the request body.
+        response_bytes (int): Size of the (decoded) response body.
+        timings (dict): Seconds spent per phase (see `PHASES`).
+        error (Exception | None): The exception raised by the request, if any.
+    """
+    method: str
+    route: str
+    url: str
+    status: int | None
+    request_bytes: int
+    response_bytes: int
+    timings: dict = field(default_factory=dict)
+    error: Exception | None = None
+
+
+class LatencyHistogram:
+    """
+    A fixed-memory latency histogram with logarithmic buckets.
+
+    Buckets grow by `growth` (5% by default) from 0.1 ms up to 10 minutes, so
+    percentiles are accurate to within that ratio whatever the sample count.
+    """
+
+    def __init__(self, lowest=1e-4, highest=600.0, growth=1.05):
+        count = int(math.ceil(math.log(highest / lowest, growth))) + 1
+        self._bounds = [lowest * growth ** index for index in range(count)]
+        self._counts = [0] * (count + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds):
+        self._counts[bisect.bisect_left(self._bounds, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def merge(self, other):
+        """
+        Adds another histogram's samples (with identical bucket layout) to this one.
+        """
+        self._counts = [mine + theirs for mine, theirs in zip(self._counts, other._counts)]
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def to_dict(self):
+        """
+        Returns the histogram as JSON-serializable data (non-empty buckets only).
+        """
+        return {
+            "buckets": {str(index): count for index, count in enumerate(self._counts) if count},
+            "count": self.count,
+            "total": self.total,
+            "max": self.max,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Rebuilds a histogram (with the default bucket layout) from `to_dict()` output.
+        """
+        histogram = cls()
+        for index, count in data["buckets"].items():
+            histogram._counts[int(index)] = count
+        histogram.count = data["count"]
+        histogram.total = data["total"]
+        histogram.max = data["max"]
+        return histogram
+
+    def percentile(self, percent):
+        """
+        Returns the upper bound of the bucket holding the given percentile, in seconds.
+        """
+        if not self.count:
+            return 0.0
+        rank = math.ceil(self.count * percent / 100)
+        seen = 0
+        for index, bucket_count in enumerate(self._counts):
+            seen += bucket_count
+            if seen >= rank:
+                return min(self.max, self._bounds[index]) if index < len(self._bounds) else self.max
+        return self.max
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+
+class LatencyRecorder:
+    """
+    A client hook that aggregates `RequestSample`s into per-route histograms.
+
+    Register it with `PetAPI(..., hooks=[recorder])`; one recorder can be
+    shared by any number of (sync or async) clients and threads.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._routes = {}
+
+    def __call__(self, sample):
+        with self._lock:
+            route = self._route(sample.route)
+            for phase, seconds in sample.timings.items():
+                route["histograms"][phase].record(seconds)
+            if sample.status is None or sample.status >= 500:
+                route["errors"] += 1
+            route["statuses"][sample.status] = route["statuses"].get(sample.status, 0) + 1
+            route["request_bytes"] += sample.request_bytes
+            route["response_bytes"] += sample.response_bytes
+
+    def merge(self, other):
+        """
+        Folds another recorder's data into this one (e.g. from a parallel worker).
+        """
+        with self._lock, other._lock:
+            for name, theirs in other._routes.items():
+                mine = self._route(name)
+                for phase in PHASES:
+                    mine["histograms"][phase].merge(theirs["histograms"][phase])
+                for status, count in theirs["statuses"].items():
+                    mine["statuses"][status] = mine["statuses"].get(status, 0) + count
+                mine["errors"] += theirs["errors"]
+                mine["request_bytes"] += theirs["request_bytes"]
+                mine["response_bytes"] += theirs["response_bytes"]
+
+    def dump(self):
+        """
+        Returns everything recorded as JSON-serializable data, e.g. to send it
+        from a parallel worker; see `load()`.
+        """
+        with self._lock:
+            return {
+                name: {
+                    "histograms": {phase: histogram.to_dict() for phase, histogram in route["histograms"].items()},
+                    "statuses": {str(status): count for status, count in route["statuses"].items()},
+                    "errors": route["errors"],
+                    "request_bytes": route["request_bytes"],
+                    "response_bytes": route["response_bytes"],
+                }
+                for name, route in self._routes.items()
+            }
+
+    @classmethod
+    def load(cls, dumped):
+        """
+        Creates a recorder holding the data produced by `dump()`.
+        """
+        recorder = cls()
+        for name, data in dumped.items():
+            route = recorder._route(name)
+            route["histograms"] = {phase: LatencyHistogram.from_dict(histogram)
+                                   for phase, histogram in data["histograms"].items()}
+            # Failed requests are recorded with a status of None
+            route["statuses"] = {None if status == "None" else int(status): count
+                                 for status, count in data["statuses"].items()}
+            route["errors"] = data["errors"]
+            route["request_bytes"] = data["request_bytes"]
+            route["response_bytes"] = data["response_bytes"]
+        return recorder
+
+    def _route(self, name):
+        # Callers hold the lock
+        if name not in self._routes:
+            self._routes[name] = {
+                "histograms": {phase: LatencyHistogram() for phase in PHASES},
+                "statuses": {},
+                "errors": 0,
+                "request_bytes": 0,
+                "response_bytes": 0,
+            }
+        return self._routes[name]
+
+    def summary(self, percentiles=(50, 95, 99)):
+        """
+        Summarizes the recorded requests per route.
+
+        Returns:
+            dict: route -> {"count", "errors", "statuses", "request_bytes",
+                  "response_bytes", "phases": {phase -> {"count", "mean", "max", "p50", ...}}},
+                  with all durations in milliseconds.
+        """
+        with self._lock:
+            summary = {}
+            for name, route in sorted(self._routes.items()):
+                phases = {}
+                for phase, histogram in route["histograms"].items():
+                    if not histogram.count:
+                        continue
+                    phases[phase] = {
+                        "count": histogram.count,
+                        "mean": histogram.mean * 1000,
+                        "max": histogram.max * 1000,
+                        **{f"p{percent}": histogram.percentile(percent) * 1000 for percent in percentiles},
+                    }
+                summary[name] = {
+                    "count": route["histograms"]["total"].count,
+                    "errors": route["errors"],
+                    "statuses": {str(status): count for status, count in route["statuses"].items()},
+                    "request_bytes": route["request_bytes"],
+                    "response_bytes": route["response_bytes"],
+                    "phases": phases,
+                }
+            return summary
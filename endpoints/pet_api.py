@@ -1,15 +1,19 @@
 import os
-import httpx
+from contextlib import closing
+from endpoints.base_api import BaseAPI
+from endpoints.bulk import DEFAULT_CONCURRENCY, run_bulk
+from endpoints.polling import DEFAULT_TIMEOUT, wait_until
+from endpoints.streaming import iter_json_array
 
 
-class PetAPI:
+class PetAPI(BaseAPI):
     """
     Client for interacting with the Pet Store API's /pet endpoint.
     This class encapsulates all HTTP requests related to pet management
     (create, read, update, delete).
     """
 
-    def __init__(self, base_url=None):
+    def __init__(self, base_url=None, api_key=None, **client_options):
         """
         Initializes the PetAPI client.
 
@@ -17,9 +21,13 @@ class PetAPI:
             base_url (str, optional): The base URL of the Pet Store API.
                                       Defaults to "https://petstore.swagger.io/v2"
                                       if not provided.
+            api_key (str, optional): The key sent when deleting pets. Defaults
+                                     to the API_SPECIAL_KEY environment variable.
+            **client_options: Connection pool and timeout settings forwarded
+                              to `BaseAPI` (e.g. `timeout`, `max_connections`).
         """
-        # Set the base URL for API requests, defaulting if not provided
-        self.base_url = base_url or "https://petstore.swagger.io/v2"
+        super().__init__(base_url, **client_options)
+        self.api_key = api_key
         # Construct the specific endpoint URL for pet operations
         self.pet_endpoint = f"{self.base_url}/pet"
 
@@ -40,7 +48,8 @@ class PetAPI:
             "accept": "application/json"  # Indicates that the client expects a JSON response
         }
         # Send the POST request with the pet data as JSON
-        response = httpx.post(self.pet_endpoint, json=pet_data, headers=headers)
+        response = self._request("POST", self.pet_endpoint, "POST /pet", json=pet_data, headers=headers)
+        self._invalidate(f"{self.pet_endpoint}/{pet_data.get('id')}", f"{self.pet_endpoint}/findByStatus")
         return response
 
     def update_pet(self, pet_data):
@@ -61,32 +70,37 @@ class PetAPI:
             "accept": "application/json"
         }
         # Send the PUT request with the updated pet data as JSON
-        response = httpx.put(self.pet_endpoint, json=pet_data, headers=headers)
+        response = self._request("PUT", self.pet_endpoint, "PUT /pet", json=pet_data, headers=headers)
+        self._invalidate(f"{self.pet_endpoint}/{pet_data.get('id')}", f"{self.pet_endpoint}/findByStatus")
         return response
 
-    def get_pet_by_id(self, pet_id):
+    def get_pet_by_id(self, pet_id, use_cache=True):
         """
         Sends a GET request to retrieve a pet by its unique ID.
 
         Args:
             pet_id (int): The ID of the pet to retrieve.
+            use_cache (bool, optional): Serve the response from the client's
+                                        cache, if one is configured.
 
         Returns:
             httpx.Response: The response object from the API.
         """
         # Construct the URL for fetching a specific pet by ID
         url = f"{self.pet_endpoint}/{pet_id}"
-        # Send the GET request
-        response = httpx.get(url)
+        # Send the GET request (possibly served from the cache)
+        response = self._get(url, "GET /pet/{petId}", use_cache=use_cache)
         return response
 
-    def get_pet_by_status(self, status):
+    def get_pet_by_status(self, status, use_cache=True):
         """
         Sends a GET request to find pets by their status.
 
         Args:
             status (str): The status of the pet(s) to find (e.g., "available", "pending", "sold").
                           Can be a comma-separated string for multiple statuses.
+            use_cache (bool, optional): Serve the response from the client's
+                                        cache, if one is configured.
 
         Returns:
             httpx.Response: The response object from the API.
@@ -100,10 +114,81 @@ class PetAPI:
         }
         # Define query parameters
         params = {"status": status}
-        # Send the GET request with parameters
-        response = httpx.get(url, params=params, headers=headers)
+        # Send the GET request with parameters (possibly served from the cache)
+        response = self._get(url, "GET /pet/findByStatus", params=params, headers=headers, use_cache=use_cache)
         return response
 
+    def iter_pets_by_status(self, status):
+        """
+        Streams pets with the given status one at a time as the response body arrives.
+
+        Unlike `get_pet_by_status`, the (potentially huge) JSON array is never
+        buffered or parsed as a whole, so memory stays flat on busy catalogs.
+        Stopping the iteration early closes the response. Responses are never
+        served from the cache.
+
+        Args:
+            status (str): The status of the pet(s) to find (e.g., "available", "pending", "sold").
+                          Can be a comma-separated string for multiple statuses.
+
+        Yields:
+            dict: One pet at a time.
+
+        Raises:
+            httpx.HTTPStatusError: If the API does not answer with a 2xx status.
+        """
+        url = f"{self.pet_endpoint}/findByStatus"
+        headers = {"accept": "application/json"}
+        params = {"status": status}
+        with self._stream("GET", url, "GET /pet/findByStatus", params=params, headers=headers) as response:
+            if not response.is_success:
+                response.read()
+                response.raise_for_status()
+            yield from iter_json_array(response.iter_bytes())
+
+    def find_pet_by_status(self, status, predicate):
+        """
+        Returns the first pet with the given status that matches `predicate`,
+        stopping the download as soon as it is found.
+
+        Args:
+            status (str): The status of the pet(s) to search.
+            predicate (callable): Takes a pet dict and returns True for a match,
+                                  e.g. `lambda pet: pet.get("id") == pet_id`.
+
+        Returns:
+            dict | None: The first matching pet, or None if no pet matches.
+        """
+        # Close the stream right away instead of when the generator is collected
+        with closing(self.iter_pets_by_status(status)) as pets:
+            for pet in pets:
+                if predicate(pet):
+                    return pet
+        return None
+
+    def wait_for_pet(self, pet_id, condition=None, timeout=DEFAULT_TIMEOUT):
+        """
+        Polls a pet by ID until it reaches the expected state.
+
+        Absorbs the Pet Store's read-after-write lag: the first GET is sent
+        immediately, later ones back off exponentially (with jitter) until
+        `condition` holds or `timeout` seconds pass. The time to converge is
+        recorded in `endpoints.polling.convergence_stats`.
+
+        Args:
+            pet_id (int): The ID of the pet to poll.
+            condition (callable, optional): Takes the `httpx.Response` and returns
+                                            True once converged. Defaults to the
+                                            pet being found (status 200).
+            timeout (float, optional): Overall deadline in seconds.
+
+        Returns:
+            PollResult: The last response (`.value`) and convergence details.
+        """
+        condition = condition or (lambda response: response.status_code == 200)
+        return wait_until(lambda: self.get_pet_by_id(pet_id, use_cache=False), condition, timeout,
+                          label="GET /pet/{petId}")
+
     def delete_pet(self, pet_id):
         """
         Sends a DELETE request to remove a pet from the store by its ID.
@@ -116,10 +201,10 @@ class PetAPI:
             httpx.Response: The response object from the API.
 
         Raises:
-            ValueError: If the API key is not found in environment variables.
+            ValueError: If no API key was given and none is found in environment variables.
         """
-        # Retrieve the API key from environment variables for authentication
-        api_key = os.getenv("API_SPECIAL_KEY")
+        # Use the client's API key, or retrieve it from environment variables for authentication
+        api_key = self.api_key or os.getenv("API_SPECIAL_KEY")
         # Ensure the API key is present
         if not api_key:
             raise ValueError("API key not found in environment variables!")
@@ -131,5 +216,32 @@ class PetAPI:
             "api_key": api_key
         }
         # Send the DELETE request with the API key
-        response = httpx.delete(url, headers=headers)
+        response = self._request("DELETE", url, "DELETE /pet/{petId}", headers=headers)
+        self._invalidate(url, f"{self.pet_endpoint}/findByStatus")
         return response
+
+    def create_pets_bulk(self, pets_data, concurrency=DEFAULT_CONCURRENCY):
+        """
+        Creates many pets concurrently, streaming back each result as it finishes.
+
+        Args:
+            pets_data (iterable[dict]): The pet payloads to create.
+            concurrency (int, optional): Maximum number of requests in flight.
+
+        Returns:
+            Iterator[BulkResult]: A lazy iterator of per-pet results, including failures.
+        """
+        return run_bulk(self.create_pet, pets_data, concurrency)
+
+    def delete_pets_bulk(self, pet_ids, concurrency=DEFAULT_CONCURRENCY):
+        """
+        Deletes many pets concurrently, streaming back each result as it finishes.
+
+        Args:
+            pet_ids (iterable[int]): The IDs of the pets to delete.
+            concurrency (int, optional): Maximum number of requests in flight.
+
+        Returns:
+            Iterator[BulkResult]: A lazy iterator of per-pet results, including failures.
+        """
+        return run_bulk(self.delete_pet, pet_ids, concurrency)
@@ -0,0 +1,551 @@
+import argparse
+import asyncio
+import json
+import random
+import re
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import httpx
+
+# Base URL used by the API clients when the stub is plugged in as a transport
+STUB_BASE_URL = "http://petstore.stub/v2"
+# The stand-in accepts any api_key when deleting pets; this is the live Petstore's demo key
+STUB_API_KEY = "special-key"
+
+# Route templates with the stub method that serves them, matched against the
+# request path once the base path has been removed
+ROUTES = [
+    ("GET", re.compile(r"^/pet/findByStatus$"), "GET /pet/findByStatus", "_find_pets_by_status"),
+    ("POST", re.compile(r"^/pet/?$"), "POST /pet", "_save_pet"),
+    ("PUT", re.compile(r"^/pet/?$"), "PUT /pet", "_save_pet"),
+    ("GET", re.compile(r"^/pet/(?P<pet_id>[^/]+)$"), "GET /pet/{petId}", "_get_pet"),
+    ("DELETE", re.compile(r"^/pet/(?P<pet_id>[^/]+)$"), "DELETE /pet/{petId}", "_delete_pet"),
+    ("POST", re.compile(r"^/user/?$"), "POST /user", "_create_user"),
+    ("GET", re.compile(r"^/user/(?P<username>[^/]+)$"), "GET /user/{username}", "_get_user"),
+    ("PUT", re.compile(r"^/user/(?P<username>[^/]+)$"), "PUT /user/{username}", "_update_user"),
+    ("DELETE", re.compile(r"^/user/(?P<username>[^/]+)$"), "DELETE /user/{username}", "_delete_user"),
+]
+
+# Route template -> name of the PetstoreStub method that serves it
+HANDLERS = {template: handler for _, _, template, handler in ROUTES}
+
+
+class PetstoreStub:
+    """
+    An in-memory stand-in for the Swagger Petstore `/pet` and `/user` routes.
+
+    It mimics the live API's responses closely enough for `PetAPI`/`UserAPI`
+    and adds knobs to make its behaviour deliberately worse:
+
+    * `latency` - seconds to wait before answering, either one number for
+      every route or a dict keyed by route template (e.g. "GET /pet/{petId}").
+    * `error_rate` - probability (0..1) of answering with a 500, as a number
+      or a dict keyed by route template.
+    * `consistency_delay` - seconds before a write becomes visible to reads,
+      reproducing the read-after-write lag seen on the shared Petstore.
+
+    All knobs can be changed at any time, e.g. from inside a test.
+    """
+
+    def __init__(self, latency=0.0, error_rate=0.0, consistency_delay=0.0, base_path="/v2", seed=None):
+        """
+        Initializes an empty Petstore.
+
+        Args:
+            latency (float | dict, optional): Response delay in seconds.
+            error_rate (float | dict, optional): Probability of a 500 response.
+            consistency_delay (float, optional): Seconds before writes are visible.
+            base_path (str, optional): Path prefix stripped before route matching.
+            seed (int, optional): Seed for the error injection RNG.
+        """
+        self.latency = latency
+        self.error_rate = error_rate
+        self.consistency_delay = consistency_delay
+        self.base_path = base_path.rstrip("/")
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        # Every entity keeps a history of (visible_at, value) versions;
+        # a value of None marks a deletion
+        self._pets = {}
+        self._users = {}
+
+    def reset(self):
+        """
+        Removes all stored pets and users.
+        """
+        with self._lock:
+            self._pets.clear()
+            self._users.clear()
+
+    # --- Request handling ---
+
+    def match(self, method, path):
+        """
+        Resolves a request to its route template.
+
+        Args:
+            method (str): The HTTP method.
+            path (str): The full request path, including the base path.
+
+        Returns:
+            tuple: (route template or None, dict of path parameters).
+        """
+        if self.base_path and path.startswith(self.base_path):
+            path = path[len(self.base_path):]
+        for route_method, pattern, template, _ in ROUTES:
+            found = pattern.match(path)
+            if found and route_method == method:
+                return template, found.groupdict()
+        return None, {}
+
+    def delay_for(self, route):
+        """
+        Returns the configured latency in seconds for a route template.
+        """
+        return self._knob(self.latency, route)
+
+    def handle(self, method, path, query=None, body=None):
+        """
+        Produces the response for a request, without applying latency.
+
+        Args:
+            method (str): The HTTP method.
+            path (str): The full request path.
+            query (dict, optional): Query parameters mapped to lists of values.
+            body (bytes, optional): The raw request body.
+
+        Returns:
+            tuple: (status code, JSON-serializable body or None).
+        """
+        route, params = self.match(method, path)
+        if route is None:
+            # The live API rejects unsupported method/path pairs with 405
+            return 405, {"code": 405, "type": "unknown", "message": "Method Not Allowed"}
+        if self._random.random() < self._knob(self.error_rate, route):
+            return 500, {"code": 500, "type": "unknown", "message": "something bad happened"}
+
+        payload = None
+        if body:
+            try:
+                payload = json.loads(body)
+            except ValueError:
+                return 400, {"code": 400, "type": "unknown", "message": "bad input"}
+
+        handler = getattr(self, HANDLERS[route])
+        return handler(params, query or {}, payload)
+
+    # --- Pet routes ---
+
+    def _save_pet(self, params, query, pet):
+        if not isinstance(pet, dict):
+            return 405, {"code": 405, "type": "unknown", "message": "Invalid input"}
+        try:
+            pet = {**pet, "id": int(pet.get("id", 0))}
+        except (TypeError, ValueError):
+            return 500, {"code": 500, "type": "unknown", "message": "something bad happened"}
+        self._write(self._pets, pet["id"], pet)
+        return 200, pet
+
+    def _find_pets_by_status(self, params, query, payload):
+        statuses = {status for value in query.get("status", []) for status in value.split(",")}
+        return 200, [pet for pet in self._read_all(self._pets) if pet.get("status") in statuses]
+
+    def _get_pet(self, params, query, payload):
+        pet_id = self._parse_pet_id(params["pet_id"])
+        if pet_id is None:
+            return 404, {"code": 404, "type": "unknown",
+                         "message": f'java.lang.NumberFormatException: For input string: "{params["pet_id"]}"'}
+        pet = self._read(self._pets, pet_id)
+        if pet is None:
+            return 404, {"code": 1, "type": "error", "message": "Pet not found"}
+        return 200, pet
+
+    def _delete_pet(self, params, query, payload):
+        pet_id = self._parse_pet_id(params["pet_id"])
+        if pet_id is None or self._read(self._pets, pet_id) is None:
+            return 404, None
+        self._write(self._pets, pet_id, None)
+        return 200, {"code": 200, "type": "unknown", "message": str(pet_id)}
+
+    # --- User routes ---
+
+    def _create_user(self, params, query, user):
+        if not isinstance(user, dict) or "username" not in user:
+            return 405, {"code": 405, "type": "unknown", "message": "Invalid input"}
+        self._write(self._users, str(user["username"]), user)
+        return 200, {"code": 200, "type": "unknown", "message": str(user.get("id", 0))}
+
+    def _update_user(self, params, query, user):
+        if not isinstance(user, dict):
+            return 405, {"code": 405, "type": "unknown", "message": "Invalid input"}
+        if user.get("username", params["username"]) != params["username"]:
+            # Renaming moves the user to its new key
+            self._write(self._users, params["username"], None)
+        self._write(self._users, str(user.get("username", params["username"])), user)
+        return 200, {"code": 200, "type": "unknown", "message": str(user.get("id", 0))}
+
+    def _get_user(self, params, query, payload):
+        user = self._read(self._users, params["username"])
+        if user is None:
+            return 404, {"code": 1, "type": "error", "message": "User not found"}
+        return 200, user
+
+    def _delete_user(self, params, query, payload):
+        if self._read(self._users, params["username"]) is None:
+            return 404, None
+        self._write(self._users, params["username"], None)
+        return 200, {"code": 200, "type": "unknown", "message": params["username"]}
+
+    # --- Storage with eventual consistency ---
+
+    def _write(self, table, key, value):
+        now = time.monotonic()
+        with self._lock:
+            versions = table.setdefault(key, [])
+            # Drop versions already superseded by a newer visible one
+            visible = [index for index, (visible_at, _) in enumerate(versions) if visible_at <= now]
+            if visible:
+                del versions[:visible[-1]]
+            versions.append((now + self.consistency_delay, value))
+
+    def _read(self, table, key):
+        now = time.monotonic()
+        with self._lock:
+            visible = [value for visible_at, value in table.get(key, []) if visible_at <= now]
+        return visible[-1] if visible else None
+
+    def _read_all(self, table):
+        with self._lock:
+            keys = list(table)
+        return [value for value in (self._read(table, key) for key in keys) if value is not None]
+
+    @staticmethod
+    def _parse_pet_id(raw_id):
+        try:
+            return int(raw_id)
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _knob(value, route):
+        if isinstance(value, dict):
+            return value.get(route, value.get("*", 0.0))
+        return value
+
+
+def _to_httpx_response(request, status, body):
+    content = b"" if body is None else json.dumps(body).encode()
+    headers = {"content-type": "application/json"} if body is not None else {}
+    return httpx.Response(status, headers=headers, content=content, request=request)
+
+
+class PetstoreStubTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """
+    An httpx transport that serves requests from a `PetstoreStub` in-process.
+
+    Works with both `httpx.Client` and `httpx.AsyncClient`, so it can be
+    passed as `transport=` to `PetAPI`, `UserAPI` and their async twins.
+    """
+
+    def __init__(self, stub=None):
+        """
+        Args:
+            stub (PetstoreStub, optional): The store to serve. A fresh one is created if omitted.
+        """
+        self.stub = stub or PetstoreStub()
+
+    def handle_request(self, request):
+        route, _ = self.stub.match(request.method, request.url.path)
+        delay = self.stub.delay_for(route)
+        if delay:
+            time.sleep(delay)
+        status, body = self.stub.handle(request.method, request.url.path,
+                                        parse_qs(request.url.query.decode()), request.read())
+        return _to_httpx_response(request, status, body)
+
+    async def handle_async_request(self, request):
+        route, _ = self.stub.match(request.method, request.url.path)
+        delay = self.stub.delay_for(route)
+        if delay:
+            await asyncio.sleep(delay)
+        status, body = self.stub.handle(request.method, request.url.path,
+                                        parse_qs(request.url.query.decode()), await request.aread())
+        return _to_httpx_response(request, status, body)
+
+
+class PetstoreStubServer:
+    """
+    Serves a `PetstoreStub` over real HTTP on localhost from a background thread.
+
+    Use it when requests must cross a socket (e.g. to exercise connection
+    pooling), otherwise prefer the faster `PetstoreStubTransport`.
+    """
+
+    def __init__(self, stub=None, host="127.0.0.1", port=0):
+        """
+        Args:
+            stub (PetstoreStub, optional): The store to serve. A fresh one is created if omitted.
+            host (str, optional): Interface to bind to.
+            port (int, optional): Port to bind to; 0 picks a free port.
+        """
+        self.stub = stub or PetstoreStub()
+        self._server = ThreadingHTTPServer((host, port), self._make_handler(self.stub))
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        """
+        str: The base URL to pass to the API clients.
+        """
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{self.stub.base_path}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name="petstore-stub", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def serve_forever(self):
+        self._server.serve_forever()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    @staticmethod
+    def _make_handler(stub):
+        class Handler(BaseHTTPRequestHandler):
+            # Keep-alive, so clients can reuse pooled connections
+            protocol_version = "HTTP/1.1"
+            # Headers and body are written separately; without TCP_NODELAY, Nagle's
+            # algorithm and delayed ACKs add ~40 ms to every keep-alive response
+            disable_nagle_algorithm = True
+
+            def _serve(self):
+                url = urlsplit(self.path)
+                route, _ = stub.match(self.command, url.path)
+                delay = stub.delay_for(route)
+                if delay:
+                    time.sleep(delay)
+                length = int(self.headers.get("Content-Length") or 0)
+                status, body = stub.handle(self.command, url.path, parse_qs(url.query),
+                                           self.rfile.read(length) if length else None)
+                content = b"" if body is None else json.dumps(body).encode()
+                self.send_response(status)
+                if body is not None:
+                    self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            do_GET = do_POST = do_PUT = do_DELETE = _serve
+
+            def log_message(self, format, *args):
+                # Stay quiet; per-request logging would dominate the stub's cost
+                pass
+
+        return Handler
+
+
+class PetstoreStubH2Server:
+    """
+    Serves a `PetstoreStub` over cleartext HTTP/2 (h2c, prior knowledge) on localhost.
+
+    Every stream is answered as soon as its request is complete, so concurrent
+    requests are multiplexed over one connection. Clients must be created with
+    `http2="h2c"`. Requires the optional `h2` package.
+    """
+
+    def __init__(self, stub=None, host="127.0.0.1", port=0):
+        """
+        Args:
+            stub (PetstoreStub, optional): The store to serve. A fresh one is created if omitted.
+            host (str, optional): Interface to bind to.
+            port (int, optional): Port to bind to; 0 picks a free port.
+        """
+        self.stub = stub or PetstoreStub()
+        # Bind right away (like PetstoreStubServer) so `base_url` is known before starting
+        self._socket = socket.create_server((host, port))
+        self._loop = None
+        self._thread = None
+        self._ready = threading.Event()
+
+    @property
+    def base_url(self):
+        """
+        str: The base URL to pass to the API clients.
+        """
+        host, port = self._socket.getsockname()[:2]
+        return f"http://{host}:{port}{self.stub.base_path}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, name="petstore-stub-h2", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        return self
+
+    def serve_forever(self):
+        # The event loop lives entirely in this thread, so the server can be
+        # started from synchronous and asynchronous code alike
+        self._loop = asyncio.new_event_loop()
+        server = self._loop.run_until_complete(
+            self._loop.create_server(lambda: _H2Protocol(self.stub), sock=self._socket))
+        self._ready.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            server.close()
+            self._loop.run_until_complete(server.wait_closed())
+            self._loop.close()
+
+    def stop(self):
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+        if self._thread is not None:
+            self._thread.join()
+        self._socket.close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+class _H2Protocol(asyncio.Protocol):
+    """
+    One HTTP/2 server connection of `PetstoreStubH2Server`.
+    """
+
+    def __init__(self, stub):
+        # Imported here so the rest of the stub works without the optional h2 package
+        import h2.config
+        import h2.connection
+        import h2.events
+        import h2.exceptions
+        self._events = h2.events
+        self._protocol_error = h2.exceptions.ProtocolError
+        self.stub = stub
+        self.conn = h2.connection.H2Connection(
+            h2.config.H2Configuration(client_side=False, header_encoding="utf-8"))
+        self.transport = None
+        # stream id -> (request headers, body buffer)
+        self.requests = {}
+        # stream id -> event set whenever the peer opens its flow control window
+        self.windows = {}
+
+    def connection_made(self, transport):
+        self.transport = transport
+        transport.get_extra_info("socket").setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.conn.initiate_connection()
+        self.transport.write(self.conn.data_to_send())
+
+    def data_received(self, data):
+        events = self._events
+        try:
+            received = self.conn.receive_data(data)
+        except self._protocol_error:
+            # E.g. an HTTP/1.1 client; h2 has queued a GOAWAY frame to send
+            self.transport.write(self.conn.data_to_send())
+            self.transport.close()
+            return
+        for event in received:
+            if isinstance(event, events.RequestReceived):
+                self.requests[event.stream_id] = (dict(event.headers), bytearray())
+            elif isinstance(event, events.DataReceived):
+                self.requests[event.stream_id][1].extend(event.data)
+                self.conn.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+            elif isinstance(event, events.StreamEnded):
+                asyncio.ensure_future(self._respond(event.stream_id))
+            elif isinstance(event, events.WindowUpdated):
+                for stream_id, window in self.windows.items():
+                    if event.stream_id in (0, stream_id):
+                        window.set()
+            elif isinstance(event, events.StreamReset):
+                self.requests.pop(event.stream_id, None)
+            elif isinstance(event, events.ConnectionTerminated):
+                self.transport.close()
+        self.transport.write(self.conn.data_to_send())
+
+    def connection_lost(self, exc):
+        # Wake up responses blocked on flow control so they can finish
+        for window in self.windows.values():
+            window.set()
+
+    async def _respond(self, stream_id):
+        headers, body = self.requests.pop(stream_id)
+        url = urlsplit(headers[":path"])
+        route, _ = self.stub.match(headers[":method"], url.path)
+        delay = self.stub.delay_for(route)
+        if delay:
+            await asyncio.sleep(delay)
+        status, payload = self.stub.handle(headers[":method"], url.path, parse_qs(url.query), bytes(body) or None)
+        content = b"" if payload is None else json.dumps(payload).encode()
+        response_headers = [(":status", str(status)), ("content-length", str(len(content)))]
+        if payload is not None:
+            response_headers.append(("content-type", "application/json"))
+        if self.transport.is_closing():
+            return
+        self.conn.send_headers(stream_id, response_headers, end_stream=not content)
+        self.transport.write(self.conn.data_to_send())
+        if content:
+            await self._send_body(stream_id, content)
+
+    async def _send_body(self, stream_id, content):
+        # Respect the peer's flow control window, waiting for WINDOW_UPDATEs as needed
+        window = self.windows.setdefault(stream_id, asyncio.Event())
+        try:
+            while content:
+                if self.transport.is_closing():
+                    return
+                size = min(self.conn.local_flow_control_window(stream_id), self.conn.max_outbound_frame_size,
+                           len(content))
+                if size <= 0:
+                    window.clear()
+                    await window.wait()
+                    continue
+                self.conn.send_data(stream_id, content[:size], end_stream=size == len(content))
+                self.transport.write(self.conn.data_to_send())
+                content = content[size:]
+        finally:
+            self.windows.pop(stream_id, None)
+
+
+def main():
+    """
+    Runs the stand-in on localhost, e.g. `python -m endpoints.petstore_stub --port 8080`.
+    """
+    parser = argparse.ArgumentParser(description="Local Petstore stand-in for the /pet and /user routes.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0, help="Response delay in seconds.")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Probability of a 500 response.")
+    parser.add_argument("--consistency-delay", type=float, default=0.0,
+                        help="Seconds before writes become visible to reads.")
+    parser.add_argument("--h2c", action="store_true", help="Serve cleartext HTTP/2 instead of HTTP/1.1.")
+    args = parser.parse_args()
+
+    stub = PetstoreStub(latency=args.latency, error_rate=args.error_rate,
+                        consistency_delay=args.consistency_delay)
+    server_class = PetstoreStubH2Server if args.h2c else PetstoreStubServer
+    server = server_class(stub, host=args.host, port=args.port)
+    print(f"Petstore stub listening on {server.base_url}" + (" (h2c)" if args.h2c else ""))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
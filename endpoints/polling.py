@@ -0,0 +1,190 @@
+import asyncio
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+# Defaults tuned for the Petstore's read-after-write lag: probe immediately,
+# then back off from 50 ms up to 1 s between probes
+DEFAULT_TIMEOUT = 10.0
+DEFAULT_INITIAL_DELAY = 0.05
+DEFAULT_MAX_DELAY = 1.0
+
+
+@dataclass
+class PollResult:
+    """
+    The outcome of a `wait_until` call.
+
+    Attributes:
+        value: The result of the last probe (usually an `httpx.Response`).
+        converged (bool): True if the predicate was satisfied before the deadline.
+        attempts (int): Number of probes made.
+        elapsed (float): Seconds from the first probe until convergence or the deadline.
+    """
+    value: Any
+    converged: bool
+    attempts: int
+    elapsed: float
+
+
+class ConvergenceStats:
+    """
+    Thread-safe record of how long each poll took to converge, grouped by label.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._totals = {}
+
+    def record(self, label, result):
+        """
+        Stores the outcome of one poll under `label`.
+        """
+        with self._lock:
+            totals = self._totals.setdefault(
+                label, {"calls": 0, "timeouts": 0, "seconds": 0.0, "max_seconds": 0.0, "attempts": 0})
+            totals["calls"] += 1
+            totals["timeouts"] += not result.converged
+            totals["seconds"] += result.elapsed
+            totals["max_seconds"] = max(totals["max_seconds"], result.elapsed)
+            totals["attempts"] += result.attempts
+
+    def dump(self):
+        """
+        Returns the raw per-label totals, e.g. to send them from a parallel worker.
+        """
+        with self._lock:
+            return {label: dict(totals) for label, totals in self._totals.items()}
+
+    def merge(self, dumped):
+        """
+        Adds totals produced by `dump()` (e.g. in a parallel worker) to this record.
+        """
+        with self._lock:
+            for label, theirs in dumped.items():
+                mine = self._totals.setdefault(
+                    label, {"calls": 0, "timeouts": 0, "seconds": 0.0, "max_seconds": 0.0, "attempts": 0})
+                for key in ("calls", "timeouts", "seconds", "attempts"):
+                    mine[key] += theirs[key]
+                mine["max_seconds"] = max(mine["max_seconds"], theirs["max_seconds"])
+
+    def summary(self):
+        """
+        Summarizes the recorded polls per label.
+
+        Returns:
+            dict: label -> {"calls", "timeouts", "avg_seconds", "max_seconds", "avg_attempts"}.
+        """
+        return {
+            label: {
+                "calls": totals["calls"],
+                "timeouts": totals["timeouts"],
+                "avg_seconds": totals["seconds"] / totals["calls"],
+                "max_seconds": totals["max_seconds"],
+                "avg_attempts": totals["attempts"] / totals["calls"],
+            }
+            for label, totals in self.dump().items()
+        }
+
+    def clear(self):
+        with self._lock:
+            self._totals.clear()
+
+
+# Shared record of every poll made in this process
+convergence_stats = ConvergenceStats()
+
+
+def backoff_delays(initial_delay=DEFAULT_INITIAL_DELAY, max_delay=DEFAULT_MAX_DELAY, multiplier=2.0, jitter=0.5):
+    """
+    Generates exponentially growing delays with random jitter.
+
+    Each delay is drawn from [(1 - jitter) * d, d], where d doubles (by default)
+    from `initial_delay` up to `max_delay`. Jitter keeps parallel pollers from
+    hitting the API in lockstep.
+
+    Yields:
+        float: The next delay in seconds.
+    """
+    delay = initial_delay
+    while True:
+        yield random.uniform((1 - jitter) * delay, delay)
+        delay = min(max_delay, delay * multiplier)
+
+
+def wait_until(probe, predicate, timeout=DEFAULT_TIMEOUT, label=None, **backoff):
+    """
+    Calls `probe` until `predicate(result)` holds or `timeout` seconds pass.
+
+    The first probe is made immediately, so a resource that is already in the
+    expected state costs a single request. Later probes follow `backoff_delays`
+    and never sleep past the deadline. Exceptions raised by `probe` count as a
+    failed attempt; if the deadline passes without a successful probe, the last
+    exception is re-raised.
+
+    Args:
+        probe (callable): Takes no arguments and returns the current state.
+        predicate (callable): Takes the probe result and returns True once converged.
+        timeout (float, optional): Overall deadline in seconds.
+        label (str, optional): Name under which the outcome is recorded in `convergence_stats`.
+        **backoff: Overrides for `backoff_delays` (initial_delay, max_delay, multiplier, jitter).
+
+    Returns:
+        PollResult: The last probe result together with convergence details.
+    """
+    start = time.monotonic()
+    deadline = start + timeout
+    delays = backoff_delays(**backoff)
+    attempts = 0
+    while True:
+        attempts += 1
+        error = None
+        try:
+            value = probe()
+        except Exception as exc:
+            value, error = None, exc
+        if error is None and predicate(value):
+            return _finish(label, PollResult(value, True, attempts, time.monotonic() - start))
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            result = _finish(label, PollResult(value, False, attempts, time.monotonic() - start))
+            if error is not None:
+                raise error
+            return result
+        time.sleep(min(next(delays), remaining))
+
+
+async def wait_until_async(probe, predicate, timeout=DEFAULT_TIMEOUT, label=None, **backoff):
+    """
+    The asynchronous counterpart of `wait_until`; `probe` is a coroutine function.
+
+    Returns:
+        PollResult: The last probe result together with convergence details.
+    """
+    start = time.monotonic()
+    deadline = start + timeout
+    delays = backoff_delays(**backoff)
+    attempts = 0
+    while True:
+        attempts += 1
+        error = None
+        try:
+            value = await probe()
+        except Exception as exc:
+            value, error = None, exc
+        if error is None and predicate(value):
+            return _finish(label, PollResult(value, True, attempts, time.monotonic() - start))
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            result = _finish(label, PollResult(value, False, attempts, time.monotonic() - start))
+            if error is not None:
+                raise error
+            return result
+        await asyncio.sleep(min(next(delays), remaining))
+
+
+def _finish(label, result):
+    convergence_stats.record(label or "unlabelled", result)
+    return result
@@ -0,0 +1,115 @@
+import codecs
+import json
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+
+# Trim the consumed part of the buffer once it grows past this many characters
+_COMPACT_THRESHOLD = 64 * 1024
+
+
+def iter_json_array(chunks):
+    """
+    Incrementally parses a top-level JSON array, yielding its items one by one.
+
+    Only the current (incomplete) item is buffered, so memory stays flat no
+    matter how large the array is, and the first items are available as soon
+    as their bytes have arrived.
+
+    Args:
+        chunks (iterable[bytes]): The response body as it arrives.
+
+    Yields:
+        The decoded array items, in order.
+
+    Raises:
+        ValueError: If the body is not a well-formed JSON array.
+    """
+    parser = _ArrayParser()
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    for chunk in chunks:
+        yield from parser.feed(utf8.decode(chunk))
+    yield from parser.feed(utf8.decode(b"", final=True), final=True)
+
+
+async def aiter_json_array(chunks):
+    """
+    The asynchronous counterpart of `iter_json_array` for `httpx` async byte streams.
+    """
+    parser = _ArrayParser()
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    async for chunk in chunks:
+        for item in parser.feed(utf8.decode(chunk)):
+            yield item
+    for item in parser.feed(utf8.decode(b"", final=True), final=True):
+        yield item
+
+
+class _ArrayParser:
+    """
+    Push parser state shared by the sync and async iterators.
+    """
+
+    def __init__(self):
+        self.buffer = ""
+        self.position = 0
+        self.started = False
+        self.finished = False
+        self.expect_item = True
+        self.empty = True
+
+    def feed(self, text, final=False):
+        self.buffer += text
+        items = []
+        while not self.finished:
+            self._skip_whitespace()
+            if self.position == len(self.buffer):
+                break
+            char = self.buffer[self.position]
+            if not self.started:
+                if char != "[":
+                    raise ValueError(f"Expected a JSON array, got {char!r}")
+                self.started = True
+                self.position += 1
+            elif char == "]":
+                # Closes the array unless it follows a comma, as in [1,]
+                if self.expect_item and not self.empty:
+                    raise ValueError("Expected an array item after ',', got ']'")
+                self.finished = True
+                self.position += 1
+            elif char == ",":
+                if self.expect_item:
+                    raise ValueError("Expected an array item, got ','")
+                self.expect_item = True
+                self.position += 1
+            elif not self.expect_item:
+                raise ValueError(f"Expected ',' or ']' after an array item, got {char!r}")
+            else:
+                try:
+                    item, end = _decoder.raw_decode(self.buffer, self.position)
+                except json.JSONDecodeError:
+                    if final:
+                        raise ValueError("Truncated or malformed JSON array") from None
+                    break
+                # A bare number or literal at the very end may still be incomplete
+                if end == len(self.buffer) and not final and not isinstance(item, (dict, list, str)):
+                    break
+                items.append(item)
+                self.position = end
+                self.expect_item = False
+                self.empty = False
+        if self.finished:
+            # Only whitespace may follow the closing bracket
+            self._skip_whitespace()
+            if self.position < len(self.buffer):
+                raise ValueError(f"Unexpected data after the JSON array: {self.buffer[self.position]!r}")
+        if final and not self.finished:
+            raise ValueError("Truncated JSON array")
+        if self.position > _COMPACT_THRESHOLD:
+            self.buffer = self.buffer[self.position:]
+            self.position = 0
+        return items
+
+    def _skip_whitespace(self):
+        while self.position < len(self.buffer) and self.buffer[self.position] in _WHITESPACE:
+            self.position += 1
@@ -1,14 +1,16 @@
-import httpx
+from endpoints.base_api import BaseAPI
+from endpoints.bulk import DEFAULT_CONCURRENCY, run_bulk
+from endpoints.polling import DEFAULT_TIMEOUT, wait_until
 
 
-class UserAPI:
+class UserAPI(BaseAPI):
     """
     Client for interacting with the Pet Store API's /user endpoint.
     This class encapsulates all HTTP requests related to user management
     (create, read, update, delete).
     """
 
-    def __init__(self, base_url=None):
+    def __init__(self, base_url=None, **client_options):
         """
         Initializes the UserAPI client.
 
@@ -16,9 +18,10 @@ class UserAPI:
             base_url (str, optional): The base URL of the Pet Store API.
                                       Defaults to "https://petstore.swagger.io/v2"
                                       if not provided.
+            **client_options: Connection pool and timeout settings forwarded
+                              to `BaseAPI` (e.g. `timeout`, `max_connections`).
         """
-        # Set the base URL for API requests, defaulting to the Pet Store URL
-        self.base_url = base_url or "https://petstore.swagger.io/v2"
+        super().__init__(base_url, **client_options)
         # Construct the specific endpoint URL for user operations
         self.user_endpoint = f"{self.base_url}/user"
 
@@ -39,7 +42,8 @@ class UserAPI:
             "accept": "application/json"         # Indicates that the client expects a JSON response
         }
         # Send the POST request with the user data as JSON
-        response = httpx.post(self.user_endpoint, json=user_data, headers=headers)
+        response = self._request("POST", self.user_endpoint, "POST /user", json=user_data, headers=headers)
+        self._invalidate(f"{self.user_endpoint}/{user_data.get('username')}")
         return response
 
     def update_user_by_username(self, username, updated_user_data):
@@ -61,25 +65,51 @@ class UserAPI:
         # Construct the URL for updating a specific user by username
         url = f"{self.user_endpoint}/{username}"
         # Send the PUT request with the updated user data as JSON
-        response = httpx.put(url, json=updated_user_data, headers=headers)
+        response = self._request("PUT", url, "PUT /user/{username}", json=updated_user_data, headers=headers)
+        self._invalidate(url, f"{self.user_endpoint}/{updated_user_data.get('username', username)}")
         return response
 
-    def get_user_by_username(self, username):
+    def get_user_by_username(self, username, use_cache=True):
         """
         Sends a GET request to retrieve a user by their username.
 
         Args:
             username (str): The username of the user to retrieve.
+            use_cache (bool, optional): Serve the response from the client's
+                                        cache, if one is configured.
 
         Returns:
             httpx.Response: The response object from the API.
         """
         # Construct the URL for fetching a specific user by username
         url = f"{self.user_endpoint}/{username}"
-        # Send the GET request
-        response = httpx.get(url)
+        # Send the GET request (possibly served from the cache)
+        response = self._get(url, "GET /user/{username}", use_cache=use_cache)
         return response
 
+    def wait_for_user(self, username, condition=None, timeout=DEFAULT_TIMEOUT):
+        """
+        Polls a user by username until it reaches the expected state.
+
+        Absorbs the Pet Store's read-after-write lag: the first GET is sent
+        immediately, later ones back off exponentially (with jitter) until
+        `condition` holds or `timeout` seconds pass. The time to converge is
+        recorded in `endpoints.polling.convergence_stats`.
+
+        Args:
+            username (str): The username of the user to poll.
+            condition (callable, optional): Takes the `httpx.Response` and returns
+                                            True once converged. Defaults to the
+                                            user being found (status 200).
+            timeout (float, optional): Overall deadline in seconds.
+
+        Returns:
+            PollResult: The last response (`.value`) and convergence details.
+        """
+        condition = condition or (lambda response: response.status_code == 200)
+        return wait_until(lambda: self.get_user_by_username(username, use_cache=False), condition, timeout,
+                          label="GET /user/{username}")
+
     def delete_user(self, username):
         """
         Sends a DELETE request to remove a user by their username.
@@ -93,5 +123,32 @@ class UserAPI:
         # Construct the URL for deleting a specific user by username
         url = f"{self.user_endpoint}/{username}"
         # Send the DELETE request
-        response = httpx.delete(url)
+        response = self._request("DELETE", url, "DELETE /user/{username}")
+        self._invalidate(url)
         return response
+
+    def create_users_bulk(self, users_data, concurrency=DEFAULT_CONCURRENCY):
+        """
+        Creates many users concurrently, streaming back each result as it finishes.
+
+        Args:
+            users_data (iterable[dict]): The user payloads to create.
+            concurrency (int, optional): Maximum number of requests in flight.
+
+        Returns:
+            Iterator[BulkResult]: A lazy iterator of per-user results, including failures.
+        """
+        return run_bulk(self.create_user, users_data, concurrency)
+
+    def delete_users_bulk(self, usernames, concurrency=DEFAULT_CONCURRENCY):
+        """
+        Deletes many users concurrently, streaming back each result as it finishes.
+
+        Args:
+            usernames (iterable[str]): The usernames of the users to delete.
+            concurrency (int, optional): Maximum number of requests in flight.
+
+        Returns:
+            Iterator[BulkResult]: A lazy iterator of per-user results, including failures.
+        """
+        return run_bulk(self.delete_user, usernames, concurrency)
@@ -1,8 +1,66 @@
+from dataclasses import dataclass
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support.ui import Select
+from pages.element_cache import ElementCache, page_mutated
+from pages.waits import ObserverWait, RecordedWebDriverWait, count_visible, script_locator
+
+# Reads the given fields of every element matching a locator in one round trip.
+# Returns null (so that the caller's wait polls again) until there is at least
+# one match, every match is visible and every relative field locator matches.
+_EXTRACT_SCRIPT = """
+const [strategy, query, fields] = arguments;
+function findAll(context, strategy, query) {
+    if (strategy === 'xpath') {
+        const result = document.evaluate(query, context, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        return Array.from({length: result.snapshotLength}, (_, index) => result.snapshotItem(index));
+    }
+    return Array.from(context.querySelectorAll(query));
+}
+function visible(element) {
+    const style = window.getComputedStyle(element);
+    return element.getClientRects().length > 0 && style.visibility !== 'hidden' && style.opacity !== '0';
+}
+function read(element, spec) {
+    if (spec.query) {
+        element = findAll(element, spec.strategy, spec.query)[0];
+        if (!element) return undefined;
+    }
+    if (spec.kind === 'element') return element;
+    if (spec.kind === 'attribute') return element.getAttribute(spec.name);
+    return element.innerText.trim();
+}
+const elements = findAll(document, strategy, query);
+if (!elements.length || !elements.every(visible)) return null;
+const rows = [];
+for (const element of elements) {
+    const row = {};
+    for (const [key, spec] of fields) {
+        const value = read(element, spec);
+        if (value === undefined) return null;
+        row[key] = value;
+    }
+    rows.push(row);
+}
+return rows;
+"""
+
+
+@dataclass(frozen=True)
+class PageSettings:
+    """
+    How page objects locate and wait for elements. Pages created while
+    navigating (e.g. by `click_shopping_cart_icon()`) inherit the settings
+    of the page that created them.
+
+    Attributes:
+        cache_elements (bool): Reuse elements located earlier on an unchanged page (UI_ELEMENT_CACHE).
+        observer_waits (bool): Block in the page on a MutationObserver instead of polling (UI_OBSERVER_WAITS).
+    """
+    cache_elements: bool = False
+    observer_waits: bool = False
 
 
 class BasePage:
@@ -25,16 +83,31 @@ class BasePage:
     BURGER_MENU_RESET = (By.ID, "reset_sidebar_link")
     BURGER_MENU_CLOSE = (By.ID, "react-burger-cross-btn")
 
-    def __init__(self, driver):
+    # Seconds an absence check waits for an element to go away; checks of
+    # things that should not be there resolve in milliseconds instead of
+    # waiting out the 10-second timeout of positive checks
+    ABSENCE_TIMEOUT = 2
+
+    # Field specs for extract_all(); "@name" reads an attribute
+    TEXT = "text"
+    ELEMENT = "element"
+
+    def __init__(self, driver, settings=None):
         """
         Initializes the BasePage with a WebDriver instance.
 
         Args:
             driver: The Selenium WebDriver instance.
+            settings (PageSettings, optional): Element caching and wait settings;
+                                               both are off by default.
         """
         self.driver = driver
+        self.settings = settings or PageSettings()
         # Initialize WebDriverWait with a 10-second timeout for explicit waits
-        self.wait = WebDriverWait(driver, 10)
+        self.wait = RecordedWebDriverWait(driver, 10)
+        # Visibility, clickability and URL waits that return as soon as the page is ready
+        self.observer_wait = ObserverWait(driver, 10) if self.settings.observer_waits else None
+        self.element_cache = ElementCache(driver, type(self).__name__) if self.settings.cache_elements else None
 
     def open_url(self, url):
         """
@@ -43,11 +116,21 @@ class BasePage:
         Args:
             url (str): The URL to open.
         """
+        self.page_mutated()
         self.driver.get(url)
 
+    def page_mutated(self):
+        """
+        Signals that the page changed in a way the page objects cannot see
+        (e.g. a raw element click or script), so no cached element is reused.
+        """
+        page_mutated(self.driver)
+
     def find_element(self, locator):
         """
         Waits for and returns a single element to be visible on the page.
+        With the element cache enabled, an element located earlier on the
+        unchanged page is returned without another lookup.
 
         Args:
             locator (tuple): A tuple containing the locator strategy (e.g., By.ID)
@@ -56,7 +139,43 @@ class BasePage:
         Returns:
             WebElement: The found web element.
         """
-        return self.wait.until(EC.visibility_of_element_located(locator))
+        return self._locate(locator)[0]
+
+    def _locate(self, locator):
+        """
+        Returns the element for a locator and whether it came from the cache.
+        """
+        if self.element_cache is not None:
+            element = self.element_cache.get(locator)
+            if element is not None:
+                return element, True
+        if self.observer_wait is not None:
+            element = self.observer_wait.until_visible(locator)
+        else:
+            element = self.wait.until(EC.visibility_of_element_located(locator))
+        if self.element_cache is not None:
+            self.element_cache.put(locator, element)
+        return element, False
+
+    def _with_element(self, locator, action, accept=lambda result: True):
+        """
+        Applies `action` to the element for a locator. If a cached element has
+        gone stale, or its result is not accepted (e.g. it is hidden by now),
+        it is dropped and the element is looked up and waited for again.
+        """
+        element, cached = self._locate(locator)
+        try:
+            result = action(element)
+        except StaleElementReferenceException:
+            if not cached:
+                raise
+            result, accepted = None, False
+        else:
+            accepted = accept(result)
+        if cached and not accepted:
+            self.element_cache.forget(locator)
+            result = action(self.find_element(locator))
+        return result
 
     def find_elements(self, locator):
         """
@@ -70,6 +189,38 @@ class BasePage:
         """
         return self.wait.until(EC.visibility_of_all_elements_located(locator))
 
+    def extract_all(self, locator, fields=TEXT):
+        """
+        Waits for all elements matching a locator to be visible and reads the
+        requested fields of every one of them in a single WebDriver call,
+        instead of one call per element and attribute.
+
+        A field spec is `TEXT` (the element's visible text), "@name" (the
+        value of attribute `name`), `ELEMENT` (the WebElement itself, e.g. to
+        click it afterwards) or a locator relative to the element, optionally
+        followed by one of the former, e.g. `(By.CLASS_NAME, "inventory_item_price")`
+        or `(By.XPATH, ".//a", "@href")`.
+
+        Args:
+            locator (tuple): A tuple containing the locator strategy and value.
+            fields (str | tuple | dict, optional): One field spec, or a dict
+                                                   mapping result keys to field specs.
+
+        Returns:
+            list: One value per element for a single field spec, or one dict
+                  per element for a dict of field specs.
+        """
+        single = not isinstance(fields, dict)
+        specs = [[key, _field_spec(spec)] for key, spec in ({"value": fields} if single else fields).items()]
+        rows = self.wait.until(lambda driver: driver.execute_script(_EXTRACT_SCRIPT, *script_locator(locator), specs))
+        return [row["value"] for row in rows] if single else rows
+
+    def extract_one(self, locator, fields=TEXT):
+        """
+        Like `extract_all()`, for the first element matching the locator.
+        """
+        return self.extract_all(locator, fields)[0]
+
     def click_element(self, locator):
         """
         Waits for an element to be clickable and then clicks it.
@@ -77,7 +228,11 @@ class BasePage:
         Args:
             locator (tuple): A tuple containing the locator strategy and value.
         """
-        self.wait.until(EC.element_to_be_clickable(locator)).click()
+        if self.observer_wait is not None:
+            self.observer_wait.until_clickable(locator).click()
+        else:
+            self.wait.until(EC.element_to_be_clickable(locator)).click()
+        self.page_mutated()
 
     def enter_text(self, locator, text):
         """
@@ -87,9 +242,12 @@ class BasePage:
             locator (tuple): A tuple containing the locator strategy and value.
             text (str): The text to be entered into the element.
         """
-        element = self.find_element(locator)
-        element.clear()
-        element.send_keys(text)
+        def type_text(element):
+            element.clear()
+            element.send_keys(text)
+
+        self._with_element(locator, type_text)
+        self.page_mutated()
 
     def get_element_text(self, element_or_locator) -> str:
         """
@@ -104,25 +262,115 @@ class BasePage:
         if isinstance(element_or_locator, WebElement):
             return element_or_locator.text
         elif isinstance(element_or_locator, tuple) and len(element_or_locator) == 2:
-            element = self.find_element(element_or_locator)
-            return element.text
+            # A cached element without text is most likely hidden now
+            return self._with_element(element_or_locator, lambda element: element.text, accept=bool)
 
-    def is_element_displayed(self, locator):
+    def is_element_displayed(self, locator, timeout=None):
         """
         Checks if an element is displayed on the page without failing the test
         if the element is not found.
 
+        Note that a missing element is only reported after waiting out the
+        timeout; use `is_absent()` or `is_present_now()` for elements that
+        are expected not to be there.
+
         Args:
             locator (tuple): A tuple containing the locator strategy and value.
+            timeout (float, optional): Seconds to wait for the element; defaults to the
+                                       page's 10-second wait, 0 checks only once.
 
         Returns:
             bool: True if the element is displayed, False otherwise.
         """
+        if timeout == 0:
+            return self.is_present_now(locator)
+        if timeout is not None:
+            try:
+                if self.observer_wait is not None:
+                    ObserverWait(self.driver, timeout).until_visible(locator)
+                else:
+                    RecordedWebDriverWait(self.driver, timeout).until(EC.visibility_of_element_located(locator))
+                return True
+            except TimeoutException:
+                return False
         try:
-            return self.find_element(locator).is_displayed()
+            return self._with_element(locator, lambda element: element.is_displayed(), accept=bool)
         except:
             return False
 
+    def is_present_now(self, locator):
+        """
+        Checks in a single WebDriver call, without any waiting, whether an
+        element matching the locator is visible at this moment.
+
+        Args:
+            locator (tuple): A tuple containing the locator strategy and value.
+
+        Returns:
+            bool: True if at least one matching element is visible.
+        """
+        return self.count_present_now(locator) > 0
+
+    def count_present_now(self, locator):
+        """
+        Counts the visible elements matching a locator at this moment, in a
+        single WebDriver call and without waiting for any to appear.
+
+        Args:
+            locator (tuple): A tuple containing the locator strategy and value.
+
+        Returns:
+            int: The number of visible matching elements.
+        """
+        return count_visible(self.driver, locator)
+
+    def is_absent(self, locator, timeout=None):
+        """
+        Checks that no element matching a locator is visible, waiting briefly
+        for one that is still going away (e.g. a button replaced after a click).
+        Returns as soon as nothing matches, typically within milliseconds.
+
+        Args:
+            locator (tuple): A tuple containing the locator strategy and value.
+            timeout (float, optional): Seconds to wait for the element to go away;
+                                       defaults to ABSENCE_TIMEOUT, 0 checks only once.
+
+        Returns:
+            bool: True if no matching element is visible, False if one still is.
+        """
+        timeout = self.ABSENCE_TIMEOUT if timeout is None else timeout
+        if not self.is_present_now(locator):
+            return True
+        if timeout <= 0:
+            return False
+        try:
+            if self.observer_wait is not None:
+                ObserverWait(self.driver, timeout).until_absent(locator)
+            else:
+                RecordedWebDriverWait(self.driver, timeout).until(
+                    lambda driver: count_visible(driver, locator) == 0
+                )
+            return True
+        except TimeoutException:
+            return False
+
+    def assert_absent(self, locator, timeout=None, message=None):
+        """
+        Asserts that no element matching a locator is visible, as `is_absent()`.
+
+        Args:
+            locator (tuple): A tuple containing the locator strategy and value.
+            timeout (float, optional): Seconds to wait for the element to go away;
+                                       defaults to ABSENCE_TIMEOUT.
+            message (str, optional): The assertion message.
+
+        Raises:
+            AssertionError: If a matching element is still visible after the timeout.
+        """
+        timeout = self.ABSENCE_TIMEOUT if timeout is None else timeout
+        assert self.is_absent(locator, timeout), \
+            message or f"Expected {locator} to be absent, but it was still visible after {timeout}s."
+
     def wait_for_url(self, expected_url):
         """
         Waits for the browser's current URL to match the expected URL.
@@ -130,7 +378,10 @@ class BasePage:
         Args:
             expected_url (str): The URL to wait for.
         """
-        self.wait.until(EC.url_to_be(expected_url))
+        if self.observer_wait is not None:
+            self.observer_wait.until_url(expected_url)
+        else:
+            self.wait.until(EC.url_to_be(expected_url))
 
     def get_current_url(self):
         """
@@ -151,21 +402,32 @@ class BasePage:
         """
         from pages.cart_page import CartPage
         self.click_element(self.SHOPPING_CART_ICON)
-        return CartPage(self.driver)
+        return CartPage(self.driver, self.settings)
 
     def get_shopping_cart_badge_count(self):
         """
-        Retrieves the number of items in the shopping cart from the badge icon.
+        Retrieves the number of items in the shopping cart from the badge icon,
+        waiting for the badge to appear (e.g. right after adding a product).
+        Use `is_shopping_cart_badge_absent()` to check that the cart is empty.
 
         Returns:
             int: The number of items, or 0 if the badge is not present.
         """
         try:
-            badge_element = self.find_element(self.SHOPPING_CART_BADGE)
-            return int(badge_element.text)
+            return int(self._with_element(self.SHOPPING_CART_BADGE, lambda element: element.text, accept=bool))
         except:
             return 0
 
+    def is_shopping_cart_badge_absent(self):
+        """
+        Checks that the shopping cart badge is gone, i.e. the cart is empty,
+        without waiting out the full timeout when it is (e.g. after a reset).
+
+        Returns:
+            bool: True if the badge is not visible, False otherwise.
+        """
+        return self.is_absent(self.SHOPPING_CART_BADGE)
+
     def select_by_value(self, locator, value):
         """
         Selects an option from a dropdown element by its value attribute.
@@ -174,9 +436,8 @@ class BasePage:
             locator (tuple): The locator for the dropdown element.
             value (str): The value of the option to select.
         """
-        select_element = self.find_element(locator)
-        select = Select(select_element)
-        select.select_by_value(value)
+        self._with_element(locator, lambda element: Select(element).select_by_value(value))
+        self.page_mutated()
 
     def click_burger_menu(self):
         """
@@ -194,7 +455,7 @@ class BasePage:
         """
         from pages.login_page import LoginPage
         self.click_element(self.BURGER_LOGOUT)
-        return LoginPage(self.driver)
+        return LoginPage(self.driver, self.settings)
 
     def click_burger_menu_reset(self):
         """
@@ -214,4 +475,22 @@ class BasePage:
         Returns:
             WebElement: The found web element.
         """
-        return WebDriverWait(self.driver, 10).until(EC.visibility_of_element_located(locator))
\ No newline at end of file
+        if self.observer_wait is not None:
+            return self.observer_wait.until_visible(locator)
+        return RecordedWebDriverWait(self.driver, 10).until(EC.visibility_of_element_located(locator))
+
+
+def _field_spec(spec):
+    """
+    Translates a field spec of `BasePage.extract_all()` for the extraction script.
+    """
+    if spec == BasePage.TEXT:
+        return {"kind": "text"}
+    if spec == BasePage.ELEMENT:
+        return {"kind": "element"}
+    if isinstance(spec, str) and spec.startswith("@"):
+        return {"kind": "attribute", "name": spec[1:]}
+    if isinstance(spec, tuple) and len(spec) in (2, 3):
+        strategy, query = script_locator(spec[:2])
+        return {**_field_spec(spec[2] if len(spec) == 3 else BasePage.TEXT), "strategy": strategy, "query": query}
+    raise ValueError(f"Unsupported field spec: {spec!r}")
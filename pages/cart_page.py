@@ -26,12 +26,12 @@ class CartPage(BasePage):
     PRODUCT_NAME_FROM_ADDED_PRODUCTS = (By.XPATH, "./ancestor::div[@class='cart_item_label']//div["
                                                   "@class='inventory_item_name']")
 
-    def __init__(self, driver):
+    def __init__(self, driver, settings=None):
         """
         Initializes the CartPage with the WebDriver instance.
         Calls the parent class's constructor to set up the driver and wait.
         """
-        super().__init__(driver)
+        super().__init__(driver, settings)
 
     def is_cart_page_displayed(self):
         """
@@ -55,6 +55,19 @@ class CartPage(BasePage):
         locator = self.CART_ITEM_NAME_BY_TEXT(item_name)
         return self.is_element_displayed(locator)
 
+    def is_item_absent_from_cart(self, item_name):
+        """
+        Checks that an item is no longer in the cart, e.g. after removing it,
+        without waiting out the full timeout when it is gone.
+
+        Args:
+            item_name (str): The name of the item to check for.
+
+        Returns:
+            bool: True if the item is not shown in the cart, False otherwise.
+        """
+        return self.is_absent(self.CART_ITEM_NAME_BY_TEXT(item_name))
+
     def remove_random_item_from_cart(self):
         """
         Selects a random "Remove" button and clicks it to remove an item from the cart.
@@ -63,16 +76,17 @@ class CartPage(BasePage):
         Returns:
             str: The name of the product that was removed.
         """
-        # Find all "Remove" buttons
-        all_remove_buttons = self.find_elements(self.REMOVE_CART_BUTTONS)
+        # Find all "Remove" buttons with the names of their products in one call
+        all_remove_buttons = self.extract_all(self.REMOVE_CART_BUTTONS, {
+            "button": self.ELEMENT,
+            "name": self.PRODUCT_NAME_FROM_ADDED_PRODUCTS,
+        })
         # Select a random button from the list
         random_remove_button = random.choice(all_remove_buttons)
-        # Find the product name associated with the random button
-        removed_product = random_remove_button.find_element(*self.PRODUCT_NAME_FROM_ADDED_PRODUCTS)
-        removed_product_name = removed_product.text
         # Click the randomly selected remove button
-        random_remove_button.click()
-        return removed_product_name
+        random_remove_button["button"].click()
+        self.page_mutated()
+        return random_remove_button["name"]
 
     def get_cart_items_names(self):
         """
@@ -81,14 +95,8 @@ class CartPage(BasePage):
         Returns:
             list: A list of strings, where each string is the name of a product.
         """
-        added_products_names = []
-        # Find all elements with the class 'inventory_item_name'
-        added_products_list = self.find_elements(self.ADDED_PRODUCTS)
-        for product in added_products_list:
-            # Get the text (name) of each product
-            name = self.get_element_text(product)
-            added_products_names.append(name)
-        return added_products_names
+        # Read the text of all elements with the class 'inventory_item_name' in one call
+        return self.extract_all(self.ADDED_PRODUCTS)
 
     def click_checkout_button(self):
         """
@@ -101,4 +109,4 @@ class CartPage(BasePage):
         self.click_element(self.CHECKOUT_BUTTON)
         # It's good practice to assert the state change within the page object itself
         assert self.get_current_url() == "https://www.saucedemo.com/checkout-step-one.html"
-        return CheckoutPageOne(self.driver)
\ No newline at end of file
+        return CheckoutPageOne(self.driver, self.settings)
\ No newline at end of file
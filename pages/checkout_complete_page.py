@@ -13,12 +13,12 @@ class CheckoutComplete(BasePage):
     # Locators for elements on the Checkout Complete page
     THANK_YOU_TEXT = (By.CLASS_NAME, "complete-header")
 
-    def __init__(self, driver):
+    def __init__(self, driver, settings=None):
         """
         Initializes the CheckoutComplete Page Object with the WebDriver instance.
         Calls the parent class's constructor to set up the driver and waits.
         """
-        super().__init__(driver)
+        super().__init__(driver, settings)
 
     def is_thank_you_displayed(self):
         """
@@ -19,12 +19,12 @@ class CheckoutPageOne(BasePage):
     CONTINUE_BUTTON = (By.ID, "continue")
     ERROR_MESSAGE_BUTTON = (By.XPATH, "//h3[@data-test='error']")
 
-    def __init__(self, driver):
+    def __init__(self, driver, settings=None):
         """
         Initializes the CheckoutPageOne Page Object with the WebDriver instance.
         Calls the parent class's constructor to set up the driver and waits.
         """
-        super().__init__(driver)
+        super().__init__(driver, settings)
 
     def generate_checkout_data(self) -> dict:
         """
@@ -89,7 +89,7 @@ class CheckoutPageOne(BasePage):
             return self
         else:
             # Otherwise, return the next page object
-            return CheckoutPageTwo(self.driver)
+            return CheckoutPageTwo(self.driver, self.settings)
 
     def is_error_message_displayed(self):
         """
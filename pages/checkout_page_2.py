@@ -18,12 +18,12 @@ class CheckoutPageTwo(BasePage):
     TOTAL = (By.CLASS_NAME, "summary_total_label")
     FINISH_BUTTON = (By.ID, "finish")
 
-    def __init__(self, driver):
+    def __init__(self, driver, settings=None):
         """
         Initializes the CheckoutPageTwo Page Object with the WebDriver instance.
         Calls the parent class's constructor to set up the driver and waits.
         """
-        super().__init__(driver)
+        super().__init__(driver, settings)
 
     def get_item_total(self):
         """
@@ -79,4 +79,4 @@ class CheckoutPageTwo(BasePage):
         self.click_element(self.FINISH_BUTTON)
         # It's good practice to assert the URL change within the page object
         assert self.get_current_url() == "https://www.saucedemo.com/checkout-complete.html"
-        return CheckoutComplete(self.driver)
\ No newline at end of file
+        return CheckoutComplete(self.driver, self.settings)
\ No newline at end of file
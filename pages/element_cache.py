@@ -0,0 +1,124 @@
+import threading
+import weakref
+
+# Mutation counter per browser; any page that changes the page bumps it, so
+# the elements cached by every page object on that browser are dropped
+_generations = weakref.WeakKeyDictionary()
+_generations_lock = threading.Lock()
+
+
+def page_mutated(driver):
+    """
+    Signals that the page shown by `driver` changed (navigation, a click, typed
+    text), invalidating the elements cached by all page objects using it.
+    """
+    with _generations_lock:
+        _generations[driver] = _generations.get(driver, 0) + 1
+
+
+def _generation(driver):
+    with _generations_lock:
+        return _generations.get(driver, 0)
+
+
+class ElementCache:
+    """
+    The elements a page object has already located, keyed by locator.
+
+    An entry is only served while the page has not changed since it was
+    stored: `page_mutated()` (called by BasePage for navigation and every
+    interaction) invalidates all of them at once, and an element that turns
+    out to be stale is dropped with `forget()`.
+    """
+
+    def __init__(self, driver, label):
+        """
+        Args:
+            driver: The WebDriver the page object uses.
+            label (str): The name hits and misses are reported under, e.g. "ProductsPage".
+        """
+        self.driver = driver
+        self.label = label
+        self._elements = {}
+        self._generation = _generation(driver)
+
+    def get(self, locator):
+        """
+        Returns the cached element for a locator, or None on a miss.
+        """
+        generation = _generation(self.driver)
+        if generation != self._generation:
+            if self._elements:
+                element_cache_stats.record(self.label, "invalidations")
+            self._elements.clear()
+            self._generation = generation
+        element = self._elements.get(locator)
+        element_cache_stats.record(self.label, "hits" if element is not None else "misses")
+        return element
+
+    def put(self, locator, element):
+        """
+        Stores the element located for a locator.
+        """
+        self._elements[locator] = element
+
+    def forget(self, locator):
+        """
+        Drops an element that went stale or no longer matches.
+        """
+        if self._elements.pop(locator, None) is not None:
+            element_cache_stats.record(self.label, "stale")
+
+
+class ElementCacheStats:
+    """
+    Thread-safe hit, miss, stale and invalidation counts, grouped by page.
+    """
+
+    KEYS = ("hits", "misses", "stale", "invalidations")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._totals = {}
+
+    def record(self, label, key):
+        """
+        Counts one lookup outcome (`key` is one of KEYS) for the page `label`.
+        """
+        with self._lock:
+            totals = self._totals.setdefault(label, dict.fromkeys(self.KEYS, 0))
+            totals[key] += 1
+
+    def dump(self):
+        """
+        Returns the raw per-page counts, e.g. to send them from a parallel worker.
+        """
+        with self._lock:
+            return {label: dict(totals) for label, totals in self._totals.items()}
+
+    def merge(self, dumped):
+        """
+        Adds counts produced by `dump()` (e.g. in a parallel worker) to this record.
+        """
+        with self._lock:
+            for label, theirs in dumped.items():
+                mine = self._totals.setdefault(label, dict.fromkeys(self.KEYS, 0))
+                for key in self.KEYS:
+                    mine[key] += theirs[key]
+
+    def summary(self):
+        """
+        Returns the per-page counts with their hit rate ("hit_rate", 0.0 to 1.0).
+        """
+        return {
+            label: {**totals, "hit_rate": totals["hits"] / max(totals["hits"] + totals["misses"], 1)}
+            for label, totals in self.dump().items()
+        }
+
+    def clear(self):
+        with self._lock:
+            self._totals.clear()
+
+
+# Shared record of every cached lookup made in this process
+element_cache_stats = ElementCacheStats()
@@ -1,5 +1,9 @@
+from urllib.parse import urljoin
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
 from pages.base_page import BasePage
+from pages.waits import ObserverWait, RecordedWebDriverWait
 
 
 class LoginPage(BasePage):
@@ -16,13 +20,18 @@ class LoginPage(BasePage):
     LOGIN_BUTTON = (By.ID, "login-button")
     ERROR_MESSAGE = (By.XPATH, "//h3[@data-test='error']")
     LOGIN_BOX = (By.CLASS_NAME, "login-box")
+    INVENTORY_CONTAINER = (By.ID, "inventory_container")
 
-    def __init__(self, driver):
+    # SauceDemo keeps the logged-in user in this cookie; the app trusts it as is
+    SESSION_COOKIE = "session-username"
+    INVENTORY_PATH = "inventory.html"
+
+    def __init__(self, driver, settings=None):
         """
         Initializes the LoginPage with the WebDriver instance.
         Calls the parent class's constructor to set up the driver and waits.
         """
-        super().__init__(driver)
+        super().__init__(driver, settings)
 
     def login(self, username, password):
         """
@@ -55,4 +64,50 @@ class LoginPage(BasePage):
         Returns:
             bool: True if the login box is visible, False otherwise.
         """
-        return self.is_element_displayed(self.LOGIN_BOX)
\ No newline at end of file
+        return self.is_element_displayed(self.LOGIN_BOX)
+
+    def login_with_session_cookie(self, base_url, username):
+        """
+        Logs in without the form by setting SauceDemo's session cookie and
+        opening the inventory page directly.
+
+        Args:
+            base_url (str): The SauceDemo base URL (the cookie is set for its domain).
+            username (str): The user to log in as.
+
+        Returns:
+            bool: True if the inventory page was shown, False if the app rejected the session.
+        """
+        # Cookies can only be set for the domain of the page currently loaded
+        if not self.get_current_url().startswith(base_url):
+            self.open_url(base_url)
+        self.driver.add_cookie({"name": self.SESSION_COOKIE, "value": username, "path": "/"})
+        self.open_url(urljoin(base_url, self.INVENTORY_PATH))
+        try:
+            if self.observer_wait is not None:
+                ObserverWait(self.driver, 3).until_visible(self.INVENTORY_CONTAINER)
+            else:
+                RecordedWebDriverWait(self.driver, 3).until(EC.visibility_of_element_located(self.INVENTORY_CONTAINER))
+        except TimeoutException:
+            return False
+        return True
+
+    def fast_login(self, base_url, username, password):
+        """
+        Logs in through the session cookie, falling back to the login form if
+        the cookie is not accepted.
+
+        Args:
+            base_url (str): The SauceDemo base URL.
+            username (str): The username to log in with.
+            password (str): The password, used only by the form fallback.
+
+        Returns:
+            str: "cookie" or "form", depending on which path logged the user in.
+        """
+        if self.login_with_session_cookie(base_url, username):
+            return "cookie"
+        self.driver.delete_all_cookies()
+        self.open_url(base_url)
+        self.login(username, password)
+        return "form"
@@ -17,13 +17,14 @@ class ProductDetailsPage(BasePage):
     PRODUCT_PRICE = (By.CLASS_NAME, "inventory_details_price")
     ADD_TO_CART_BUTTON = (By.ID, "add-to-cart")
     BACK_BUTTON = (By.ID, "back-to-products")
+    PAGE_BODY = (By.TAG_NAME, "body")
 
-    def __init__(self, driver):
+    def __init__(self, driver, settings=None):
         """
         Initializes the ProductDetailsPage Page Object with the WebDriver instance.
         Calls the parent class's constructor to set up the driver and waits.
         """
-        super().__init__(driver)
+        super().__init__(driver, settings)
 
     def get_product_name(self):
         """
@@ -62,11 +63,12 @@ class ProductDetailsPage(BasePage):
             dict: A dictionary containing the product's 'name', 'description',
                   and 'price'.
         """
-        return {
-            "name": self.get_product_name(),
-            "description": self.get_product_description(),
-            "price": self.get_product_price()
-        }
+        # The locators are absolute, so they are all read relative to the page body in one call
+        return self.extract_one(self.PAGE_BODY, {
+            "name": self.PRODUCT_NAME,
+            "description": self.PRODUCT_DESCRIPTION,
+            "price": self.PRODUCT_PRICE
+        })
 
     def click_back_to_products_button(self):
         """
@@ -77,4 +79,4 @@ class ProductDetailsPage(BasePage):
             ProductsPage: A new instance of the ProductsPage class.
         """
         self.click_element(self.BACK_BUTTON)
-        return ProductsPage(self.driver)
\ No newline at end of file
+        return ProductsPage(self.driver, self.settings)
\ No newline at end of file
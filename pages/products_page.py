@@ -1,5 +1,6 @@
 import random
 import re
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from pages.base_page import BasePage
 
@@ -32,11 +33,11 @@ class ProductsPage(BasePage):
     PRODUCT_DESCRIPTION_FROM_FATHER = (By.XPATH, ".//div[@class='inventory_item_desc']")
     PRODUCT_PRICE_FROM_FATHER = (By.XPATH, ".//div[@class='inventory_item_price']")
 
-    def __init__(self, driver):
+    def __init__(self, driver, settings=None):
         """
         Initializes the ProductsPage with the WebDriver instance.
         """
-        super().__init__(driver)
+        super().__init__(driver, settings)
 
     def is_products_page_displayed(self):
         """
@@ -71,6 +72,32 @@ class ProductsPage(BasePage):
         """
         return self.is_element_displayed(self.ADD_BACKPACK)
 
+    def is_add_backpack_button_absent(self):
+        """
+        Checks that the "Add to cart" button for the backpack is gone, without
+        waiting out the full timeout when it is (e.g. right after adding the backpack).
+
+        Returns:
+            bool: True if the button is not visible, False otherwise.
+        """
+        return self.is_absent(self.ADD_BACKPACK)
+
+    def are_product_images_loaded(self):
+        """
+        Checks that every product image has been downloaded and decoded. Tests
+        using it must be marked `load_resources`, as images may be blocked.
+
+        Returns:
+            bool: True if all product images loaded, False otherwise.
+        """
+        images = self.find_elements(self.ALL_PRODUCT_IMAGES)
+        try:
+            return self.wait.until(lambda driver: driver.execute_script(
+                "return arguments[0].every(image => image.complete && image.naturalWidth > 0);", images
+            ))
+        except TimeoutException:
+            return False
+
     def is_remove_backpack_button_displayed(self):
         """
         Checks if the "Remove" button for the backpack is displayed.
@@ -90,20 +117,19 @@ class ProductsPage(BasePage):
                    and a new instance of the ProductDetailsPage.
         """
         from pages.product_details_page import ProductDetailsPage
-        products_list = self.find_elements(self.PRODUCT_INFO_FATHER)
-        random_product = random.choice(products_list)
-        # Find elements relative to the chosen product's container
-        name_element = random_product.find_element(*self.PRODUCT_NAME_FROM_FATHER)
-        desc_element = random_product.find_element(*self.PRODUCT_DESCRIPTION_FROM_FATHER)
-        price_element = random_product.find_element(*self.PRODUCT_PRICE_FROM_FATHER)
-        product_data = {
-            "name": name_element.text,
-            "description": desc_element.text,
-            "price": price_element.text
-        }
+        # Read every product's details (and its name element) in one call
+        products = self.extract_all(self.PRODUCT_INFO_FATHER, {
+            "name": self.PRODUCT_NAME_FROM_FATHER,
+            "description": self.PRODUCT_DESCRIPTION_FROM_FATHER,
+            "price": self.PRODUCT_PRICE_FROM_FATHER,
+            "link": (*self.PRODUCT_NAME_FROM_FATHER, self.ELEMENT),
+        })
+        random_product = random.choice(products)
+        product_data = {key: random_product[key] for key in ("name", "description", "price")}
         # Click the product name to navigate
-        name_element.click()
-        return product_data, ProductDetailsPage(self.driver)
+        random_product["link"].click()
+        self.page_mutated()
+        return product_data, ProductDetailsPage(self.driver, self.settings)
 
     def add_random_products_to_cart(self):
         """
@@ -117,6 +143,7 @@ class ProductsPage(BasePage):
         random_products = random.sample(product_list, count)
         for product in random_products:
             product.click()
+        self.page_mutated()
         return count
 
     def add_random_products_to_cart_and_get_names(self):
@@ -126,16 +153,18 @@ class ProductsPage(BasePage):
         Returns:
             list: A list of strings, where each string is the name of an added product.
         """
-        product_list = self.find_elements(self.ALL_PRODUCT_LIST_ADD)
+        # Read every 'Add to cart' button with its product name in one call
+        product_list = self.extract_all(self.ALL_PRODUCT_LIST_ADD, {
+            "button": self.ELEMENT,
+            "name": self.PRODUCT_NAME_FROM_LIST,
+        })
         count = random.randint(2, len(product_list))
         random_products = random.sample(product_list, count)
         added_products_texts = []
         for product in random_products:
-            # Find the product name element relative to the 'Add to cart' button
-            product_name_element = product.find_element(*self.PRODUCT_NAME_FROM_LIST)
-            product_name_element_text = product_name_element.text
-            added_products_texts.append(product_name_element_text)
-            product.click()
+            added_products_texts.append(product["name"])
+            product["button"].click()
+        self.page_mutated()
         return added_products_texts
 
     def select_sorting_products_by_value(self, value):
@@ -154,10 +183,9 @@ class ProductsPage(BasePage):
         Returns:
             list: A list of floats representing the prices of all products.
         """
-        products_list = self.find_elements(self.PRODUCTS_PRICES)
         product_prices = []
-        for product in products_list:
-            text = product.text
+        # All price texts are read in a single call
+        for text in self.extract_all(self.PRODUCTS_PRICES):
             # Use regex to find the price (e.g., "$29.99" -> 29.99)
             price = float(re.findall(r'\d+\.\d+', text)[0])
             product_prices.append(price)
@@ -176,9 +204,20 @@ class ProductsPage(BasePage):
     def get_count_remove_buttons(self):
         """
         Returns the number of "Remove" buttons currently visible on the page.
+        Use `are_remove_buttons_absent()` to check that there are none.
 
         Returns:
             int: The count of "Remove" buttons.
         """
         products_list = self.find_elements(self.ALL_PRODUCT_LIST_REMOVE)
-        return len(products_list)
\ No newline at end of file
+        return len(products_list)
+
+    def are_remove_buttons_absent(self):
+        """
+        Checks that no "Remove" button is visible, i.e. the cart is empty,
+        without waiting out the full timeout when there is none.
+
+        Returns:
+            bool: True if no "Remove" button is visible, False otherwise.
+        """
+        return self.is_absent(self.ALL_PRODUCT_LIST_REMOVE)
\ No newline at end of file
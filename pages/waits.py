@@ -0,0 +1,255 @@
+import threading
+import time
+
+from selenium.common.exceptions import JavascriptException, TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+
+# Longest single wait script, safely below Selenium's default 30 s script timeout;
+# longer waits are split into several scripts
+SCRIPT_SLICE = 20
+
+# Counts the visible elements matching a locator right now, without waiting
+_VISIBLE_COUNT_SCRIPT = """
+const [strategy, query] = arguments;
+let elements;
+if (strategy === 'xpath') {
+    const result = document.evaluate(query, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    elements = Array.from({length: result.snapshotLength}, (_, index) => result.snapshotItem(index));
+} else {
+    elements = Array.from(document.querySelectorAll(query));
+}
+return elements.filter(element => {
+    const style = window.getComputedStyle(element);
+    return element.getClientRects().length > 0 && style.visibility !== 'hidden' && style.opacity !== '0';
+}).length;
+"""
+
+# Resolves as soon as the condition holds: checked once right away, then after
+# every DOM mutation and history change, plus a 50 ms safety tick for changes
+# no mutation reports (CSS transitions, layout). Resolves with null at the deadline.
+_WAIT_SCRIPT = """
+const [strategy, query, condition, expected, timeoutMs] = arguments;
+const done = arguments[arguments.length - 1];
+function findFirst() {
+    if (strategy === 'xpath') {
+        return document.evaluate(query, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    }
+    return document.querySelector(query);
+}
+function findAll() {
+    if (strategy === 'xpath') {
+        const result = document.evaluate(query, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        return Array.from({length: result.snapshotLength}, (_, index) => result.snapshotItem(index));
+    }
+    return Array.from(document.querySelectorAll(query));
+}
+function visible(element) {
+    const style = window.getComputedStyle(element);
+    return element.getClientRects().length > 0 && style.visibility !== 'hidden' && style.opacity !== '0';
+}
+function check() {
+    if (condition === 'url') {
+        return window.location.href === expected ? window.location.href : null;
+    }
+    if (condition === 'absent') {
+        return findAll().some(visible) ? null : true;
+    }
+    const element = findFirst();
+    if (!element || !visible(element)) return null;
+    if (condition === 'clickable' && element.disabled) return null;
+    return element;
+}
+const first = check();
+if (first !== null) {
+    done(first);
+    return;
+}
+let finished = false;
+let scheduled = false;
+const observer = new MutationObserver(changed);
+const tick = setInterval(changed, 50);
+const deadline = setTimeout(() => finish(null), timeoutMs);
+function finish(result) {
+    if (finished) return;
+    finished = true;
+    observer.disconnect();
+    clearInterval(tick);
+    clearTimeout(deadline);
+    window.removeEventListener('popstate', changed);
+    window.removeEventListener('hashchange', changed);
+    done(result);
+}
+function changed() {
+    // Bursts of mutations are checked once, after the current task
+    if (finished || scheduled) return;
+    scheduled = true;
+    Promise.resolve().then(() => {
+        scheduled = false;
+        const result = check();
+        if (result !== null) finish(result);
+    });
+}
+observer.observe(document.documentElement, {childList: true, subtree: true, attributes: true, characterData: true});
+window.addEventListener('popstate', changed);
+window.addEventListener('hashchange', changed);
+"""
+
+
+class ObserverWait:
+    """
+    Explicit waits that block inside the page instead of polling it.
+
+    `WebDriverWait` re-checks its condition every 500 ms, so each wait ends
+    up to half a second after the page got ready. Here a single async script
+    watches the page with a MutationObserver and history listeners and
+    returns as soon as the condition holds, or with nothing at the deadline.
+    A wait interrupted by a full page load is simply resumed on the new page.
+    """
+
+    def __init__(self, driver, timeout=10):
+        """
+        Args:
+            driver: The Selenium WebDriver instance.
+            timeout (float, optional): Seconds to wait before raising TimeoutException.
+        """
+        self.driver = driver
+        self.timeout = timeout
+
+    def until_visible(self, locator):
+        """
+        Waits for the first element matching a locator to be visible.
+
+        Returns:
+            WebElement: The element.
+        """
+        return self._until("visible", locator, None, f"Element {locator} was not visible")
+
+    def until_clickable(self, locator):
+        """
+        Waits for the first element matching a locator to be visible and enabled.
+
+        Returns:
+            WebElement: The element.
+        """
+        return self._until("clickable", locator, None, f"Element {locator} was not clickable")
+
+    def until_url(self, url):
+        """
+        Waits for the browser's URL to be exactly `url`.
+
+        Returns:
+            str: The URL.
+        """
+        return self._until("url", (By.TAG_NAME, "html"), url, f"URL did not become {url}")
+
+    def until_absent(self, locator):
+        """
+        Waits until no element matching a locator is visible (returns at once if none is).
+
+        Returns:
+            bool: True.
+        """
+        return self._until("absent", locator, None, f"Element {locator} was still visible")
+
+    def _until(self, condition, locator, expected, message):
+        strategy, query = script_locator(locator)
+        started = time.monotonic()
+        deadline = started + self.timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                wait_stats.record(time.monotonic() - started, timed_out=True)
+                raise TimeoutException(f"{message} within {self.timeout}s")
+            try:
+                result = self.driver.execute_async_script(
+                    _WAIT_SCRIPT, strategy, query, condition, expected, int(min(remaining, SCRIPT_SLICE) * 1000)
+                )
+            except JavascriptException as e:
+                if "document unloaded" not in (e.msg or ""):
+                    # A genuine script error (e.g. an XPath the browser rejects) fails at once
+                    raise
+                # A full page load interrupted the wait; wait on the new page
+                continue
+            if result is not None:
+                wait_stats.record(time.monotonic() - started, timed_out=False)
+                return result
+
+
+class RecordedWebDriverWait(WebDriverWait):
+    """
+    A `WebDriverWait` that adds the time it spends, and whether it timed out, to `wait_stats`.
+    """
+
+    def until(self, method, message=""):
+        started = time.monotonic()
+        try:
+            result = super().until(method, message)
+        except TimeoutException:
+            wait_stats.record(time.monotonic() - started, timed_out=True)
+            raise
+        wait_stats.record(time.monotonic() - started, timed_out=False)
+        return result
+
+
+class WaitStats:
+    """
+    Thread-safe running totals of the time spent in explicit waits, split
+    into waits that succeeded and waits that ran into their timeout.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._totals = {"waits": 0, "seconds": 0.0, "timeouts": 0, "timeout_seconds": 0.0}
+
+    def record(self, seconds, timed_out):
+        """
+        Adds one finished wait.
+        """
+        with self._lock:
+            self._totals["waits"] += 1
+            self._totals["seconds"] += seconds
+            if timed_out:
+                self._totals["timeouts"] += 1
+                self._totals["timeout_seconds"] += seconds
+
+    def snapshot(self):
+        """
+        Returns the totals so far ({"waits", "seconds", "timeouts", "timeout_seconds"});
+        the difference of two snapshots covers the waits in between.
+        """
+        with self._lock:
+            return dict(self._totals)
+
+
+# Shared record of every explicit wait made by the page objects in this process
+wait_stats = WaitStats()
+
+
+def count_visible(driver, locator):
+    """
+    Returns how many elements matching a locator are visible right now, in a
+    single WebDriver call and without waiting.
+    """
+    return driver.execute_script(_VISIBLE_COUNT_SCRIPT, *script_locator(locator))
+
+
+def script_locator(locator):
+    """
+    Translates a Selenium locator into the (strategy, query) pair understood
+    by the in-page scripts: an XPath expression or a CSS selector.
+    """
+    by, value = locator
+    if by == By.XPATH:
+        return "xpath", value
+    if by == By.CSS_SELECTOR:
+        return "css", value
+    if by == By.ID:
+        return "css", f'[id="{value}"]'
+    if by == By.CLASS_NAME:
+        return "css", f'[class~="{value}"]'
+    if by == By.NAME:
+        return "css", f'[name="{value}"]'
+    if by == By.TAG_NAME:
+        return "css", value
+    raise ValueError(f"Locator strategy {by!r} is not supported in page scripts")
@@ -0,0 +1,61 @@
+import asyncio
+import pytest
+
+# Every test in this module runs on the shared session event loop
+pytestmark = pytest.mark.anyio
+
+
+async def test_get_pet_by_status_concurrently_is_successful(async_pet_api_client):
+    """
+    Test Case: Verifies that pets can be retrieved by several statuses concurrently.
+    """
+    statuses = ["available", "pending", "sold"]
+    responses = await asyncio.gather(
+        *(async_pet_api_client.get_pet_by_status(status) for status in statuses)
+    )
+    for status, response in zip(statuses, responses):
+        assert response.status_code == 200, \
+            f"Expected status code 200 for status '{status}', but got {response.status_code}."
+        for pet in response.json():
+            assert pet["status"] == status, \
+                f"Expected pet status to be '{status}', but got '{pet.get('status')}'."
+
+
+async def test_create_and_delete_pets_concurrently_is_successful(async_pet_api_client, id_allocator):
+    """
+    Test Case: Verifies that several pets can be created and deleted concurrently.
+    """
+    pet_ids = id_allocator.next_ids(5)
+    create_responses = await asyncio.gather(
+        *(async_pet_api_client.create_pet({"id": pet_id, "name": f"TestPet_{pet_id}", "status": "available"})
+          for pet_id in pet_ids)
+    )
+    for pet_id, response in zip(pet_ids, create_responses):
+        assert response.status_code == 200, \
+            f"Expected status code 200 for pet creation, but got {response.status_code}."
+        assert response.json().get('id') == pet_id, \
+            f"Expected ID {pet_id} in response, but got {response.json().get('id')}."
+
+    await asyncio.gather(*(async_pet_api_client.delete_pet(pet_id) for pet_id in pet_ids))
+
+
+async def test_create_and_delete_user_is_successful(async_user_api_client, id_allocator):
+    """
+    Test Case: Verifies that a user can be created and deleted through the async client.
+    """
+    user_id = id_allocator.next_id()
+    user_data = {
+        "id": user_id,
+        "username": id_allocator.username(user_id),
+        "firstName": f"Test_First_{user_id}",
+        "lastName": f"Test_Second_{user_id}",
+        "email": f"mail_{user_id}@test.com",
+        "password": str(user_id),
+        "phone": f"093{user_id}",
+        "userStatus": 0
+    }
+    create_user_response = await async_user_api_client.create_user(user_data)
+    assert create_user_response.status_code == 200, \
+        f"Expected status code 200 for user creation, but got {create_user_response.status_code}."
+
+    await async_user_api_client.delete_user(user_data["username"])
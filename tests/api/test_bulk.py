@@ -0,0 +1,165 @@
+import asyncio
+import threading
+import time
+import httpx
+import pytest
+from endpoints.async_pet_api import AsyncPetAPI
+from endpoints.bulk import run_bulk, run_bulk_async
+from endpoints.pet_api import PetAPI
+from endpoints.petstore_stub import STUB_BASE_URL, PetstoreStub, PetstoreStubTransport
+
+
+def test_create_and_delete_pets_in_bulk_is_successful(pet_api_client, id_allocator):
+    """
+    Test Case: Verifies that many pets can be created and deleted with bounded concurrency.
+    """
+    pet_ids = id_allocator.next_ids(10)
+    pets_data = [{"id": pet_id, "name": f"TestPet_{pet_id}", "status": "available"} for pet_id in pet_ids]
+
+    create_results = list(pet_api_client.create_pets_bulk(pets_data, concurrency=5))
+    assert len(create_results) == len(pets_data), \
+        f"Expected {len(pets_data)} results, but got {len(create_results)}."
+    failed = [result.item["id"] for result in create_results if not result.ok]
+    assert not failed, f"Expected all pets to be created, but these failed: {failed}."
+
+    delete_results = list(pet_api_client.delete_pets_bulk(pet_ids, concurrency=5))
+    assert sorted(result.item for result in delete_results) == sorted(pet_ids), \
+        "Expected exactly one delete result per created pet."
+
+
+def test_create_and_delete_users_in_bulk_is_successful(user_api_client, id_allocator):
+    """
+    Test Case: Verifies that many users can be created and deleted with bounded concurrency.
+    """
+    user_ids = id_allocator.next_ids(10)
+    users_data = [
+        {
+            "id": user_id,
+            "username": id_allocator.username(user_id),
+            "firstName": f"Test_First_{user_id}",
+            "lastName": f"Test_Second_{user_id}",
+            "email": f"mail_{user_id}@test.com",
+            "password": str(user_id),
+            "phone": f"093{user_id}",
+            "userStatus": 0
+        }
+        for user_id in user_ids
+    ]
+
+    create_results = list(user_api_client.create_users_bulk(users_data, concurrency=5))
+    failed = [result.item["username"] for result in create_results if not result.ok]
+    assert not failed, f"Expected all users to be created, but these failed: {failed}."
+
+    usernames = [user["username"] for user in users_data]
+    delete_results = list(user_api_client.delete_users_bulk(usernames, concurrency=5))
+    assert sorted(result.item for result in delete_results) == sorted(usernames), \
+        "Expected exactly one delete result per created user."
+
+
+def test_failed_items_are_captured_without_aborting_the_batch():
+    """
+    Test Case: Verifies that items failed by the server are reported as such while the others succeed.
+    """
+    stub = PetstoreStub(error_rate={"POST /pet": 0.5}, seed=3)
+    pets_data = [{"id": pet_id, "name": f"TestPet_{pet_id}", "status": "available"} for pet_id in range(1, 21)]
+    with PetAPI(STUB_BASE_URL, transport=PetstoreStubTransport(stub)) as client:
+        results = list(client.create_pets_bulk(pets_data, concurrency=5))
+
+    failed = [result for result in results if not result.ok]
+    created = [result for result in results if result.ok]
+    assert len(results) == len(pets_data), f"Expected {len(pets_data)} results, but got {len(results)}."
+    assert failed and created, \
+        f"Expected a mix of failed and created pets, but got {len(failed)} failed and {len(created)} created."
+    for result in failed:
+        assert result.error is None and result.response.status_code == 500, \
+            f"Expected pet {result.item['id']} to fail with a 500, but got {result.response} ({result.error!r})."
+    for result in created:
+        assert result.response.json().get("id") == result.item["id"], \
+            f"Expected pet {result.item['id']} to be created, but got {result.response.json()}."
+
+
+def test_exceptions_are_captured_per_item():
+    """
+    Test Case: Verifies that an exception raised for one item is kept in its result.
+    """
+    def operation(item):
+        if item == 3:
+            raise ConnectionError("connection reset")
+        return httpx.Response(200)
+
+    results = {result.item: result for result in run_bulk(operation, range(5), concurrency=2)}
+
+    assert isinstance(results[3].error, ConnectionError) and not results[3].ok, \
+        f"Expected item 3 to keep its exception, but got {results[3]}."
+    assert all(results[item].ok for item in (0, 1, 2, 4)), \
+        f"Expected the other items to succeed, but got {list(results.values())}."
+
+
+def test_in_flight_calls_never_exceed_concurrency():
+    """
+    Test Case: Verifies that at most `concurrency` calls are in flight at any time.
+    """
+    lock = threading.Lock()
+    counts = {"in_flight": 0, "max": 0}
+
+    def operation(item):
+        with lock:
+            counts["in_flight"] += 1
+            counts["max"] = max(counts["max"], counts["in_flight"])
+        time.sleep(0.01)
+        with lock:
+            counts["in_flight"] -= 1
+        return item
+
+    results = list(run_bulk(operation, range(30), concurrency=4))
+
+    assert len(results) == 30, f"Expected 30 results, but got {len(results)}."
+    assert counts["max"] == 4, f"Expected at most (and up to) 4 calls in flight, but got {counts['max']}."
+
+
+@pytest.mark.anyio
+async def test_in_flight_coroutines_never_exceed_concurrency():
+    """
+    Test Case: Verifies that the async helper keeps at most `concurrency` calls in flight,
+    and cancels and awaits the outstanding ones when the consumer stops early.
+    """
+    counts = {"in_flight": 0, "max": 0, "cancelled": 0}
+
+    async def operation(item, delay=0.01):
+        counts["in_flight"] += 1
+        counts["max"] = max(counts["max"], counts["in_flight"])
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            counts["cancelled"] += 1
+            raise
+        finally:
+            counts["in_flight"] -= 1
+        return item
+
+    results = [result async for result in run_bulk_async(operation, range(30), concurrency=4)]
+    assert len(results) == 30, f"Expected 30 results, but got {len(results)}."
+    assert counts["max"] == 4, f"Expected at most (and up to) 4 calls in flight, but got {counts['max']}."
+
+    # Only the first call finishes; the other three are still running when the consumer stops
+    bulk = run_bulk_async(lambda item: operation(item, 0 if item == 0 else 10), range(30), concurrency=4)
+    await anext(bulk)
+    await bulk.aclose()
+    assert counts["in_flight"] == 0 and counts["cancelled"] == 3, \
+        f"Expected the 3 outstanding calls to be cancelled and awaited, but got {counts}."
+
+
+@pytest.mark.anyio
+async def test_create_pets_bulk_async_is_successful():
+    """
+    Test Case: Verifies that many pets can be created with bounded concurrency through the async client.
+    """
+    pets_data = [{"id": pet_id, "name": f"TestPet_{pet_id}", "status": "available"} for pet_id in range(1, 11)]
+    async with AsyncPetAPI(STUB_BASE_URL, transport=PetstoreStubTransport(PetstoreStub())) as client:
+        results = [result async for result in client.create_pets_bulk(pets_data, concurrency=5)]
+        stored = [(await client.get_pet_by_id(pet["id"])).json() for pet in pets_data]
+
+    failed = [result.item["id"] for result in results if not result.ok]
+    assert len(results) == len(pets_data) and not failed, \
+        f"Expected all {len(pets_data)} pets to be created, but these failed: {failed}."
+    assert stored == pets_data, f"Expected the created pets to be stored, but got {stored}."
@@ -0,0 +1,77 @@
+import time
+from endpoints.cache import ResponseCache
+from endpoints.pet_api import PetAPI
+from endpoints.petstore_stub import STUB_BASE_URL, PetstoreStub, PetstoreStubTransport
+
+# These tests use their own stand-in and cache so hit/miss counts are deterministic.
+
+
+def make_client(cache):
+    return PetAPI(STUB_BASE_URL, transport=PetstoreStubTransport(PetstoreStub()), cache=cache)
+
+
+def test_repeated_get_is_served_from_cache():
+    """
+    Test Case: Verifies that a repeated GET is answered from the cache.
+    """
+    cache = ResponseCache(ttl=60)
+    with make_client(cache) as client:
+        client.create_pet({"id": 1, "name": "TestPet_1", "status": "available"})
+        first_response = client.get_pet_by_id(1)
+        second_response = client.get_pet_by_id(1)
+
+    assert second_response is first_response, "Expected the second GET to return the cached response."
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"]) == (1, 1), f"Expected 1 hit and 1 miss, but got {stats}."
+
+
+def test_update_invalidates_cached_pet_and_status_lists():
+    """
+    Test Case: Verifies that updating a pet drops its cached GET and findByStatus responses.
+    """
+    cache = ResponseCache(ttl=60)
+    with make_client(cache) as client:
+        client.create_pet({"id": 2, "name": "TestPet_2", "status": "available"})
+        client.get_pet_by_id(2)
+        client.get_pet_by_status("available")
+
+        client.update_pet({"id": 2, "name": "UpdatedPet_2", "status": "sold"})
+        get_response = client.get_pet_by_id(2)
+        status_response = client.get_pet_by_status("available")
+
+    assert get_response.json().get('name') == "UpdatedPet_2", \
+        f"Expected the updated name, but got '{get_response.json().get('name')}'."
+    assert status_response.json() == [], \
+        f"Expected no available pets after the update, but got {status_response.json()}."
+    assert cache.stats()["hits"] == 0, "Expected no cache hits after invalidation."
+
+
+def test_cached_entries_expire_after_ttl():
+    """
+    Test Case: Verifies that cached responses are refetched once their TTL has passed.
+    """
+    cache = ResponseCache(ttl=0.1)
+    with make_client(cache) as client:
+        client.create_pet({"id": 3, "name": "TestPet_3", "status": "available"})
+        client.get_pet_by_id(3)
+        time.sleep(0.15)
+        client.get_pet_by_id(3)
+
+    assert cache.stats()["misses"] == 2, f"Expected the expired entry to miss, but got {cache.stats()}."
+
+
+def test_least_recently_used_entry_is_evicted():
+    """
+    Test Case: Verifies that the least recently used response is evicted when the cache is full.
+    """
+    cache = ResponseCache(ttl=60, max_entries=2)
+    with make_client(cache) as client:
+        for pet_id in (4, 5, 6):
+            client.create_pet({"id": pet_id, "name": f"TestPet_{pet_id}", "status": "available"})
+            client.get_pet_by_id(pet_id)
+        client.get_pet_by_id(6)
+        client.get_pet_by_id(4)
+
+    stats = cache.stats()
+    assert stats["evictions"] == 2, f"Expected 2 evictions, but got {stats['evictions']}."
+    assert stats["hits"] == 1, f"Expected only pet 6 to still be cached, but got {stats['hits']} hits."
@@ -0,0 +1,51 @@
+import time
+import pytest
+from endpoints.cleanup import CleanupQueue
+from endpoints.pet_api import PetAPI
+from endpoints.petstore_stub import STUB_API_KEY, STUB_BASE_URL, PetstoreStub, PetstoreStubTransport
+
+
+@pytest.fixture
+def stub_client():
+    stub = PetstoreStub(seed=1)
+    with PetAPI(STUB_BASE_URL, api_key=STUB_API_KEY, transport=PetstoreStubTransport(stub)) as client:
+        yield stub, client
+
+
+def test_deferred_deletions_are_retried_until_the_pet_is_visible(stub_client):
+    """
+    Test Case: Verifies that a deletion hitting the read-after-write lag (404) is retried in the background.
+    """
+    stub, client = stub_client
+    stub.consistency_delay = 0.3
+    for pet_id in range(1, 6):
+        client.create_pet({"id": pet_id, "name": f"TestPet_{pet_id}", "status": "available"})
+    queue = CleanupQueue(initial_delay=0.1, max_delay=0.2, attempts=6)
+    for pet_id in range(1, 6):
+        queue.defer(f"pet {pet_id}", client.delete_pet, pet_id)
+    failures = queue.close()
+    # Deletions are subject to the same lag before reads reflect them
+    time.sleep(stub.consistency_delay)
+
+    assert failures == [], f"Expected every pet to be deleted, but got {failures}."
+    assert queue.stats()["deleted"] == 5 and queue.stats()["retried"] == 5, f"Unexpected stats {queue.stats()}."
+    assert all(client.get_pet_by_id(pet_id).status_code == 404 for pet_id in range(1, 6)), \
+        "Expected the pets to be gone."
+
+
+def test_undeletable_data_is_reported_and_strict_cleanup_raises(stub_client):
+    """
+    Test Case: Verifies that deletions failing every attempt are reported, and raise when run synchronously.
+    """
+    stub, client = stub_client
+    stub.error_rate = {"DELETE /pet/{petId}": 1.0}
+    queue = CleanupQueue(initial_delay=0.01, max_delay=0.01, attempts=2)
+    queue.defer("pet 1", client.delete_pet, 1)
+    failures = queue.drain()
+    with pytest.raises(RuntimeError, match="pet 2"):
+        queue.run_now("pet 2", client.delete_pet, 2)
+    queue.close()
+
+    assert [(failure.description, failure.status) for failure in failures] == [("pet 1", 500)], \
+        f"Unexpected failures {failures}."
+    assert queue.stats()["failed"] == 2, f"Expected both deletions to be reported, but got {queue.stats()}."
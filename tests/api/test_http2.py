@@ -0,0 +1,68 @@
+import importlib.util
+import time
+import warnings
+import pytest
+from endpoints.async_pet_api import AsyncPetAPI
+from endpoints.bulk import run_bulk
+from endpoints.pet_api import PetAPI
+from endpoints.petstore_stub import PetstoreStub, PetstoreStubH2Server, PetstoreStubServer
+
+requires_h2 = pytest.mark.skipif(importlib.util.find_spec("h2") is None, reason="needs the http2 extra")
+
+
+@requires_h2
+def test_concurrent_requests_are_multiplexed_over_one_connection():
+    """
+    Test Case: Verifies that concurrent sync requests share one HTTP/2 connection without queueing.
+    """
+    samples = []
+    with PetstoreStubH2Server(PetstoreStub(latency=0.1)) as server, \
+            PetAPI(server.base_url, http2="h2c", max_connections=1, hooks=[samples.append]) as client:
+        started = time.perf_counter()
+        results = list(run_bulk(lambda _: client.get_pet_by_id(1), range(20), concurrency=20))
+        elapsed = time.perf_counter() - started
+
+    assert {result.response.http_version for result in results} == {"HTTP/2"}, "Expected HTTP/2 responses."
+    assert sum("connect" in sample.timings for sample in samples) == 1, "Expected a single connection."
+    assert elapsed < 1.0, f"Expected 20 x 100 ms requests to overlap, but they took {elapsed:.2f}s."
+
+
+@requires_h2
+@pytest.mark.anyio
+async def test_async_client_round_trips_large_bodies_over_http2():
+    """
+    Test Case: Verifies that bodies larger than the initial flow control window are sent and received.
+    """
+    pet = {"id": 1, "name": "x" * 200_000, "status": "available"}
+    with PetstoreStubH2Server() as server:
+        async with AsyncPetAPI(server.base_url, http2="h2c") as client:
+            create_response = await client.create_pet(pet)
+            get_response = await client.get_pet_by_id(1)
+
+    assert create_response.http_version == "HTTP/2", f"Unexpected protocol {create_response.http_version}."
+    assert get_response.json() == pet, "Expected the large pet to round-trip intact."
+
+
+def test_http2_falls_back_to_http1_when_not_negotiated():
+    """
+    Test Case: Verifies that http2=True still talks HTTP/1.1 to a server that can't negotiate HTTP/2.
+    """
+    with PetstoreStubServer() as server, PetAPI(server.base_url, http2=True) as client:
+        response = client.get_pet_by_id(1)
+
+    assert response.http_version == "HTTP/1.1", f"Expected HTTP/1.1, but got {response.http_version}."
+
+
+def test_http2_falls_back_with_a_warning_when_h2_is_missing(monkeypatch):
+    """
+    Test Case: Verifies that requesting HTTP/2 without the h2 package warns and uses HTTP/1.1.
+    """
+    monkeypatch.setattr("endpoints.base_api.importlib.util.find_spec", lambda name: None)
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        with PetstoreStubServer() as server, PetAPI(server.base_url, http2="h2c") as client:
+            response = client.get_pet_by_id(1)
+
+    assert any("falling back to HTTP/1.1" in str(warning.message) for warning in caught), \
+        "Expected a fallback warning."
+    assert response.http_version == "HTTP/1.1", f"Expected HTTP/1.1, but got {response.http_version}."
@@ -0,0 +1,39 @@
+import pytest
+from endpoints.id_allocator import SEQUENCE_SPACE, IdAllocator, run_number, worker_index
+
+
+def test_workers_of_a_run_get_disjoint_ids():
+    """
+    Test Case: Verifies that every worker allocates from its own block.
+    """
+    allocators = [IdAllocator("run-1", worker=worker) for worker in range(64)]
+    ids = [entity_id for allocator in allocators for entity_id in allocator.next_ids(500)]
+    assert len(set(ids)) == len(ids), "Expected no ID to be handed out twice across workers."
+    assert max(ids) < 2 ** 53, f"Expected IDs to stay JSON-safe, but got {max(ids)}."
+
+
+def test_ids_are_deterministic_per_seed_and_traceable():
+    """
+    Test Case: Verifies that a seed reproduces its IDs and that IDs and usernames decode to their run.
+    """
+    first, again, other = IdAllocator("seed", worker=3), IdAllocator("seed", worker=3), IdAllocator("other")
+    entity_id = first.next_id()
+
+    assert again.next_id() == entity_id, "Expected the same seed to reproduce the same IDs."
+    assert other.next_id() != entity_id, "Expected another seed to produce other IDs."
+    assert IdAllocator.describe(entity_id) == {"run": run_number("seed"), "worker": 3, "sequence": 1}, \
+        f"Unexpected decoding of {entity_id}: {IdAllocator.describe(entity_id)}."
+    assert first.username(entity_id) == f"qa_user_{entity_id}", f"Unexpected username {first.username(entity_id)}."
+    assert IdAllocator.describe(first.username(entity_id))["worker"] == 3, "Expected usernames to be traceable."
+    assert IdAllocator.describe(1234567) is None, "Expected foreign IDs not to be claimed."
+
+
+def test_exhausted_block_raises_and_worker_names_map_to_indexes():
+    """
+    Test Case: Verifies that a worker never spills into another worker's block.
+    """
+    allocator = IdAllocator("seed")
+    allocator.next_ids(SEQUENCE_SPACE - 1)
+    with pytest.raises(RuntimeError):
+        allocator.next_id()
+    assert [worker_index(name) for name in ("gw0", "gw12", "main")] == [0, 12, 0], "Unexpected worker indexes."
@@ -0,0 +1,37 @@
+import os
+from tests.import_report import UI_ONLY_MODULES, ImportReport, collect_imports, parse_importtime
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     _sniffio
+import time:       300 |        420 |   sniffio
+import time:      1500 |       1920 | httpx
+some other stderr output
+import time:       200 |        200 | endpoints.cache
+"""
+
+
+def test_parse_importtime_keeps_nesting_and_cumulative_times():
+    """
+    Test Case: Verifies that importtime lines are parsed with their depth and the slowest imports ranked first.
+    """
+    report = ImportReport(wall_seconds=0.5, imports=parse_importtime(IMPORTTIME_OUTPUT.splitlines()))
+
+    assert [(timing.module, timing.depth) for timing in report.imports] == \
+        [("_sniffio", 2), ("sniffio", 1), ("httpx", 0), ("endpoints.cache", 0)], \
+        f"Unexpected parsed imports: {report.imports}."
+    assert [timing.module for timing in report.top(2)] == ["httpx", "endpoints.cache"], \
+        f"Expected httpx to be the slowest top-level import, but got {report.top(2)}."
+    assert report.import_seconds == 0.00212, f"Expected 2.12 ms of imports, but got {report.import_seconds}."
+    assert report.loaded(["sniffio"]) == ["sniffio"], "Expected only the sniffio package itself to match."
+
+
+def test_collecting_api_tests_does_not_import_ui_dependencies():
+    """
+    Test Case: Verifies that collecting an API test module never imports selenium, faker or the page objects.
+    """
+    report = collect_imports([os.path.join(os.path.dirname(__file__), "test_pet.py")])
+
+    assert report.returncode == 0, f"Expected the collection to succeed, but pytest exited with {report.returncode}."
+    assert report.loaded(UI_ONLY_MODULES) == [], \
+        f"Expected no UI-only imports, but got {report.loaded(UI_ONLY_MODULES)[:5]}."
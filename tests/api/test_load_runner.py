@@ -0,0 +1,53 @@
+import pytest
+from endpoints.load_runner import LoadRunner, Pacer, pet_crud_scenario, user_crud_scenario
+from endpoints.petstore_stub import STUB_API_KEY, STUB_BASE_URL, PetstoreStub, PetstoreStubTransport
+
+
+def test_pacer_schedule_ramps_up_linearly_then_holds_the_target_rate():
+    """
+    Test Case: Verifies that request start times follow the ramp-up and then the target rate.
+    """
+    pacer = Pacer(target_rps=10, ramp_up=2, start=0)
+    # 10 requests are due during the 2 s ramp (area of the triangle), then one every 100 ms
+    assert pacer.due_at(0) == 0, "Expected the first request to start immediately."
+    assert pacer.due_at(10) == pytest.approx(2.0), f"Expected request 10 at 2.0s, but got {pacer.due_at(10)}."
+    assert pacer.due_at(20) == pytest.approx(3.0), f"Expected request 20 at 3.0s, but got {pacer.due_at(20)}."
+    assert pacer.due_at(1) > pacer.due_at(11) - pacer.due_at(10), \
+        "Expected requests to be spaced further apart during the ramp-up."
+
+
+def test_paced_run_against_stub_holds_the_request_rate_and_reports_percentiles():
+    """
+    Test Case: Verifies that a paced run meets its target request rate and reports iterations separately.
+    """
+    report = LoadRunner(pet_crud_scenario, users=4, duration=1.0, target_rps=100,
+                        base_url=STUB_BASE_URL, api_key=STUB_API_KEY,
+                        transport=PetstoreStubTransport(PetstoreStub())).run()
+
+    assert report.failed_iterations == 0, f"Unexpected iteration failures: {report.errors}."
+    assert report.throughput == pytest.approx(100, rel=0.15), \
+        f"Expected about 100 req/s, but got {report.throughput:.1f}."
+    assert report.requests == report.iterations * 5 and report.requests_per_iteration == 5, \
+        f"Expected 5 requests per iteration, but got {report.requests} for {report.iterations}."
+    assert report.iteration_rate == pytest.approx(report.throughput / 5), \
+        f"Expected a fifth of the request rate in iterations, but got {report.iteration_rate:.1f} it/s."
+    assert set(report.routes) == {"POST /pet", "GET /pet/{petId}", "PUT /pet", "GET /pet/findByStatus",
+                                  "DELETE /pet/{petId}"}, f"Unexpected routes: {list(report.routes)}."
+    assert report.routes["POST /pet"]["phases"]["total"]["p99"] > 0, "Expected latency percentiles."
+    assert "target 100 req/s" in report.format() and "it/s, 5.0 requests each" in report.format(), \
+        f"Expected the request and iteration rates in the report:\n{report.format()}"
+
+
+def test_run_reports_error_rates_from_the_stub():
+    """
+    Test Case: Verifies that server errors and failed iterations are counted.
+    """
+    stub = PetstoreStub(error_rate={"POST /user": 1.0}, seed=1)
+    report = LoadRunner(user_crud_scenario, users=2, duration=0.3,
+                        base_url=STUB_BASE_URL, transport=PetstoreStubTransport(stub)).run()
+
+    assert report.iterations > 0 and report.failed_iterations == report.iterations, \
+        f"Expected every iteration to fail, but got {report.failed_iterations}/{report.iterations}."
+    assert report.error_rate == 1.0, f"Expected a 100% error rate, but got {report.error_rate}."
+    assert list(report.errors) == ["AssertionError: create_user returned 500"], \
+        f"Unexpected failure messages: {report.errors}."
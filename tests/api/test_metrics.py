@@ -0,0 +1,100 @@
+import json
+import time
+from endpoints.metrics import LatencyHistogram, LatencyRecorder
+from endpoints.pet_api import PetAPI
+from endpoints.petstore_stub import STUB_BASE_URL, PetstoreStub, PetstoreStubServer, PetstoreStubTransport
+
+
+def test_hooks_receive_route_status_bytes_and_timings():
+    """
+    Test Case: Verifies that every request is reported to the hooks with its route template.
+    """
+    samples = []
+    with PetstoreStubServer(PetstoreStub()) as server, PetAPI(server.base_url, hooks=[samples.append]) as client:
+        client.create_pet({"id": 1, "name": "TestPet_1", "status": "available"})
+        client.get_pet_by_id(1)
+        client.get_pet_by_id(2)
+
+    assert [sample.route for sample in samples] == ["POST /pet", "GET /pet/{petId}", "GET /pet/{petId}"], \
+        f"Unexpected routes: {[sample.route for sample in samples]}."
+    assert [sample.status for sample in samples] == [200, 200, 404], \
+        f"Unexpected statuses: {[sample.status for sample in samples]}."
+    assert samples[0].request_bytes > 0 and samples[1].response_bytes > 0, \
+        "Expected request and response sizes to be recorded."
+    assert "connect" in samples[0].timings and "connect" not in samples[1].timings, \
+        "Expected a connect phase only for the first request on the pooled connection."
+    assert all(sample.timings["ttfb"] <= sample.timings["total"] for sample in samples), \
+        "Expected time to first byte to be within the total time."
+
+
+def test_request_hooks_run_before_each_request_outside_its_latency():
+    """
+    Test Case: Verifies that request hooks get the route before sending and are not timed as latency.
+    """
+    events = []
+
+    def slow_hook(route):
+        events.append(("before", route))
+        time.sleep(0.05)
+
+    with PetAPI(STUB_BASE_URL, transport=PetstoreStubTransport(PetstoreStub()),
+                request_hooks=[slow_hook], hooks=[lambda sample: events.append(("after", sample))]) as client:
+        client.get_pet_by_id(1)
+        client.get_pet_by_status("available")
+
+    assert [(kind, item if kind == "before" else item.route) for kind, item in events] == [
+        ("before", "GET /pet/{petId}"), ("after", "GET /pet/{petId}"),
+        ("before", "GET /pet/findByStatus"), ("after", "GET /pet/findByStatus")], f"Unexpected events: {events}."
+    assert all(sample.timings["total"] < 0.05 for kind, sample in events if kind == "after"), \
+        "Expected the time spent in the request hooks to be left out of the latency."
+
+
+def test_recorder_reports_percentiles_per_route():
+    """
+    Test Case: Verifies that the recorder aggregates samples into per-route percentiles.
+    """
+    recorder = LatencyRecorder()
+    with PetstoreStubServer(PetstoreStub(latency={"GET /pet/findByStatus": 0.05})) as server, \
+            PetAPI(server.base_url, hooks=[recorder]) as client:
+        for _ in range(5):
+            client.get_pet_by_status("available")
+            client.get_pet_by_id(1)
+
+    summary = recorder.summary()
+    assert summary["GET /pet/findByStatus"]["count"] == 5, "Expected 5 findByStatus samples."
+    assert summary["GET /pet/findByStatus"]["phases"]["total"]["p50"] >= 50, \
+        "Expected the configured 50 ms latency to show up in the median."
+    assert summary["GET /pet/{petId}"]["phases"]["total"]["p99"] < 50, \
+        "Expected the undelayed route to stay fast."
+
+
+def test_histogram_percentiles_are_within_bucket_precision():
+    """
+    Test Case: Verifies that histogram percentiles stay within the 5% bucket growth factor.
+    """
+    histogram = LatencyHistogram()
+    for millisecond in range(1, 1001):
+        histogram.record(millisecond / 1000)
+
+    for percent, expected in [(50, 0.5), (95, 0.95), (99, 0.99)]:
+        assert expected <= histogram.percentile(percent) <= expected * 1.05, \
+            f"Expected p{percent} close to {expected}, but got {histogram.percentile(percent)}."
+
+
+def test_recorder_dump_and_load_merge_worker_data():
+    """
+    Test Case: Verifies that recorders serialized by parallel workers merge into the same percentiles.
+    """
+    samples = []
+    with PetstoreStubServer(PetstoreStub()) as server, PetAPI(server.base_url, hooks=[samples.append]) as client:
+        for pet_id in range(1, 7):
+            client.get_pet_by_id(pet_id)
+    combined, first_worker, second_worker = LatencyRecorder(), LatencyRecorder(), LatencyRecorder()
+    for index, sample in enumerate(samples):
+        combined(sample)
+        (first_worker if index % 2 else second_worker)(sample)
+
+    merged = LatencyRecorder.load(json.loads(json.dumps(first_worker.dump())))
+    merged.merge(LatencyRecorder.load(json.loads(json.dumps(second_worker.dump()))))
+
+    assert merged.summary() == combined.summary(), "Expected the merged worker data to match a single recorder."
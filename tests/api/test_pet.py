@@ -1,16 +1,13 @@
-import random
 import pytest
-from tenacity import retry, stop_after_attempt, wait_fixed
 
 
-@retry(stop=stop_after_attempt(5), wait=wait_fixed(1))
 def get_pet_with_retries(pet_api_client, pet_id):
     """
-    A helper function that attempts to get a pet by ID up to 5 times.
+    A helper function that polls a pet by ID until it is found, for up to 5 seconds.
     This is used to handle potential API consistency delays, where a newly
     created item might not be immediately available for retrieval.
     """
-    get_response = pet_api_client.get_pet_by_id(pet_id)
+    get_response = pet_api_client.wait_for_pet(pet_id, timeout=5).value
     assert get_response.status_code == 200, \
         f"Expected status code 200, but got {get_response.status_code}."
     return get_response
@@ -42,11 +39,11 @@ def test_get_pet_by_status_is_successful(pet_api_client):
             f"Expected pet status to be '{pet_status}', but got '{pet.get('status')}'."
 
 
-def test_create_pet_with_valid_data_is_successful(pet_api_client):
+def test_create_pet_with_valid_data_is_successful(pet_api_client, id_allocator):
     """
     Test Case: Verifies that a new pet can be created with valid data.
     """
-    pet_id = random.randint(1000000, 9999999)
+    pet_id = id_allocator.next_id()
     pet_name = f"TestPet_{pet_id}"
     pet_status = "available"
     pet_data = {
@@ -100,11 +97,11 @@ def test_update_existing_pet_is_successful(pet_api_client, created_pet_id):
 
 @pytest.mark.xfail(
     reason="API returns 404 on DELETE for a recently created/retrieved pet, indicating a consistency issue.")
-def test_delete_existing_pet_is_successful(pet_api_client):
+def test_delete_existing_pet_is_successful(pet_api_client, id_allocator):
     """
     Test Case: Verifies that an existing pet can be successfully deleted.
     """
-    pet_id = random.randint(1000000, 9999999)
+    pet_id = id_allocator.next_id()
     pet_name = f"TestPet_{pet_id}"
     pet_status = "available"
     pet_data = {
@@ -148,11 +145,11 @@ def test_get_pet_by_invalid_id_fails(pet_api_client):
 
 
 @pytest.mark.xfail(reason="API returns 200 instead of 400 when 'name' is missing")
-def test_create_pet_with_missing_required_field_fails(pet_api_client):
+def test_create_pet_with_missing_required_field_fails(pet_api_client, id_allocator):
     """
     Test Case: Verifies that creating a pet without a required field ("name") fails.
     """
-    pet_id = random.randint(1000000, 9999999)
+    pet_id = id_allocator.next_id()
     pet_status = "available"
     pet_data = {
         "id": pet_id,
@@ -165,11 +162,11 @@ def test_create_pet_with_missing_required_field_fails(pet_api_client):
 
 
 @pytest.mark.xfail(reason="API accepts string for 'id' instead of integer, returning 200 OK.")
-def test_create_pet_with_invalid_id_type_fails(pet_api_client):
+def test_create_pet_with_invalid_id_type_fails(pet_api_client, id_allocator):
     """
     Test Case: Verifies that creating a pet with an invalid data type for 'id' fails.
     """
-    pet_id = random.randint(1000000, 9999999)
+    pet_id = id_allocator.next_id()
     pet_name = f"TestPet_{pet_id}"
     pet_status = "available"
     pet_data = {
@@ -0,0 +1,72 @@
+import time
+from endpoints.pet_api import PetAPI
+from endpoints.petstore_stub import STUB_BASE_URL, PetstoreStub, PetstoreStubServer, PetstoreStubTransport
+from endpoints.user_api import UserAPI
+
+# These tests exercise the stand-in itself, so they always run offline,
+# whichever backend the rest of the API suite is using.
+
+
+def test_stub_reproduces_read_after_write_lag():
+    """
+    Test Case: Verifies that a pet is not readable until the consistency delay has passed.
+    """
+    stub = PetstoreStub(consistency_delay=0.2)
+    with PetAPI(STUB_BASE_URL, transport=PetstoreStubTransport(stub)) as client:
+        create_response = client.create_pet({"id": 1, "name": "TestPet_1", "status": "available"})
+        assert create_response.status_code == 200, \
+            f"Expected status code 200 for pet creation, but got {create_response.status_code}."
+
+        stale_response = client.get_pet_by_id(1)
+        assert stale_response.status_code == 404, \
+            f"Expected 404 before the write is visible, but got {stale_response.status_code}."
+
+        time.sleep(0.25)
+        fresh_response = client.get_pet_by_id(1)
+        assert fresh_response.status_code == 200, \
+            f"Expected 200 once the write is visible, but got {fresh_response.status_code}."
+
+
+def test_stub_injects_errors_per_route():
+    """
+    Test Case: Verifies that the error rate knob only affects the configured route.
+    """
+    stub = PetstoreStub(error_rate={"GET /user/{username}": 1.0})
+    with UserAPI(STUB_BASE_URL, transport=PetstoreStubTransport(stub)) as client:
+        create_response = client.create_user({"id": 1, "username": "Test_Name_1"})
+        assert create_response.status_code == 200, \
+            f"Expected status code 200 for user creation, but got {create_response.status_code}."
+        get_response = client.get_user_by_username("Test_Name_1")
+        assert get_response.status_code == 500, \
+            f"Expected an injected 500, but got {get_response.status_code}."
+
+
+def test_stub_applies_latency_per_route():
+    """
+    Test Case: Verifies that the latency knob delays only the configured route.
+    """
+    stub = PetstoreStub(latency={"GET /pet/findByStatus": 0.2})
+    with PetAPI(STUB_BASE_URL, transport=PetstoreStubTransport(stub)) as client:
+        start = time.perf_counter()
+        client.get_pet_by_id(1)
+        fast_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        client.get_pet_by_status("available")
+        slow_elapsed = time.perf_counter() - start
+
+    assert fast_elapsed < 0.1, f"Expected an undelayed response, but it took {fast_elapsed:.3f}s."
+    assert slow_elapsed >= 0.2, f"Expected a delayed response, but it took {slow_elapsed:.3f}s."
+
+
+def test_stub_server_serves_clients_over_localhost():
+    """
+    Test Case: Verifies that the stand-in can be served over real HTTP on localhost.
+    """
+    with PetstoreStubServer() as server, PetAPI(server.base_url) as client:
+        create_response = client.create_pet({"id": 7, "name": "TestPet_7", "status": "sold"})
+        assert create_response.status_code == 200, \
+            f"Expected status code 200 for pet creation, but got {create_response.status_code}."
+        get_response = client.get_pet_by_status("sold")
+        assert [pet["id"] for pet in get_response.json()] == [7], \
+            f"Expected only pet 7 to be sold, but got {get_response.json()}."
@@ -0,0 +1,48 @@
+from endpoints.pet_api import PetAPI
+from endpoints.petstore_stub import STUB_BASE_URL, PetstoreStub, PetstoreStubTransport
+
+# These tests use their own stand-in so the consistency lag is under their control.
+
+
+def make_client(consistency_delay):
+    stub = PetstoreStub(consistency_delay=consistency_delay)
+    return PetAPI(STUB_BASE_URL, transport=PetstoreStubTransport(stub))
+
+
+def test_wait_for_pet_returns_after_a_single_probe_when_consistent():
+    """
+    Test Case: Verifies that an already consistent read costs exactly one request.
+    """
+    with make_client(consistency_delay=0) as client:
+        client.create_pet({"id": 1, "name": "TestPet_1", "status": "available"})
+        result = client.wait_for_pet(1)
+
+    assert result.converged, "Expected the poll to converge."
+    assert result.attempts == 1, f"Expected a single probe, but made {result.attempts}."
+
+
+def test_wait_for_pet_converges_shortly_after_the_consistency_lag():
+    """
+    Test Case: Verifies that polling returns soon after a lagging write becomes visible.
+    """
+    with make_client(consistency_delay=0.3) as client:
+        client.create_pet({"id": 2, "name": "TestPet_2", "status": "available"})
+        result = client.wait_for_pet(2, timeout=5)
+
+    assert result.converged, "Expected the poll to converge."
+    assert result.value.status_code == 200, \
+        f"Expected status code 200, but got {result.value.status_code}."
+    assert 0.3 <= result.elapsed < 1.0, f"Expected convergence just after 0.3s, but took {result.elapsed:.3f}s."
+
+
+def test_wait_for_pet_gives_up_at_the_deadline():
+    """
+    Test Case: Verifies that polling a missing pet stops at the overall deadline.
+    """
+    with make_client(consistency_delay=0) as client:
+        result = client.wait_for_pet(3, timeout=0.5)
+
+    assert not result.converged, "Expected the poll not to converge."
+    assert result.value.status_code == 404, \
+        f"Expected the last probe to return 404, but got {result.value.status_code}."
+    assert result.elapsed < 0.7, f"Expected to stop at the 0.5s deadline, but took {result.elapsed:.3f}s."
@@ -0,0 +1,100 @@
+import json
+import pytest
+from endpoints.async_pet_api import AsyncPetAPI
+from endpoints.pet_api import PetAPI
+from endpoints.petstore_stub import STUB_BASE_URL, PetstoreStub, PetstoreStubTransport
+from endpoints.streaming import iter_json_array
+
+PETS = [
+    {"id": 1, "name": "Doggie éè \U0001f415", "status": "available", "tags": [{"id": 1, "name": "a,b]"}]},
+    {"id": 2, "name": "Kitty", "status": "available", "photoUrls": []},
+    {"id": 3, "name": "Parrot", "status": "available", "category": {"id": 12345, "name": "birds"}},
+]
+
+
+def test_iter_json_array_matches_json_loads_when_fed_byte_by_byte():
+    """
+    Test Case: Verifies that items split across arbitrary chunk boundaries are parsed correctly.
+    """
+    body = json.dumps(PETS, indent=2).encode()
+    chunks = [body[i:i + 1] for i in range(len(body))]
+    assert list(iter_json_array(chunks)) == PETS, "Expected the streamed items to match json.loads."
+
+
+def test_iter_json_array_handles_scalar_items_across_chunks():
+    """
+    Test Case: Verifies that numbers split across chunks are not yielded prematurely.
+    """
+    assert list(iter_json_array([b"[12", b"34, 5", b"6]"])) == [1234, 56], \
+        "Expected numbers split across chunks to be reassembled."
+
+
+def test_iter_json_array_rejects_truncated_body():
+    """
+    Test Case: Verifies that a truncated array raises instead of silently ending.
+    """
+    with pytest.raises(ValueError):
+        list(iter_json_array([b'[{"id": 1}, {"id": ']))
+
+
+@pytest.mark.parametrize("chunks", [[b"[1 2]"], [b"[1", b" ", b"2]"], [b'[{"id": 1}{"id": 2}]']])
+def test_iter_json_array_rejects_items_without_a_comma(chunks):
+    """
+    Test Case: Verifies that array items must be separated by commas, even across chunks.
+    """
+    with pytest.raises(ValueError, match="Expected ',' or ']'"):
+        list(iter_json_array(chunks))
+
+
+@pytest.mark.parametrize("chunks", [[b"[1,]"], [b"[1,", b" ]"], [b"[,1]"], [b"[1,,2]"]])
+def test_iter_json_array_rejects_a_missing_item(chunks):
+    """
+    Test Case: Verifies that a trailing, leading or doubled comma is rejected.
+    """
+    with pytest.raises(ValueError, match="Expected an array item"):
+        list(iter_json_array(chunks))
+
+
+@pytest.mark.parametrize("chunks", [[b"[1, 2] 3"], [b"[1, 2]", b" \n", b"]"], [b"[][]"]])
+def test_iter_json_array_rejects_data_after_the_array(chunks):
+    """
+    Test Case: Verifies that only whitespace may follow the closing bracket.
+    """
+    with pytest.raises(ValueError, match="Unexpected data after the JSON array"):
+        list(iter_json_array(chunks))
+
+
+def test_iter_json_array_accepts_empty_array_and_trailing_whitespace():
+    """
+    Test Case: Verifies that the stricter checks still accept valid bodies.
+    """
+    assert list(iter_json_array([b" [ ] \n"])) == [], "Expected an empty array to give no items."
+    assert list(iter_json_array([b"[1", b",", b"2]\n"])) == [1, 2], \
+        "Expected a comma split from its items to be accepted."
+
+
+def test_find_pet_by_status_returns_first_match():
+    """
+    Test Case: Verifies that the streaming search finds a pet by predicate.
+    """
+    with PetAPI(STUB_BASE_URL, transport=PetstoreStubTransport(PetstoreStub())) as client:
+        for pet in PETS:
+            client.create_pet(pet)
+        found = client.find_pet_by_status("available", lambda pet: pet["name"] == "Kitty")
+        missing = client.find_pet_by_status("sold", lambda pet: True)
+
+    assert found == PETS[1], f"Expected to find Kitty, but got {found}."
+    assert missing is None, f"Expected no sold pets, but got {missing}."
+
+
+@pytest.mark.anyio
+async def test_async_iter_pets_by_status_streams_all_pets():
+    """
+    Test Case: Verifies that the async client streams every pet with the given status.
+    """
+    async with AsyncPetAPI(STUB_BASE_URL, transport=PetstoreStubTransport(PetstoreStub())) as client:
+        for pet in PETS:
+            await client.create_pet(pet)
+        streamed = [pet async for pet in client.iter_pets_by_status("available")]
+
+    assert streamed == PETS, f"Expected all available pets to be streamed, but got {streamed}."
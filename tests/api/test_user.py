@@ -1,16 +1,13 @@
-import random
 import pytest
-from tenacity import retry, stop_after_attempt, wait_fixed
 
 
-@retry(stop=stop_after_attempt(10), wait=wait_fixed(1))
 def get_user_with_retries(user_api_client, username):
     """
-    A helper function that attempts to get a user by username up to 10 times.
+    A helper function that polls a user by username until it is found, for up to 10 seconds.
     This is used to handle potential API consistency delays, where a newly
     created item might not be immediately available for retrieval.
     """
-    get_response = user_api_client.get_user_by_username(username)
+    get_response = user_api_client.wait_for_user(username, timeout=10).value
     assert get_response.status_code == 200, \
         f"Expected status code 200 for user retrieval, but got {get_response.status_code}."
     return get_response
@@ -20,15 +17,15 @@ def get_user_with_retries(user_api_client, username):
 
 @pytest.mark.xfail(reason="API returns 404 on DELETE during cleanup after user creation, indicating a consistency "
                           "issue.")
-def test_create_user_with_valid_data_is_successful(user_api_client):
+def test_create_user_with_valid_data_is_successful(user_api_client, id_allocator):
     """
     Test Case: Verifies that a new user can be successfully created with valid data.
     """
     # Generate a unique user ID and test data
-    user_id = random.randint(1000000, 9999999)
+    user_id = id_allocator.next_id()
     user_data = {
         "id": user_id,
-        "username": f"Test_Name_{user_id}",
+        "username": id_allocator.username(user_id),
         "firstName": f"Test_First_{user_id}",
         "lastName": f"Test_Second_{user_id}",
         "email": f"mail_{user_id}@test.com",
@@ -115,15 +112,15 @@ def test_update_existing_user_is_successful(user_api_client, created_username):
 
 
 @pytest.mark.xfail(reason="API returns 404 on DELETE for a recently created/retrieved user")
-def test_delete_user_is_successful(user_api_client):
+def test_delete_user_is_successful(user_api_client, id_allocator):
     """
     Test Case: Verifies that an existing user can be successfully deleted.
     """
     # Create a user to be deleted in the test
-    user_id = random.randint(1000000, 9999999)
+    user_id = id_allocator.next_id()
     user_data = {
         "id": user_id,
-        "username": f"Test_Name_{user_id}",
+        "username": id_allocator.username(user_id),
         "firstName": f"Test_First_{user_id}",
         "lastName": f"Test_Second_{user_id}",
         "email": f"mail_{user_id}@test.com",
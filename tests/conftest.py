@@ -1,33 +1,113 @@
 import pytest
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service as ChromeService
-from webdriver_manager.chrome import ChromeDriverManager
 import os
+import sys
 from dotenv import load_dotenv
-import random
 from endpoints.pet_api import PetAPI
 from endpoints.user_api import UserAPI
-from pages.cart_page import CartPage
-from pages.checkout_page_1 import CheckoutPageOne
-from pages.login_page import LoginPage
-from pages.products_page import ProductsPage
-from selenium.webdriver.chrome.options import Options
-import allure
+from endpoints.async_pet_api import AsyncPetAPI
+from endpoints.async_user_api import AsyncUserAPI
+from endpoints.cache import ResponseCache
+from endpoints.id_allocator import IdAllocator, run_number, worker_index
+from endpoints.petstore_stub import STUB_API_KEY, STUB_BASE_URL, PetstoreStub, PetstoreStubTransport
+from endpoints.polling import convergence_stats
+from tests.parallel import publish, run_id_key, worker_id, worker_payloads
+
+# Project pytest plugins. UI-only dependencies (selenium, the page objects and
+# the browser package) are imported inside the fixtures that need them, so
+# API-only runs never load them; check with `python -m tests.import_report`.
+pytest_plugins = [
+    "tests.plugins.xdist_support",
+    "tests.plugins.api_latency",
+    "tests.plugins.api_cleanup",
+    "tests.plugins.driver_pool",
+    "tests.plugins.resource_blocking",
+    "tests.plugins.failure_artifacts",
+    "tests.plugins.history_order",
+    "tests.plugins.wait_report",
+    # Runs small test suites in-process to check the plugins above (tests/suite)
+    "pytester",
+]
 
 # Load environment variables from a .env file
 load_dotenv()
 
+# Where the session's GET response cache is kept for the end-of-run summary
+api_response_cache_key = pytest.StashKey()
+
+
+def pytest_addoption(parser):
+    """
+    Registers the project's command line options.
+    """
+    parser.addoption(
+        "--api-backend",
+        choices=["live", "stub"],
+        default=os.getenv("API_BACKEND", "live"),
+        help="Run API tests against the live Petstore or the in-process stand-in "
+             "(defaults to the API_BACKEND environment variable, then 'live').",
+    )
+    parser.addoption(
+        "--run-seed",
+        default=os.getenv("TEST_RUN_SEED"),
+        help="Seed for the IDs and usernames of created test data; the same seed reproduces "
+             "the same IDs (defaults to TEST_RUN_SEED, then a random id per run).",
+    )
+
+
+def pytest_report_header(config):
+    """
+    Shows which run seed and run number the created test data is traceable to.
+    """
+    seed = run_seed(config)
+    return f"test data run seed: {seed} (run number {run_number(seed)})"
+
+
+def run_seed(config):
+    """
+    Returns the run seed shared by the controller and all xdist workers.
+    """
+    return config.getoption("--run-seed") or config.stash[run_id_key]
+
+
+def pytest_configure(config):
+    """
+    Registers the project's markers.
+    """
+    config.addinivalue_line(
+        "markers", "real_login: always log in through the login form, even when UI_FAST_LOGIN is enabled"
+    )
+
 
 @pytest.fixture(scope="session")
-def config():
+def config(request):
     """
     Provides configuration data loaded from environment variables.
     This fixture has a 'session' scope, meaning it's created once per test session.
     """
+    api_backend = request.config.getoption("--api-backend")
     return {
         "API": {
-            "BASE_URL": os.getenv("API_BASE_URL"),
-            "SPECIAL_KEY": os.getenv("API_SPECIAL_KEY")
+            "BACKEND": api_backend,
+            "BASE_URL": STUB_BASE_URL if api_backend == "stub" else os.getenv("API_BASE_URL"),
+            # The stand-in accepts any key, but PetAPI.delete_pet insists on one
+            "SPECIAL_KEY": os.getenv("API_SPECIAL_KEY") or (STUB_API_KEY if api_backend == "stub" else None),
+            # Prefix of the usernames created by the tests
+            "TEST_DATA_PREFIX": os.getenv("TEST_DATA_PREFIX", "qa"),
+            # Delete created pets/users in each test's teardown instead of in the background
+            "STRICT_CLEANUP": os.getenv("API_STRICT_CLEANUP", "false").lower() == "true",
+            # Connection pool and timeout settings shared by the API clients
+            "TIMEOUT": float(os.getenv("API_TIMEOUT", "10")),
+            "MAX_CONNECTIONS": int(os.getenv("API_MAX_CONNECTIONS", "20")),
+            "MAX_KEEPALIVE_CONNECTIONS": int(os.getenv("API_MAX_KEEPALIVE_CONNECTIONS", "10")),
+            # Opt-in HTTP/2: "true" negotiates it over TLS, "h2c" uses cleartext prior knowledge
+            "HTTP2": {"true": True, "h2c": "h2c"}.get(os.getenv("API_HTTP2", "false").lower(), False),
+            # GET response cache shared by the API clients; a TTL of 0 disables it
+            "CACHE_TTL": float(os.getenv("API_CACHE_TTL", "0")),
+            "CACHE_MAX_ENTRIES": int(os.getenv("API_CACHE_MAX_ENTRIES", "256")),
+            # Knobs for the in-process Petstore stand-in (API_BACKEND=stub)
+            "STUB_LATENCY": float(os.getenv("STUB_LATENCY", "0")),
+            "STUB_ERROR_RATE": float(os.getenv("STUB_ERROR_RATE", "0")),
+            "STUB_CONSISTENCY_DELAY": float(os.getenv("STUB_CONSISTENCY_DELAY", "0")),
         },
         "UI_SAUCEDEMO": {
             "BASE_URL": os.getenv("SAUCE_BASE_URL"),
@@ -39,104 +119,165 @@ def config():
             "ERROR_USER": os.getenv("SAUCE_ERROR_USER"),
             "VISUAL_USER": os.getenv("SAUCE_VISUAL_USER"),
             "INVALID_PASSWORD": os.getenv("SAUCE_INVALID_PASSWORD"),
+            # Tests a pooled browser serves before it is replaced; 1 launches a fresh one per test
+            "DRIVER_MAX_USES": int(os.getenv("UI_DRIVER_MAX_USES", "50")),
+            # Browsers warmed up in the background for the next tests (0 disables), and the
+            # memory all browsers of one worker may use before no more spares are launched
+            "DRIVER_SPARES": int(os.getenv("UI_DRIVER_SPARES", "0")),
+            "DRIVER_MEMORY_LIMIT_MB": float(os.getenv("UI_DRIVER_MEMORY_LIMIT_MB", "0")) or None,
+            # Log in through the session cookie instead of the form (tests marked real_login excepted)
+            "FAST_LOGIN": os.getenv("UI_FAST_LOGIN", "false").lower() == "true",
+            # Page objects reuse elements located earlier on an unchanged page
+            "ELEMENT_CACHE": os.getenv("UI_ELEMENT_CACHE", "false").lower() == "true",
+            # Waits block in the page on a MutationObserver instead of polling every 500 ms
+            "OBSERVER_WAITS": os.getenv("UI_OBSERVER_WAITS", "true").lower() == "true",
+            # Resource types (image, font, media, stylesheet) and URL patterns the browsers do not load
+            # (tests marked load_resources excepted)
+            "BLOCK_RESOURCES": [kind.strip() for kind in os.getenv("UI_BLOCK_RESOURCES", "").split(",")
+                                if kind.strip()],
+            "BLOCK_URLS": [url.strip() for url in os.getenv("UI_BLOCK_URLS", "").split(",") if url.strip()],
+            # Failure screenshots (JPEG quality, 0 = PNG), DOM snapshots and console logs, and their size limits
+            "ARTIFACT_SCREENSHOT_QUALITY": int(os.getenv("UI_ARTIFACT_SCREENSHOT_QUALITY", "60")),
+            "ARTIFACT_MAX_SCREENSHOT_KB": int(os.getenv("UI_ARTIFACT_MAX_SCREENSHOT_KB", "1024")),
+            "ARTIFACT_MAX_DOM_KB": int(os.getenv("UI_ARTIFACT_MAX_DOM_KB", "512")),
+            "ARTIFACT_MAX_CONSOLE_KB": int(os.getenv("UI_ARTIFACT_MAX_CONSOLE_KB", "64")),
+            "ARTIFACT_MAX_TOTAL_MB": int(os.getenv("UI_ARTIFACT_MAX_TOTAL_MB", "200")),
         }
     }
 
 
 @pytest.fixture(scope="function")
-def driver(config, tmp_path):
+def driver(driver_pool, failure_artifacts, resource_blocker, request):
     """
-    Initializes and configures the Selenium WebDriver for Chrome.
-    It uses a new, unique temporary directory for each test function to prevent
-    'SessionNotCreatedException' errors.
+    Provides a headless Chrome WebDriver for one test.
+    Browsers come from the session's `driver_pool`: they are reused across
+    tests but reset to a clean state (no cookies, storage, cart or extra
+    windows) on the base URL before each test, and replaced after
+    UI_DRIVER_MAX_USES tests or as soon as they crash. With UI_DRIVER_SPARES
+    set, the next browsers are launched and warmed up while this test runs.
+    If the test fails, its screenshot, DOM and console log are attached to the
+    Allure report by `failure_artifacts`. With UI_BLOCK_RESOURCES or
+    UI_BLOCK_URLS set, those resources are not loaded, except in tests marked
+    `load_resources`.
     """
-    base_url = config['UI_SAUCEDEMO']['BASE_URL']
-    chrome_options = Options()
-
-    # Create a unique temporary directory for the user data to prevent conflicts
-    user_data_dir = os.path.join(tmp_path, "chrome-test-profile")
-    chrome_options.add_argument(f"--user-data-dir={user_data_dir}")
-
-    # Add other configuration options
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--window-size=1920,1080")
-    chrome_options.add_argument("--disable-popup-blocking")
-    chrome_options.add_argument("--disable-extensions")
-    chrome_options.add_argument("--disable-save-password-bubble")
-    chrome_options.add_argument("--disable-password-manager-reauthentication")
-    chrome_options.add_argument("--incognito")
-    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-    chrome_options.add_argument("--headless")
-
-    prefs = {
-        "credentials_enable_service": False,
-        "profile.password_manager_enabled": False,
-        "profile.default_content_setting_values.notifications": 2,
-        "profile.default_content_setting_values.automatic_downloads": 1,
-        "profile.default_content_setting_values.popups": 0,
-    }
-    chrome_options.add_experimental_option("prefs", prefs)
-
-    # Initialize driver to None to prevent 'referenced before assignment' error
-    driver = None
+    driver = driver_pool.acquire()
+    block = resource_blocker is not None and request.node.get_closest_marker("load_resources") is None
     try:
-        service = ChromeService(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=chrome_options)
-        driver.get(base_url)
+        if resource_blocker is not None:
+            resource_blocker.start(driver, block)
+        yield driver
+    finally:
+        if resource_blocker is not None:
+            try:
+                resource_blocker.finish(driver, block)
+            except Exception as e:
+                print(f"Could not record the blocked resources due to an error: {e}")
+        driver_pool.release(driver)
 
-        # Clear all cookies and storage to ensure a clean state
-        driver.delete_all_cookies()
-        driver.execute_script("window.localStorage.clear();")
-        driver.execute_script("window.sessionStorage.clear();")
 
-        yield driver
+def pytest_sessionfinish(session):
+    """
+    Hands this xdist worker's cache counters and poll statistics to the controller.
+    """
+    cache = session.config.stash.get(api_response_cache_key, None)
+    if cache is not None:
+        publish(session.config, "api_response_cache", cache.stats())
+    publish(session.config, "api_convergence", convergence_stats.dump())
+    element_cache = _element_cache_stats()
+    if element_cache is not None:
+        publish(session.config, "element_cache", element_cache.dump())
 
-    finally:
-        # Check if the driver was successfully initialized before quitting
-        if driver is not None:
-            driver.quit()
-
-
-@pytest.hookimpl(tryfirst=True, hookwrapper=True)
-def pytest_runtest_makereport(item, call):
-    """
-    Pytest hook to capture a screenshot on test failure for Allure reports.
-    This function is executed after each test function runs.
-    """
-    # Execute all other hooks to obtain the report object
-    outcome = yield
-    report = outcome.get_result()
-
-    # Check if the test failed during the 'call' phase
-    if report.when == "call" and report.failed:
-        try:
-            # Get the driver instance from the test item
-            driver = item.funcargs['driver']
-            # Attach the screenshot to the Allure report
-            allure.attach(
-                driver.get_screenshot_as_png(),
-                name="screenshot",
-                attachment_type=allure.attachment_type.PNG
+
+def pytest_terminal_summary(terminalreporter):
+    """
+    Prints how long eventual-consistency polls took to converge, per route,
+    and the GET response cache counters when caching is enabled. Under xdist
+    the numbers of all workers are combined.
+    """
+    config = terminalreporter.config
+    cache = config.stash.get(api_response_cache_key, None)
+    cache_stats = worker_payloads(config, "api_response_cache") + ([cache.stats()] if cache is not None else [])
+    if cache_stats:
+        stats = {key: sum(worker[key] for worker in cache_stats)
+                 for key in ("hits", "misses", "evictions", "invalidations")}
+        lookups = stats['hits'] + stats['misses']
+        terminalreporter.section("API response cache")
+        terminalreporter.write_line(
+            f"{stats['hits']} hits, {stats['misses']} misses "
+            f"({stats['hits'] / lookups if lookups else 0.0:.0%} hit rate), "
+            f"{stats['invalidations']} invalidated, {stats['evictions']} evicted"
+        )
+
+    element_cache = _element_cache_stats()
+    element_cache_dumps = worker_payloads(config, "element_cache")
+    if element_cache_dumps and element_cache is None:
+        from pages.element_cache import element_cache_stats as element_cache
+    for dumped in element_cache_dumps:
+        element_cache.merge(dumped)
+    if element_cache is not None and element_cache.summary():
+        terminalreporter.section("Page element cache")
+        for label, stats in sorted(element_cache.summary().items()):
+            terminalreporter.write_line(
+                f"{label}: {stats['hits']} hits, {stats['misses']} misses ({stats['hit_rate']:.0%} hit rate), "
+                f"{stats['stale']} stale, {stats['invalidations']} invalidated by page changes"
             )
-        except Exception as e:
-            print(f"Could not take a screenshot due to an error: {e}")
+
+    for dumped in worker_payloads(config, "api_convergence"):
+        convergence_stats.merge(dumped)
+    summary = convergence_stats.summary()
+    if not summary:
+        return
+    terminalreporter.section("API convergence")
+    for label, stats in sorted(summary.items()):
+        terminalreporter.write_line(
+            f"{label}: {stats['calls']} polls, {stats['timeouts']} timed out, "
+            f"avg {stats['avg_seconds']:.3f}s, max {stats['max_seconds']:.3f}s, "
+            f"avg {stats['avg_attempts']:.1f} attempts"
+        )
 
 
 @pytest.fixture(scope="function")
-def logged_in_standard_user(driver, config, login_page, products_page):
+def logged_in_standard_user(driver, config, login_page, products_page, request):
     """
     Logs in a standard user and navigates to the products page.
     This is a convenience fixture for tests that require an authenticated user state.
+    With UI_FAST_LOGIN=true the session cookie is set directly (falling back to
+    the form if that fails), except for tests marked `real_login`.
     Returns an instance of the ProductsPage.
     """
-    login_page.open_url(config['UI_SAUCEDEMO']['BASE_URL'])
-    login_page.login(config['UI_SAUCEDEMO']['USERNAME'], config['UI_SAUCEDEMO']['PASSWORD'])
+    base_url = config['UI_SAUCEDEMO']['BASE_URL']
+    username, password = config['UI_SAUCEDEMO']['USERNAME'], config['UI_SAUCEDEMO']['PASSWORD']
+    if config['UI_SAUCEDEMO']['FAST_LOGIN'] and request.node.get_closest_marker("real_login") is None:
+        login_path = login_page.fast_login(base_url, username, password)
+    else:
+        login_page.open_url(base_url)
+        login_page.login(username, password)
+        login_path = "form"
+    # Recorded in the JUnit report, to spot a fast path that keeps falling back
+    request.node.user_properties.append(("login_path", login_path))
     login_page.wait_for_url("https://www.saucedemo.com/inventory.html")
     return products_page
 
 
+def _element_cache_stats():
+    # Page objects (and their cache) are only imported by UI tests
+    module = sys.modules.get("pages.element_cache")
+    return module.element_cache_stats if module is not None else None
+
+
+@pytest.fixture(scope="session")
+def page_settings(config):
+    """
+    Provides the page object settings (UI_ELEMENT_CACHE, UI_OBSERVER_WAITS)
+    the page fixtures pass on; pages created while navigating inherit them.
+    """
+    from pages.base_page import PageSettings
+    return PageSettings(
+        cache_elements=config['UI_SAUCEDEMO']['ELEMENT_CACHE'],
+        observer_waits=config['UI_SAUCEDEMO']['OBSERVER_WAITS']
+    )
+
+
 # =========================================================================
 # Page Object Fixtures
 # These fixtures provide instances of page object classes to the tests,
@@ -144,27 +285,31 @@ def logged_in_standard_user(driver, config, login_page, products_page):
 # =========================================================================
 
 @pytest.fixture(scope="function")
-def login_page(driver):
+def login_page(driver, page_settings):
     """Provides an instance of the LoginPage."""
-    return LoginPage(driver)
+    from pages.login_page import LoginPage
+    return LoginPage(driver, page_settings)
 
 
 @pytest.fixture(scope="function")
-def products_page(driver):
+def products_page(driver, page_settings):
     """Provides an instance of the ProductsPage."""
-    return ProductsPage(driver)
+    from pages.products_page import ProductsPage
+    return ProductsPage(driver, page_settings)
 
 
 @pytest.fixture(scope="function")
-def cart_page(driver):
+def cart_page(driver, page_settings):
     """Provides an instance of the CartPage."""
-    return CartPage(driver)
+    from pages.cart_page import CartPage
+    return CartPage(driver, page_settings)
 
 
 @pytest.fixture(scope="function")
-def checkout_page_1(driver):
+def checkout_page_1(driver, page_settings):
     """Provides an instance of the CheckoutPageOne."""
-    return CheckoutPageOne(driver)
+    from pages.checkout_page_1 import CheckoutPageOne
+    return CheckoutPageOne(driver, page_settings)
 
 
 # =========================================================================
@@ -173,34 +318,142 @@ def checkout_page_1(driver):
 # =========================================================================
 
 @pytest.fixture(scope="session")
-def pet_api_client(config):
+def petstore_stub(config):
+    """
+    Provides the in-process Petstore stand-in served to the API clients when
+    running with `--api-backend=stub`. Tests can tune its latency, error rate
+    and consistency delay at runtime.
+    """
+    return PetstoreStub(
+        latency=config['API']['STUB_LATENCY'],
+        error_rate=config['API']['STUB_ERROR_RATE'],
+        consistency_delay=config['API']['STUB_CONSISTENCY_DELAY'],
+    )
+
+
+@pytest.fixture(scope="session")
+def api_response_cache(config, request):
+    """
+    Provides the GET response cache shared by all API clients, or None when
+    caching is disabled (API_CACHE_TTL unset or 0). Sharing one cache lets a
+    write through any client invalidate what the others have cached.
+    """
+    if config['API']['CACHE_TTL'] <= 0:
+        return None
+    cache = ResponseCache(ttl=config['API']['CACHE_TTL'], max_entries=config['API']['CACHE_MAX_ENTRIES'])
+    request.config.stash[api_response_cache_key] = cache
+    return cache
+
+
+@pytest.fixture(scope="session")
+def api_client_options(config, api_response_cache, api_latency_recorder, request):
+    """
+    Builds the connection pool, timeout, cache, hook and transport keyword
+    arguments shared by all API clients.
+    """
+    options = {
+        "timeout": config['API']['TIMEOUT'],
+        "max_connections": config['API']['MAX_CONNECTIONS'],
+        "max_keepalive_connections": config['API']['MAX_KEEPALIVE_CONNECTIONS'],
+        "http2": config['API']['HTTP2'],
+        "cache": api_response_cache,
+        "hooks": [api_latency_recorder],
+    }
+    if config['API']['BACKEND'] == "stub":
+        options["transport"] = PetstoreStubTransport(request.getfixturevalue("petstore_stub"))
+    return options
+
+
+@pytest.fixture(scope="session")
+def pet_api_client(config, api_client_options):
     """
     Provides an API client for the Pet endpoint.
-    'session' scope means the client is created once for the entire test session.
+    'session' scope means the client (and its pooled connections) is created once
+    for the entire test session and closed at session teardown.
     """
     base_url = config['API']['BASE_URL']
-    return PetAPI(base_url)
+    with PetAPI(base_url, api_key=config['API']['SPECIAL_KEY'], **api_client_options) as client:
+        yield client
 
 
 @pytest.fixture(scope="session")
-def user_api_client(config):
+def user_api_client(config, api_client_options):
     """
     Provides an API client for the User endpoint.
-    'session' scope means the client is created once for the entire test session.
+    'session' scope means the client (and its pooled connections) is created once
+    for the entire test session and closed at session teardown.
     """
     base_url = config['API']['BASE_URL']
-    return UserAPI(base_url)
+    with UserAPI(base_url, **api_client_options) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def anyio_backend():
+    """
+    Selects the event loop backend for async tests (`@pytest.mark.anyio`).
+    'session' scope lets the async API clients below share one event loop
+    with every async test in the session.
+    """
+    return "asyncio"
+
+
+@pytest.fixture(scope="session")
+async def async_pet_api_client(config, api_client_options, anyio_backend):
+    """
+    Provides an asynchronous API client for the Pet endpoint.
+    Created once per test session and closed at session teardown.
+    """
+    base_url = config['API']['BASE_URL']
+    async with AsyncPetAPI(base_url, api_key=config['API']['SPECIAL_KEY'], **api_client_options) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+async def async_user_api_client(config, api_client_options, anyio_backend):
+    """
+    Provides an asynchronous API client for the User endpoint.
+    Created once per test session and closed at session teardown.
+    """
+    base_url = config['API']['BASE_URL']
+    async with AsyncUserAPI(base_url, **api_client_options) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def id_allocator(config, request):
+    """
+    Provides collision-free IDs and usernames for created test data.
+    Every xdist worker draws from its own block, and all IDs encode the run
+    seed shown in the report header, so leftovers are traceable to their run.
+    """
+    return IdAllocator(
+        run_seed(request.config),
+        worker=worker_index(worker_id(request.config)),
+        prefix=config['API']['TEST_DATA_PREFIX'],
+    )
+
+
+def delete_created_entity(config, request, api_cleanup, description, operation, *args):
+    """
+    Deletes a created entity: in the background by default, or right away
+    (failing the teardown if it can't) for tests marked `strict_cleanup`.
+    """
+    if config['API']['STRICT_CLEANUP'] or request.node.get_closest_marker("strict_cleanup"):
+        api_cleanup.run_now(description, operation, *args)
+    else:
+        api_cleanup.defer(description, operation, *args)
 
 
 @pytest.fixture(scope="function")
-def created_pet_id(pet_api_client):
+def created_pet_id(pet_api_client, id_allocator, api_cleanup, config, request):
     """
     Creates a new pet via API before a test and deletes it after the test.
     This ensures each test runs with a new, known pet entity.
     Yields the ID of the created pet.
     """
     # --- Setup: Create a pet ---
-    pet_id = random.randint(1000000, 9999999)
+    pet_id = id_allocator.next_id()
     pet_name = f"TestPet_{pet_id}"
     pet_status = "available"
     pet_data = {
@@ -213,22 +466,22 @@ def created_pet_id(pet_api_client):
 
     yield pet_id  # Provide the pet ID to the test
 
-    # --- Teardown: Delete the pet ---
-    pet_api_client.delete_pet(pet_id)
+    # --- Teardown: Queue the pet for deletion ---
+    delete_created_entity(config, request, api_cleanup, f"pet {pet_id}", pet_api_client.delete_pet, pet_id)
 
 
 @pytest.fixture(scope="function")
-def created_username(user_api_client):
+def created_username(user_api_client, id_allocator, api_cleanup, config, request):
     """
     Creates a new user via API before a test and deletes it after the test.
     This ensures test isolation by providing a fresh user for each test function.
     Yields the username of the created user.
     """
     # --- Setup: Create a user ---
-    user_id = random.randint(1000000, 9999999)
+    user_id = id_allocator.next_id()
     user_data = {
         "id": user_id,
-        "username": f"Test_Name_{user_id}",
+        "username": id_allocator.username(user_id),
         "firstName": f"Test_First_{user_id}",
         "lastName": f"Test_Second_{user_id}",
         "email": f"mail_{user_id}@test.com",
@@ -241,5 +494,6 @@ def created_username(user_api_client):
 
     yield user_data["username"]  # Provide the username to the test
 
-    # --- Teardown: Delete the user ---
-    user_api_client.delete_user(user_data["username"])
\ No newline at end of file
+    # --- Teardown: Queue the user for deletion ---
+    delete_created_entity(config, request, api_cleanup, f"user {user_data['username']}",
+                          user_api_client.delete_user, user_data["username"])
\ No newline at end of file
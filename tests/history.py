@@ -0,0 +1,96 @@
+from statistics import fmean
+
+# Where the history is kept in pytest's cache (.pytest_cache)
+HISTORY_CACHE_KEY = "qa_automation/test_history"
+# Runs of durations and outcomes remembered per test
+RECENT_RUNS = 5
+# A test that failed in any of this many runs counts as recently failing
+FAILING_WINDOW = 3
+# Tests that have not run for this many runs are forgotten
+FORGET_AFTER_RUNS = 50
+
+
+class RunHistory:
+    """
+    The durations and outcomes of each test over its last runs, used to run
+    recently failing and fast tests first.
+
+    `order()` puts tests that failed in one of the last runs first (the most
+    recent failures leading), then tests without any history, then the rest
+    from fastest to slowest. Ties keep the collection order, so without any
+    history the order is exactly the collection order.
+    """
+
+    def __init__(self, tests=None, run=0):
+        """
+        Args:
+            tests (dict, optional): Per node id: {"durations": [seconds, ...],
+                                    "outcomes": "PPF" (oldest first), "last_run": int}.
+            run (int, optional): How many runs have been recorded.
+        """
+        self.tests = tests or {}
+        self.run = run
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Restores a history saved with `to_dict()`; anything unreadable starts empty.
+        """
+        if not isinstance(data, dict) or not isinstance(data.get("tests"), dict):
+            return cls()
+        return cls(data["tests"], data.get("run", 0))
+
+    def to_dict(self):
+        """
+        Returns the history as JSON-serializable data.
+        """
+        return {"run": self.run, "tests": self.tests}
+
+    def record(self, results):
+        """
+        Adds the results of one run.
+
+        Args:
+            results (dict): Per node id: (seconds, failed), the test's total
+                            setup, call and teardown time and whether any phase failed.
+        """
+        self.run += 1
+        for nodeid, (seconds, failed) in results.items():
+            entry = self.tests.setdefault(nodeid, {"durations": [], "outcomes": ""})
+            entry["durations"] = (entry["durations"] + [round(seconds, 4)])[-RECENT_RUNS:]
+            entry["outcomes"] = (entry["outcomes"] + ("F" if failed else "P"))[-RECENT_RUNS:]
+            entry["last_run"] = self.run
+        self.tests = {nodeid: entry for nodeid, entry in self.tests.items()
+                      if self.run - entry.get("last_run", 0) < FORGET_AFTER_RUNS}
+
+    def order(self, nodeids):
+        """
+        Returns the positions of `nodeids` in the order they should run.
+
+        Args:
+            nodeids (list[str]): The collected tests, in collection order.
+
+        Returns:
+            list[int]: Indexes into `nodeids`.
+        """
+        return sorted(range(len(nodeids)), key=lambda index: self._rank(nodeids[index]))
+
+    def classify(self, nodeid):
+        """
+        Returns "failing", "new" or "passing" for a test.
+        """
+        entry = self.tests.get(nodeid)
+        if entry is None or not entry["outcomes"]:
+            return "new"
+        return "failing" if "F" in entry["outcomes"][-FAILING_WINDOW:] else "passing"
+
+    def _rank(self, nodeid):
+        kind = self.classify(nodeid)
+        if kind == "new":
+            return (1, 0, 0.0)
+        entry = self.tests[nodeid]
+        duration = fmean(entry["durations"]) if entry["durations"] else 0.0
+        if kind == "failing":
+            # Runs since the last failure: 0 if it failed in the latest run
+            return (0, len(entry["outcomes"]) - 1 - entry["outcomes"].rindex("F"), duration)
+        return (2, 0, duration)
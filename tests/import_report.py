@@ -0,0 +1,155 @@
+import argparse
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+
+# Packages only the UI tests need; an API-only run must not import any of them
+UI_ONLY_MODULES = ("selenium", "webdriver_manager", "faker", "pages", "browser")
+
+
+@dataclass
+class ImportTiming:
+    """
+    One line of `python -X importtime` output.
+
+    Attributes:
+        module (str): The imported module.
+        depth (int): How deeply the import is nested (0 for a top-level import).
+        self_us (int): Microseconds spent in the module itself.
+        cumulative_us (int): Microseconds including everything it imported.
+    """
+    module: str
+    depth: int
+    self_us: int
+    cumulative_us: int
+
+
+@dataclass
+class ImportReport:
+    """
+    What a pytest collection imported and how long it took.
+
+    Attributes:
+        wall_seconds (float): Wall-clock time of the whole `pytest --collect-only` process.
+        imports (list[ImportTiming]): Every module imported, in import order.
+        returncode (int): The exit code of the pytest process.
+    """
+    wall_seconds: float
+    imports: list = field(default_factory=list)
+    returncode: int = 0
+
+    @property
+    def import_seconds(self):
+        """
+        Returns the time spent in top-level imports.
+        """
+        return sum(timing.cumulative_us for timing in self.imports if timing.depth == 0) / 1_000_000
+
+    def top(self, count=15):
+        """
+        Returns the `count` slowest top-level imports.
+        """
+        top_level = [timing for timing in self.imports if timing.depth == 0]
+        return sorted(top_level, key=lambda timing: timing.cumulative_us, reverse=True)[:count]
+
+    def loaded(self, packages):
+        """
+        Returns the imported modules that belong to any of `packages`.
+        """
+        return [timing.module for timing in self.imports
+                if any(timing.module == package or timing.module.startswith(f"{package}.") for package in packages)]
+
+    def format(self, count=15):
+        """
+        Renders the report as text.
+        """
+        lines = [f"collection took {self.wall_seconds:.2f}s, {self.import_seconds:.2f}s of it in imports "
+                 f"({len(self.imports)} modules)"]
+        lines += [f"{timing.cumulative_us / 1000:9.1f} ms  {timing.module}" for timing in self.top(count)]
+        return "\n".join(lines)
+
+
+def parse_importtime(lines):
+    """
+    Parses the stderr of `python -X importtime`, ignoring any other output.
+
+    Args:
+        lines (iterable[str]): The stderr lines.
+
+    Returns:
+        list[ImportTiming]: The parsed imports.
+    """
+    timings = []
+    for line in lines:
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|", 2)
+        if not self_us.strip().isdigit():
+            # The header line
+            continue
+        name = module.rstrip()
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        timings.append(ImportTiming(name.strip(), depth, int(self_us), int(cumulative_us)))
+    return timings
+
+
+def collect_imports(pytest_args, runs=1):
+    """
+    Runs `pytest --collect-only` in a fresh interpreter under `-X importtime`.
+
+    The first collection of a checkout also compiles and rewrites the test
+    modules, so with several runs the fastest one is reported, as `timeit` does.
+
+    Args:
+        pytest_args (list[str]): Paths and options passed on to pytest.
+        runs (int, optional): How many times to collect.
+
+    Returns:
+        ImportReport: The timing of the fastest collection and everything it imported.
+    """
+    command = [sys.executable, "-X", "importtime", "-m", "pytest", "--collect-only", "-q",
+               # Without -s pytest captures the importtime output of conftest imports
+               "-s", "-p", "no:cacheprovider", *pytest_args]
+    reports = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = subprocess.run(command, capture_output=True, text=True)
+        wall_seconds = time.perf_counter() - started
+        reports.append(ImportReport(wall_seconds, parse_importtime(result.stderr.splitlines()), result.returncode))
+    return min(reports, key=lambda report: report.wall_seconds)
+
+
+def main(argv=None):
+    """
+    Reports the import cost of collecting the given tests, e.g. to keep API-only jobs fast:
+
+        python -m tests.import_report --budget 1 --forbid-ui tests/api --api-backend=stub
+    """
+    parser = argparse.ArgumentParser(description="Report what collecting the test suite imports and how long it takes.")
+    parser.add_argument("--top", type=int, default=15, help="Slowest top-level imports to list.")
+    parser.add_argument("--runs", type=int, default=3, help="Collections to time; the fastest one is reported.")
+    parser.add_argument("--budget", type=float, help="Fail if collection takes longer than this many seconds.")
+    parser.add_argument("--forbid", action="append", default=[], help="Fail if this package gets imported.")
+    parser.add_argument("--forbid-ui", action="store_true",
+                        help=f"Fail if any UI-only package is imported ({', '.join(UI_ONLY_MODULES)}).")
+    args, pytest_args = parser.parse_known_args(argv)
+
+    report = collect_imports(pytest_args, args.runs)
+    print(report.format(args.top))
+    failed = report.returncode != 0
+    if failed:
+        print(f"pytest --collect-only exited with {report.returncode}")
+
+    forbidden = report.loaded(args.forbid + list(UI_ONLY_MODULES if args.forbid_ui else ()))
+    if forbidden:
+        failed = True
+        print(f"forbidden imports: {', '.join(forbidden[:10])}{' ...' if len(forbidden) > 10 else ''}")
+    if args.budget is not None and report.wall_seconds > args.budget:
+        failed = True
+        print(f"collection took {report.wall_seconds:.2f}s, over the {args.budget:.2f}s budget")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
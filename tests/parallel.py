@@ -0,0 +1,40 @@
+import pytest
+
+# Per-process statistics received from xdist workers, keyed by name
+worker_payloads_key = pytest.StashKey()
+# Identifier shared by the controller and all workers of one test run
+run_id_key = pytest.StashKey()
+
+# The key under which this project's data travels in xdist's `workeroutput`
+WORKER_OUTPUT_KEY = "qa_automation"
+
+
+def is_xdist_worker(config):
+    """
+    Returns True in a pytest-xdist worker process.
+    """
+    return hasattr(config, "workerinput")
+
+
+def worker_id(config):
+    """
+    Returns the xdist worker name ("gw0", "gw1", ...) or "main" when not running distributed.
+    """
+    return config.workerinput["workerid"] if is_xdist_worker(config) else "main"
+
+
+def publish(config, name, payload):
+    """
+    Sends JSON-serializable `payload` from an xdist worker to the controller,
+    where `worker_payloads(config, name)` returns it. Does nothing outside xdist.
+    Call it from `pytest_sessionfinish`, once the session's fixtures are torn down.
+    """
+    if is_xdist_worker(config):
+        config.workeroutput.setdefault(WORKER_OUTPUT_KEY, {})[name] = payload
+
+
+def worker_payloads(config, name):
+    """
+    Returns the payloads every finished worker published under `name`.
+    """
+    return config.stash.get(worker_payloads_key, {}).get(name, [])
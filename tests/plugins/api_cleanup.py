@@ -0,0 +1,67 @@
+import dataclasses
+import json
+import pytest
+from endpoints.cleanup import CleanupQueue
+from tests.parallel import publish, worker_payloads
+
+# Where the session's cleanup queue is kept for the end-of-run summary
+api_cleanup_key = pytest.StashKey()
+
+
+@pytest.fixture(scope="session")
+def api_cleanup(pet_api_client, user_api_client, request):
+    """
+    Provides the session's cleanup queue for created pets and users.
+    It depends on the API clients so that it is drained before they close;
+    anything that still cannot be deleted is attached to the Allure results.
+    """
+    queue = CleanupQueue()
+    request.config.stash[api_cleanup_key] = queue
+    yield queue
+    failures = queue.close()
+    if failures:
+        import allure
+        allure.attach(
+            json.dumps([dataclasses.asdict(failure) for failure in failures], indent=2),
+            name="API test data left behind",
+            attachment_type=allure.attachment_type.JSON
+        )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "strict_cleanup: delete the test's API data synchronously in its own teardown"
+    )
+
+
+def pytest_sessionfinish(session):
+    queue = session.config.stash.get(api_cleanup_key, None)
+    if queue is not None:
+        publish(session.config, "api_cleanup", {
+            **queue.stats(),
+            "failures": [dataclasses.asdict(failure) for failure in queue.failures],
+        })
+
+
+def pytest_terminal_summary(terminalreporter):
+    """
+    Prints how much test data was deleted in the background and lists what
+    could not be cleaned up, over all xdist workers.
+    """
+    config = terminalreporter.config
+    queue = config.stash.get(api_cleanup_key, None)
+    reports = list(worker_payloads(config, "api_cleanup"))
+    if queue is not None:
+        reports.append({**queue.stats(), "failures": [dataclasses.asdict(failure) for failure in queue.failures]})
+    if not reports:
+        return
+    terminalreporter.section("API cleanup")
+    terminalreporter.write_line(
+        f"{sum(report['deleted'] for report in reports)} deleted "
+        f"({sum(report['retried'] for report in reports)} after retries), "
+        f"{sum(report['failed'] for report in reports)} left behind"
+    )
+    for report in reports:
+        for failure in report["failures"]:
+            reason = failure["error"] or f"status {failure['status']}"
+            terminalreporter.write_line(f"  could not delete {failure['description']}: {reason}")
@@ -0,0 +1,61 @@
+import json
+import pytest
+from endpoints.metrics import LatencyRecorder
+from tests.parallel import publish, worker_id, worker_payloads
+
+# Where the session's latency recorder is kept between hooks
+api_latency_key = pytest.StashKey()
+
+
+def pytest_configure(config):
+    """
+    Creates the session-wide recorder the API clients report every request to.
+    """
+    config.stash[api_latency_key] = LatencyRecorder()
+
+
+@pytest.fixture(scope="session")
+def api_latency_recorder(request):
+    """
+    Provides the `LatencyRecorder` hook shared by all API clients.
+    At session teardown the per-route percentiles are attached to the Allure results.
+    """
+    recorder = request.config.stash[api_latency_key]
+    yield recorder
+    summary = recorder.summary()
+    if summary:
+        import allure
+        allure.attach(
+            json.dumps(summary, indent=2),
+            name=f"API latency per route ({worker_id(request.config)})",
+            attachment_type=allure.attachment_type.JSON
+        )
+
+
+def pytest_sessionfinish(session):
+    publish(session.config, "api_latency", session.config.stash[api_latency_key].dump())
+
+
+def pytest_terminal_summary(terminalreporter):
+    """
+    Prints p50/p95/p99 latency (in milliseconds) per API route and phase,
+    including the requests made by all xdist workers.
+    """
+    recorder = terminalreporter.config.stash[api_latency_key]
+    for dumped in worker_payloads(terminalreporter.config, "api_latency"):
+        recorder.merge(LatencyRecorder.load(dumped))
+    summary = recorder.summary()
+    if not summary:
+        return
+    terminalreporter.section("API latency per route (ms)")
+    terminalreporter.write_line(
+        f"{'route':<28} {'phase':<8} {'count':>6} {'p50':>9} {'p95':>9} {'p99':>9} {'errors':>7} {'bytes in':>10}"
+    )
+    for route, stats in summary.items():
+        for phase, phase_stats in stats["phases"].items():
+            terminalreporter.write_line(
+                f"{route:<28} {phase:<8} {phase_stats['count']:>6} {phase_stats['p50']:>9.1f} "
+                f"{phase_stats['p95']:>9.1f} {phase_stats['p99']:>9.1f} "
+                f"{stats['errors'] if phase == 'total' else '':>7} "
+                f"{stats['response_bytes'] if phase == 'total' else '':>10}"
+            )
@@ -0,0 +1,97 @@
+import os
+import sys
+import itertools
+import pytest
+from tests.parallel import publish, worker_payloads
+
+# Where the session's browser pool is kept for the end-of-run summary
+driver_pool_key = pytest.StashKey()
+
+
+@pytest.fixture(scope="session")
+def driver_pool(config, tmp_path_factory, worker_namespace, resource_blocker, request):
+    """
+    Provides the session's pool of long-lived Chrome browsers (one pool per
+    xdist worker). Each browser gets its own profile directory; all of them
+    are quit at session teardown. Spare browsers, if configured, start
+    warming up as soon as the pool is created. With resource blocking
+    enabled the browsers record the network events it is measured with.
+    """
+    # Imported here so that runs without UI tests never load selenium
+    from browser.driver_factory import create_chrome_driver
+    from browser.driver_pool import DriverPool
+
+    profiles = tmp_path_factory.mktemp(f"chrome-profiles-{worker_namespace}")
+    counter = itertools.count()
+
+    def launch():
+        return create_chrome_driver(
+            os.path.join(profiles, f"chrome-test-profile-{next(counter)}"),
+            performance_log=resource_blocker is not None
+        )
+
+    pool = DriverPool(
+        launch,
+        config['UI_SAUCEDEMO']['BASE_URL'],
+        max_uses=config['UI_SAUCEDEMO']['DRIVER_MAX_USES'],
+        spares=config['UI_SAUCEDEMO']['DRIVER_SPARES'],
+        memory_limit_mb=config['UI_SAUCEDEMO']['DRIVER_MEMORY_LIMIT_MB']
+    )
+    request.config.stash[driver_pool_key] = pool
+    yield pool
+    pool.close()
+
+
+def pytest_sessionfinish(session):
+    pool = session.config.stash.get(driver_pool_key, None)
+    if pool is not None:
+        publish(session.config, "driver_pool", {"max_uses": pool.max_uses, "spares": pool.spares, **pool.stats()})
+    resolution_stats = _resolution_stats()
+    if resolution_stats is not None:
+        publish(session.config, "driver_resolution", resolution_stats.summary())
+
+
+def pytest_terminal_summary(terminalreporter):
+    """
+    Prints how many browsers the UI tests launched, how often they were reused
+    and how long resolving the chromedriver binary took, over all xdist workers.
+    """
+    config = terminalreporter.config
+    pool = config.stash.get(driver_pool_key, None)
+    local = [{"max_uses": pool.max_uses, "spares": pool.spares, **pool.stats()}] if pool else []
+    pools = worker_payloads(config, "driver_pool") + local
+    if not pools:
+        return
+    stats = {key: sum(worker[key] for worker in pools)
+             for key in ("launched", "reused", "recycled", "crashed", "prewarmed", "memory_skips")}
+    terminalreporter.section("WebDriver pool")
+    terminalreporter.write_line(
+        f"{stats['launched']} browsers launched, {stats['reused']} reuses, "
+        f"{stats['recycled']} recycled after {pools[0]['max_uses']} tests, {stats['crashed']} discarded as crashed"
+    )
+    if pools[0]["spares"]:
+        terminalreporter.write_line(
+            f"{stats['prewarmed']} tests got a browser warmed up in the background "
+            f"({pools[0]['spares']} spares per worker), {stats['memory_skips']} spares held back by the memory limit"
+        )
+    resolution_stats = _resolution_stats()
+    resolutions = worker_payloads(config, "driver_resolution") + (
+        [resolution_stats.summary()] if resolution_stats is not None else []
+    )
+    calls = sum(resolution["calls"] for resolution in resolutions)
+    if calls:
+        sources = {}
+        for resolution in resolutions:
+            for source, count in resolution["sources"].items():
+                sources[source] = sources.get(source, 0) + count
+        seconds = sum(resolution["seconds"] for resolution in resolutions)
+        terminalreporter.write_line(
+            f"chromedriver resolved {calls} times in {seconds:.3f}s "
+            f"({', '.join(f'{count} from {source}' for source, count in sorted(sources.items()))})"
+        )
+
+
+def _resolution_stats():
+    # Nothing was resolved unless a browser was launched, i.e. the module was imported
+    module = sys.modules.get("browser.driver_binary")
+    return module.resolution_stats if module is not None else None
@@ -0,0 +1,102 @@
+import time
+import pytest
+from tests.parallel import publish, worker_payloads
+
+# Where the session's artifact writer is kept for the end-of-run summary
+failure_artifacts_key = pytest.StashKey()
+# When a test's setup started; older console entries belong to earlier tests
+test_started_key = pytest.StashKey()
+# The artifacts of a failed test being encoded while it tears down
+pending_artifacts_key = pytest.StashKey()
+
+
+@pytest.fixture(scope="session")
+def failure_artifacts(config, request):
+    """
+    Provides the session's writer for the screenshots, DOM snapshots and console
+    logs of failed UI tests. Everything still queued is encoded at teardown.
+    """
+    # Imported here so that runs without UI tests never load the browser package
+    from browser.artifacts import ArtifactLimits, ArtifactWriter
+
+    ui = config['UI_SAUCEDEMO']
+    writer = ArtifactWriter(ArtifactLimits(
+        screenshot_quality=ui['ARTIFACT_SCREENSHOT_QUALITY'],
+        max_screenshot_kb=ui['ARTIFACT_MAX_SCREENSHOT_KB'],
+        max_dom_kb=ui['ARTIFACT_MAX_DOM_KB'],
+        max_console_kb=ui['ARTIFACT_MAX_CONSOLE_KB'],
+        max_total_mb=ui['ARTIFACT_MAX_TOTAL_MB'],
+    ))
+    request.config.stash[failure_artifacts_key] = writer
+    yield writer
+    writer.close()
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    item.stash[test_started_key] = time.time()
+
+
+@pytest.hookimpl(tryfirst=True, hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """
+    Captures the browser's screenshot, DOM and console log when a UI test fails
+    and attaches them to its Allure result. Only reading from the browser
+    happens when the test fails; the artifacts are encoded in the background
+    while the test tears down, and attached once its teardown is reported.
+    """
+    # Execute all other hooks to obtain the report object
+    outcome = yield
+    report = outcome.get_result()
+
+    writer = item.funcargs.get("failure_artifacts")
+    if report.when == "teardown":
+        future = item.stash.get(pending_artifacts_key, None)
+        if future is not None and writer is not None:
+            import allure
+            for artifact in writer.collect(future):
+                allure.attach(artifact.body, name=artifact.name,
+                              attachment_type=artifact.mime_type, extension=artifact.extension)
+        return
+
+    # Check if the test failed during the 'call' phase
+    if report.when != "call" or not report.failed:
+        return
+    driver = item.funcargs.get("driver")
+    if driver is None or writer is None or not item.config.getoption("allure_report_dir", None):
+        # Not a UI test, or there is no Allure report to attach to
+        return
+    try:
+        item.stash[pending_artifacts_key] = writer.submit(
+            writer.capture(driver, since=item.stash.get(test_started_key, None))
+        )
+    except Exception as e:
+        print(f"Could not capture the failure artifacts due to an error: {e}")
+
+
+def pytest_sessionfinish(session):
+    writer = session.config.stash.get(failure_artifacts_key, None)
+    if writer is not None:
+        writer.close()
+        publish(session.config, "failure_artifacts", writer.stats())
+
+
+def pytest_terminal_summary(terminalreporter):
+    """
+    Prints how many failures had artifacts captured, how long the test threads
+    spent reading them from the browser and how much was attached, over all
+    xdist workers.
+    """
+    config = terminalreporter.config
+    writer = config.stash.get(failure_artifacts_key, None)
+    reports = worker_payloads(config, "failure_artifacts") + ([writer.stats()] if writer is not None else [])
+    stats = {key: sum(report[key] for report in reports)
+             for key in ("failures", "capture_seconds", "encoded_bytes", "omitted", "errors")}
+    if not stats["failures"]:
+        return
+    terminalreporter.section("Failure artifacts")
+    terminalreporter.write_line(
+        f"{stats['failures']} failures captured in {stats['capture_seconds'] / stats['failures'] * 1000:.0f} ms each "
+        f"on the test thread, {stats['encoded_bytes'] / 1024 / 1024:.1f} MB attached, "
+        f"{stats['omitted']} artifacts left out by the size limits, {stats['errors']} could not be encoded in time"
+    )
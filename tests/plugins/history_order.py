@@ -0,0 +1,71 @@
+import os
+import pytest
+from tests.history import HISTORY_CACHE_KEY, RunHistory
+from tests.parallel import is_xdist_worker
+
+# How the collected tests were ordered, for the collection report
+order_summary_key = pytest.StashKey()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--test-order",
+        choices=["history", "file"],
+        default=os.getenv("TEST_ORDER", "history"),
+        help="Run recently failing, then new, then the fastest tests first based on earlier runs "
+             "('history'), or keep the collection order ('file'). Defaults to TEST_ORDER, then 'history'.",
+    )
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config, items):
+    """
+    Reorders the collected tests by their history in pytest's cache. Every
+    xdist worker reads the same history, so all of them collect the same order.
+    """
+    cache = getattr(config, "cache", None)
+    if config.getoption("test_order") != "history" or cache is None or not items:
+        return
+    history = RunHistory.from_dict(cache.get(HISTORY_CACHE_KEY, {}))
+    if not history.tests:
+        return
+    nodeids = [item.nodeid for item in items]
+    items[:] = [items[index] for index in history.order(nodeids)]
+    kinds = [history.classify(nodeid) for nodeid in nodeids]
+    config.stash[order_summary_key] = {kind: kinds.count(kind) for kind in ("failing", "new", "passing")}
+
+
+def pytest_report_collectionfinish(config):
+    summary = config.stash.get(order_summary_key, None)
+    if summary is not None:
+        return (f"ordered by history: {summary['failing']} recently failing first, "
+                f"{summary['new']} new, {summary['passing']} passing from fastest to slowest")
+
+
+def pytest_configure(config):
+    if not is_xdist_worker(config):
+        # Under xdist the controller receives the reports of all workers
+        config.pluginmanager.register(HistoryRecorder(config), "history_recorder")
+
+
+class HistoryRecorder:
+    """
+    Adds up each test's setup, call and teardown time, notes any failure and
+    records the run in pytest's cache at the end of the session.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.results = {}
+
+    def pytest_runtest_logreport(self, report):
+        seconds, failed = self.results.get(report.nodeid, (0.0, False))
+        self.results[report.nodeid] = (seconds + report.duration, failed or report.failed)
+
+    def pytest_sessionfinish(self, session):
+        cache = getattr(self.config, "cache", None)
+        if cache is None or not self.results:
+            return
+        history = RunHistory.from_dict(cache.get(HISTORY_CACHE_KEY, {}))
+        history.record(self.results)
+        cache.set(HISTORY_CACHE_KEY, history.to_dict())
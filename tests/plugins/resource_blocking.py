@@ -0,0 +1,61 @@
+import pytest
+from tests.parallel import publish, worker_payloads
+
+# Where the session's resource blocker is kept for the end-of-run summary
+resource_blocker_key = pytest.StashKey()
+
+
+@pytest.fixture(scope="session")
+def resource_blocker(config, request):
+    """
+    Provides the session's `ResourceBlocker` for the resource types and URL
+    patterns in UI_BLOCK_RESOURCES and UI_BLOCK_URLS, or None when nothing
+    is blocked. The `driver` fixture applies it to every test's browser.
+    """
+    ui = config['UI_SAUCEDEMO']
+    if not ui['BLOCK_RESOURCES'] and not ui['BLOCK_URLS']:
+        return None
+    # Imported here so that runs without UI tests never load the browser package
+    from browser.resource_blocking import ResourceBlocker, blocked_url_patterns
+
+    blocker = ResourceBlocker(blocked_url_patterns(ui['BLOCK_RESOURCES'], ui['BLOCK_URLS']))
+    request.config.stash[resource_blocker_key] = blocker
+    return blocker
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "load_resources: load every resource, even the ones blocked by UI_BLOCK_RESOURCES/UI_BLOCK_URLS"
+    )
+
+
+def pytest_sessionfinish(session):
+    blocker = session.config.stash.get(resource_blocker_key, None)
+    if blocker is not None:
+        publish(session.config, "resource_blocking", blocker.dump())
+
+
+def pytest_terminal_summary(terminalreporter):
+    """
+    Prints how many requests were blocked and the bytes and page load time
+    that saved, over all xdist workers.
+    """
+    config = terminalreporter.config
+    blocker = config.stash.get(resource_blocker_key, None)
+    dumps = worker_payloads(config, "resource_blocking")
+    if blocker is None and dumps:
+        from browser.resource_blocking import ResourceBlocker
+        blocker = ResourceBlocker([])
+    if blocker is None:
+        return
+    for dumped in dumps:
+        blocker.merge(dumped)
+    summary = blocker.summary()
+    terminalreporter.section("Blocked resources")
+    terminalreporter.write_line(
+        f"{summary['requests_blocked']} requests blocked in {summary['blocked_tests']} tests "
+        f"({summary['unblocked_tests']} marked load_resources), "
+        f"{summary['bytes_saved'] / 1024 / 1024:.1f} MB saved "
+        f"({summary['unpriced']} requests of unknown size, never loaded unblocked), "
+        f"{summary['load_seconds_saved']:.1f}s of page load time saved"
+    )
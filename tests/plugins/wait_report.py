@@ -0,0 +1,88 @@
+import sys
+import time
+import pytest
+from tests.parallel import publish, worker_payloads
+
+# The tests whose time went mostly into waits that timed out
+timeout_tests_key = pytest.StashKey()
+
+# A test is reported when waits that ran into their timeout took at least
+# this share of its time, and at least MIN_TIMEOUT_SECONDS
+TIMEOUT_SHARE = 0.5
+MIN_TIMEOUT_SECONDS = 1.0
+# Tests listed in the terminal summary
+REPORTED_TESTS = 10
+
+
+def pytest_configure(config):
+    config.stash[timeout_tests_key] = []
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    """
+    Measures how long the waits of each test's setup, call and teardown ran
+    into their timeout, e.g. a negative check that waited out 10 seconds to
+    find an element was not there.
+    """
+    before = _wait_totals()
+    started = time.perf_counter()
+    yield
+    seconds = time.perf_counter() - started
+    after = _wait_totals()
+    if after is None:
+        return
+    before = before or dict.fromkeys(after, 0)
+    entry = {
+        "nodeid": item.nodeid,
+        "seconds": seconds,
+        "timeouts": after["timeouts"] - before["timeouts"],
+        "timeout_seconds": after["timeout_seconds"] - before["timeout_seconds"],
+    }
+    if is_timeout_dominated(entry):
+        item.config.stash[timeout_tests_key].append(entry)
+
+
+def is_timeout_dominated(entry):
+    """
+    Returns True if the timed-out waits of a test ({"seconds", "timeout_seconds"})
+    took at least TIMEOUT_SHARE of its time and at least MIN_TIMEOUT_SECONDS.
+    """
+    return (entry["timeout_seconds"] >= MIN_TIMEOUT_SECONDS
+            and entry["timeout_seconds"] >= TIMEOUT_SHARE * entry["seconds"])
+
+
+def pytest_sessionfinish(session):
+    publish(session.config, "timeout_tests", session.config.stash[timeout_tests_key])
+
+
+def pytest_terminal_summary(terminalreporter):
+    """
+    Lists the tests that spent most of their time waiting out timeouts, over
+    all xdist workers. These usually check for something that is not there
+    with a positive wait and are faster with `BasePage.is_absent()` or
+    `BasePage.is_present_now()`.
+    """
+    config = terminalreporter.config
+    entries = list(config.stash[timeout_tests_key])
+    for dumped in worker_payloads(config, "timeout_tests"):
+        entries.extend(dumped)
+    if not entries:
+        return
+    entries.sort(key=lambda entry: entry["timeout_seconds"], reverse=True)
+    terminalreporter.section("Timeout-dominated tests")
+    terminalreporter.write_line(
+        f"{len(entries)} tests spent {sum(entry['timeout_seconds'] for entry in entries):.1f}s "
+        f"in waits that timed out"
+    )
+    for entry in entries[:REPORTED_TESTS]:
+        terminalreporter.write_line(
+            f"{entry['timeout_seconds']:>7.1f}s of {entry['seconds']:>6.1f}s "
+            f"({entry['timeouts']} timeouts) {entry['nodeid']}"
+        )
+
+
+def _wait_totals():
+    # Page objects (and their waits) are only imported by UI tests
+    module = sys.modules.get("pages.waits")
+    return module.wait_stats.snapshot() if module is not None else None
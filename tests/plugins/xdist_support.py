@@ -0,0 +1,33 @@
+import uuid
+import pytest
+from tests.parallel import WORKER_OUTPUT_KEY, is_xdist_worker, run_id_key, worker_id, worker_payloads_key
+
+
+def pytest_configure(config):
+    if is_xdist_worker(config):
+        run_id = config.workerinput["testrunuid"]
+    else:
+        run_id = getattr(config.option, "testrunuid", None) or uuid.uuid4().hex
+        if hasattr(config.option, "testrunuid"):
+            # xdist hands this id to every worker, so all processes of a run agree on it
+            config.option.testrunuid = run_id
+    config.stash[run_id_key] = run_id
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """
+    Collects what a worker published when it shuts down (controller only).
+    """
+    payloads = node.config.stash.setdefault(worker_payloads_key, {})
+    for name, payload in getattr(node, "workeroutput", {}).get(WORKER_OUTPUT_KEY, {}).items():
+        payloads.setdefault(name, []).append(payload)
+
+
+@pytest.fixture(scope="session")
+def worker_namespace(request):
+    """
+    Provides a name unique to this run and worker (e.g. "3f2a9c1e-gw0"), to
+    keep files, browser profiles and test data of parallel workers apart.
+    """
+    return f"{request.config.stash[run_id_key][:8]}-{worker_id(request.config)}"
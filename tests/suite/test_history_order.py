@@ -0,0 +1,134 @@
+import json
+import os
+import pytest
+from tests.history import FORGET_AFTER_RUNS, HISTORY_CACHE_KEY, RunHistory
+
+NODEIDS = ["test_a.py::test_slow", "test_a.py::test_fast", "test_b.py::test_flaky", "test_b.py::test_new",
+           "test_c.py::test_broken"]
+
+
+def test_order_keeps_collection_order_without_history():
+    """
+    Test Case: Verifies that tests run in collection order when nothing has been recorded yet.
+    """
+    assert RunHistory().order(NODEIDS) == [0, 1, 2, 3, 4], "Expected the collection order without history."
+
+
+def test_order_runs_recent_failures_then_new_then_fastest_tests_first():
+    """
+    Test Case: Verifies the history order: latest failures, older failures, new tests, then passing ones by speed.
+    """
+    history = RunHistory()
+    history.record({NODEIDS[0]: (4.0, False), NODEIDS[1]: (0.1, False), NODEIDS[2]: (1.0, True),
+                    NODEIDS[4]: (2.0, False)})
+    history.record({NODEIDS[0]: (5.0, False), NODEIDS[1]: (0.2, False), NODEIDS[2]: (1.0, False),
+                    NODEIDS[4]: (2.0, True)})
+    ordered = [NODEIDS[index] for index in RunHistory.from_dict(history.to_dict()).order(NODEIDS)]
+
+    assert ordered == ["test_c.py::test_broken", "test_b.py::test_flaky", "test_b.py::test_new",
+                       "test_a.py::test_fast", "test_a.py::test_slow"], f"Unexpected order: {ordered}."
+    assert history.tests[NODEIDS[0]]["durations"] == [4.0, 5.0], \
+        f"Expected both durations to be kept, but got {history.tests[NODEIDS[0]]}."
+
+
+def test_history_forgets_tests_that_no_longer_run():
+    """
+    Test Case: Verifies that tests removed from the suite drop out of the history.
+    """
+    history = RunHistory()
+    history.record({NODEIDS[0]: (1.0, False)})
+    for _ in range(FORGET_AFTER_RUNS):
+        history.record({NODEIDS[1]: (1.0, False)})
+
+    assert NODEIDS[0] not in history.tests, f"Expected {NODEIDS[0]} to be forgotten after {FORGET_AFTER_RUNS} runs."
+    assert RunHistory.from_dict({"tests": "corrupt"}).tests == {}, "Expected an unreadable history to start empty."
+
+
+# A small suite whose tests are slow, failing and fast, in that file order
+SUITE = """
+import time
+
+def test_slow():
+    time.sleep(0.2)
+
+def test_broken():
+    assert False
+
+def test_fast():
+    pass
+"""
+
+
+@pytest.fixture
+def ordered_suite(pytester, monkeypatch):
+    """
+    Provides a pytester directory with SUITE, ordered by the history plugin.
+    """
+    # xdist workers are separate processes that have to import the plugin too
+    monkeypatch.setenv("PYTHONPATH", os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+    monkeypatch.delenv("TEST_ORDER", raising=False)
+    # As in pyproject.toml: Faker's plugin would build every locale on each run
+    pytester.makeini("[pytest]\naddopts = -p no:faker\n")
+    pytester.makeconftest('pytest_plugins = ["tests.plugins.history_order"]')
+    pytester.makepyfile(test_order=SUITE)
+    return pytester
+
+
+def recorded_history(pytester):
+    """
+    Returns the history the plugin saved in the pytester directory's cache.
+    """
+    path = pytester.path / ".pytest_cache" / "v" / HISTORY_CACHE_KEY
+    return json.loads(path.read_text()) if path.exists() else None
+
+
+def test_second_run_is_ordered_by_the_history_of_the_first(ordered_suite):
+    """
+    Test Case: Verifies that a run records its durations and failures at session finish, and that
+    the next run starts with the failing test, then new tests, then the passing ones by speed.
+    """
+    first = ordered_suite.runpytest("-v")
+    first.assert_outcomes(passed=2, failed=1)
+    assert "ordered by history" not in first.stdout.str(), "Expected no reordering without a history."
+    history = recorded_history(ordered_suite)
+    assert history is not None and sorted(history["tests"]) == \
+        ["test_order.py::test_broken", "test_order.py::test_fast", "test_order.py::test_slow"], \
+        f"Expected every test to be recorded at session finish, but got {history}."
+
+    ordered_suite.makepyfile(test_new="def test_new():\n    pass\n")
+    second = ordered_suite.runpytest("-v")
+
+    second.stdout.fnmatch_lines([
+        "ordered by history: 1 recently failing first, 1 new, 2 passing from fastest to slowest",
+        "test_order.py::test_broken FAILED*",
+        "test_new.py::test_new PASSED*",
+        "test_order.py::test_fast PASSED*",
+        "test_order.py::test_slow PASSED*",
+    ])
+
+
+def test_file_order_option_bypasses_the_history(ordered_suite):
+    """
+    Test Case: Verifies that --test-order=file keeps the collection order even with a history.
+    """
+    ordered_suite.runpytest()
+    result = ordered_suite.runpytest("-v", "--test-order=file")
+
+    result.stdout.fnmatch_lines([
+        "test_order.py::test_slow PASSED*",
+        "test_order.py::test_broken FAILED*",
+        "test_order.py::test_fast PASSED*",
+    ])
+    assert "ordered by history" not in result.stdout.str(), "Expected no reordering with --test-order=file."
+
+
+def test_xdist_controller_records_the_run_of_all_workers(ordered_suite):
+    """
+    Test Case: Verifies that under xdist the run is recorded once, by the controller, for the tests of every worker.
+    """
+    result = ordered_suite.runpytest("-n", "2")
+
+    result.assert_outcomes(passed=2, failed=1)
+    history = recorded_history(ordered_suite)
+    assert history is not None and history["run"] == 1 and len(history["tests"]) == 3, \
+        f"Expected one recorded run with all three tests, but got {history}."
@@ -0,0 +1,118 @@
+import pytest
+from selenium.common.exceptions import NoAlertPresentException, NoSuchElementException, WebDriverException
+
+
+class FakeDriver:
+    """
+    A scripted stand-in for a Chrome WebDriver, so that page objects, waits
+    and the browser helpers can be tested without launching Chrome.
+
+    `execute_script()` and `execute_async_script()` return their scripted
+    results in order, then their default (called with the script and its
+    arguments if it is callable); a scripted exception is raised instead of
+    returned. DevTools commands are answered from `cdp_results` in the same
+    way, per command. Every script, DevTools command and element lookup is
+    logged, and a crashed driver fails every command.
+    """
+
+    def __init__(self, script_results=(), script_default=None, async_script_results=(),
+                 async_script_default=None, cdp_results=None, logs=None, element_factory=None,
+                 page_source=""):
+        """
+        Args:
+            script_results (iterable, optional): Results of the first `execute_script()` calls.
+            script_default (optional): Result of the calls after those.
+            async_script_results (iterable, optional): Results of the first `execute_async_script()` calls.
+            async_script_default (optional): Result of the calls after those.
+            cdp_results (dict, optional): Result of `execute_cdp_cmd()` per command name
+                                          (called with the parameters if it is callable).
+            logs (dict, optional): Entries handed out once by `get_log()`, per log type.
+            element_factory (callable, optional): Called with (by, value) to find an element;
+                                                  without it no element is ever found.
+            page_source (str, optional): The page's HTML.
+        """
+        self.script_results = list(script_results)
+        self.script_default = script_default
+        self.async_script_results = list(async_script_results)
+        self.async_script_default = async_script_default
+        self.cdp_results = dict(cdp_results or {})
+        self.logs = {log_type: list(entries) for log_type, entries in (logs or {}).items()}
+        self.element_factory = element_factory
+        self.page_source = page_source
+        self.current_url = "data:,"
+        self.switch_to = self
+        self.crashed = False
+        self.quit_called = False
+        # (script, args), (command, params) and (by, value) of every call, in order
+        self.scripts = []
+        self.async_scripts = []
+        self.cdp_commands = []
+        self.lookups = []
+
+    def execute_script(self, script, *args):
+        self.scripts.append((script, args))
+        return self._answer(self.script_results, self.script_default, script, *args)
+
+    def execute_async_script(self, script, *args):
+        self.async_scripts.append((script, args))
+        return self._answer(self.async_script_results, self.async_script_default, script, *args)
+
+    def execute_cdp_cmd(self, command, params):
+        self.cdp_commands.append((command, params))
+        return self._answer([], self.cdp_results.get(command), params)
+
+    def find_element(self, by, value):
+        self._check()
+        self.lookups.append((by, value))
+        if self.element_factory is None:
+            raise NoSuchElementException(f"No element matches {by}={value}")
+        return self.element_factory(by, value)
+
+    def get_log(self, log_type):
+        self._check()
+        return self.logs.pop(log_type, [])
+
+    def get(self, url):
+        self._check()
+        self.current_url = url
+
+    @property
+    def alert(self):
+        raise NoAlertPresentException()
+
+    @property
+    def window_handles(self):
+        self._check()
+        return ["main"]
+
+    def window(self, handle):
+        self._check()
+
+    def get_window_size(self):
+        return {"width": 1920, "height": 1080}
+
+    def delete_all_cookies(self):
+        self._check()
+
+    def quit(self):
+        self.quit_called = True
+
+    def _answer(self, results, default, *args):
+        self._check()
+        result = results.pop(0) if results else default
+        if isinstance(result, Exception):
+            raise result
+        return result(*args) if callable(result) else result
+
+    def _check(self):
+        if self.crashed:
+            raise WebDriverException("chrome not reachable")
+
+
+@pytest.fixture
+def fake_driver():
+    """
+    Provides the `FakeDriver` class, to create scripted stand-ins for the
+    test's WebDriver(s), e.g. `fake_driver(script_results=[0])`.
+    """
+    return FakeDriver
@@ -0,0 +1,88 @@
+import time
+import pytest
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+from pages.base_page import BasePage, PageSettings
+from pages.products_page import ProductsPage
+from pages.waits import wait_stats
+from tests.plugins.wait_report import is_timeout_dominated
+
+OBSERVER_WAITS = PageSettings(observer_waits=True)
+
+
+class FakeBadge:
+    text = "1"
+
+    def is_displayed(self):
+        return True
+
+
+def test_empty_cart_badge_is_checked_without_waiting(fake_driver):
+    """
+    Test Case: Verifies that a missing cart badge is reported in a single script call instead of a 10-second wait.
+    """
+    browser = fake_driver(script_default=0)
+    started = time.monotonic()
+
+    assert ProductsPage(browser, OBSERVER_WAITS).is_shopping_cart_badge_absent(), "Expected an empty cart."
+    assert len(browser.scripts) == 1 and not browser.async_scripts and not browser.lookups, \
+        f"Expected one script and no lookups, but got {browser.scripts} and {browser.lookups}."
+    assert time.monotonic() - started < 1, "Expected the empty cart to be reported at once."
+
+
+def test_cart_badge_count_waits_for_the_badge_to_appear(fake_driver):
+    """
+    Test Case: Verifies that a badge rendered shortly after adding a product is counted instead of read as 0.
+    """
+    polls = iter([None, FakeBadge()])
+
+    def find_badge(by, value):
+        badge = next(polls)
+        if badge is None:
+            raise NoSuchElementException("The badge is not rendered yet")
+        return badge
+
+    browser = fake_driver(element_factory=find_badge)
+
+    count = ProductsPage(browser).get_shopping_cart_badge_count()
+
+    assert count == 1, f"Expected the badge to be waited for and read as 1, but got {count}."
+    assert len(browser.lookups) == 2, f"Expected the badge to be found on the second poll, but got {browser.lookups}."
+
+
+def test_absence_waits_for_an_element_that_is_going_away(fake_driver):
+    """
+    Test Case: Verifies that is_absent() waits in the page for a still-visible element to disappear.
+    """
+    browser = fake_driver(script_results=[1], async_script_results=[True])
+
+    assert ProductsPage(browser, OBSERVER_WAITS).is_add_backpack_button_absent(), \
+        "Expected the button to be reported absent."
+    assert (len(browser.scripts), len(browser.async_scripts)) == (1, 1), \
+        f"Expected a check and one wait script, but got {browser.scripts} and {browser.async_scripts}."
+
+
+def test_assert_absent_fails_after_a_short_timeout_and_records_it(fake_driver):
+    """
+    Test Case: Verifies that an element that stays visible fails assert_absent() within its short timeout.
+    """
+    browser = fake_driver(script_default=1)
+    before = wait_stats.snapshot()
+
+    with pytest.raises(AssertionError, match="still visible after 0.05s"):
+        BasePage(browser, OBSERVER_WAITS).assert_absent((By.ID, "add-to-cart-sauce-labs-backpack"), timeout=0.05)
+    after = wait_stats.snapshot()
+    assert after["timeouts"] - before["timeouts"] == 1, \
+        f"Expected the timed-out wait to be recorded, but got {after['timeouts'] - before['timeouts']}."
+
+
+def test_timeout_dominated_tests_are_recognized():
+    """
+    Test Case: Verifies which tests count as dominated by waits that timed out.
+    """
+    assert is_timeout_dominated({"seconds": 12.0, "timeout_seconds": 10.0}), \
+        "A test spending 10 of 12 seconds in timed-out waits should be reported."
+    assert not is_timeout_dominated({"seconds": 30.0, "timeout_seconds": 10.0}), \
+        "A test spending a third of its time in timed-out waits should not be reported."
+    assert not is_timeout_dominated({"seconds": 0.5, "timeout_seconds": 0.4}), \
+        "Short timeouts should not be reported."
@@ -0,0 +1,71 @@
+import pytest
+from browser import driver_binary
+
+
+@pytest.fixture
+def fake_resolution(monkeypatch, tmp_path):
+    """
+    Isolates the resolver from the machine: a private cache directory, a fixed
+    Chrome version and a counting stand-in for webdriver-manager's install().
+    """
+    binary = tmp_path / "chromedriver"
+    binary.write_text("")
+    binary.chmod(0o755)
+    installs = []
+
+    class CountingManager:
+        def install(self):
+            installs.append(1)
+            return str(binary)
+
+    monkeypatch.delenv("CHROMEDRIVER_PATH", raising=False)
+    monkeypatch.setattr(driver_binary, "_resolved_path", None)
+    monkeypatch.setattr(driver_binary, "ChromeDriverManager", CountingManager)
+    monkeypatch.setattr(driver_binary, "_browser_major_version", lambda: "126")
+    return tmp_path / "cache", binary, installs
+
+
+def test_resolution_is_shared_through_the_disk_record(fake_resolution, monkeypatch):
+    """
+    Test Case: Verifies that webdriver-manager is consulted once and later processes reuse the record.
+    """
+    cache_dir, binary, installs = fake_resolution
+    first = driver_binary.resolve_chromedriver(str(cache_dir))
+    second = driver_binary.resolve_chromedriver(str(cache_dir))
+    # Simulate another worker process: no in-memory result yet
+    monkeypatch.setattr(driver_binary, "_resolved_path", None)
+    third = driver_binary.resolve_chromedriver(str(cache_dir))
+
+    assert first == second == third == str(binary), f"Unexpected paths: {first}, {second}, {third}."
+    assert len(installs) == 1, f"Expected a single webdriver-manager lookup, but got {len(installs)}."
+
+
+def test_stale_record_is_used_when_refreshing_fails(fake_resolution, monkeypatch):
+    """
+    Test Case: Verifies that an existing driver is used offline once its record has expired.
+    """
+    cache_dir, binary, installs = fake_resolution
+    driver_binary.resolve_chromedriver(str(cache_dir))
+
+    class OfflineManager:
+        def install(self):
+            raise ConnectionError("offline")
+
+    monkeypatch.setattr(driver_binary, "_resolved_path", None)
+    monkeypatch.setattr(driver_binary, "ChromeDriverManager", OfflineManager)
+    path = driver_binary.resolve_chromedriver(str(cache_dir), max_age=0)
+
+    assert path == str(binary), f"Expected the cached driver to be used offline, but got {path}."
+
+
+def test_chrome_upgrade_triggers_a_new_lookup(fake_resolution, monkeypatch):
+    """
+    Test Case: Verifies that the record is not reused after the installed Chrome changes major version.
+    """
+    cache_dir, binary, installs = fake_resolution
+    driver_binary.resolve_chromedriver(str(cache_dir))
+    monkeypatch.setattr(driver_binary, "_resolved_path", None)
+    monkeypatch.setattr(driver_binary, "_browser_major_version", lambda: "127")
+    driver_binary.resolve_chromedriver(str(cache_dir))
+
+    assert len(installs) == 2, f"Expected a second lookup after the Chrome upgrade, but got {len(installs)}."
@@ -0,0 +1,109 @@
+import threading
+import pytest
+from selenium.common.exceptions import WebDriverException
+from browser.driver_pool import DriverPool
+
+BASE_URL = "https://www.saucedemo.com/"
+
+
+@pytest.fixture
+def launch_browser(fake_driver):
+    """
+    Provides a launcher of fake browsers with a cart in their storage, which
+    DevTools clears, and an asset manifest of 12 files to warm up.
+    """
+    def launch():
+        driver = fake_driver(async_script_default=12, cdp_results={
+            "Storage.clearDataForOrigin": lambda params: driver.storage.clear(),
+        })
+        driver.storage = {"cart-contents": "[4]"}
+        # Answers the leftover-state check: [cookies, localStorage items, sessionStorage items]
+        driver.script_default = lambda script, *args: ["", len(driver.storage), 0]
+        return driver
+    return launch
+
+
+def test_pool_reuses_and_resets_browsers_until_max_uses(launch_browser):
+    """
+    Test Case: Verifies that a browser is reused with its storage cleared, then replaced after max_uses.
+    """
+    browsers = []
+    pool = DriverPool(lambda: browsers.append(launch_browser()) or browsers[-1], BASE_URL, max_uses=2)
+
+    first = pool.acquire()
+    first.storage["cart-contents"] = "[4, 5]"
+    pool.release(first)
+    second = pool.acquire()
+    pool.release(second)
+    third = pool.acquire()
+
+    assert second is first, "Expected the idle browser to be reused."
+    assert second.storage == {} and second.current_url == BASE_URL, "Expected the cart to be cleared on the base URL."
+    assert third is not first and first.quit_called, "Expected the browser to be replaced after 2 tests."
+    assert pool.stats() == {"launched": 2, "reused": 1, "recycled": 1, "crashed": 0, "prewarmed": 0,
+                            "memory_skips": 0}, \
+        f"Unexpected pool stats: {pool.stats()}."
+
+
+def test_pool_replaces_crashed_browsers(launch_browser):
+    """
+    Test Case: Verifies that a browser that crashed during a test is discarded instead of handed out.
+    """
+    pool = DriverPool(launch_browser, BASE_URL)
+    first = pool.acquire()
+    first.crashed = True
+    pool.release(first)
+    second = pool.acquire()
+
+    assert second is not first and first.quit_called, "Expected the crashed browser to be replaced."
+    assert pool.stats()["crashed"] == 1, f"Expected one crashed browser, but got {pool.stats()}."
+
+
+def test_pool_rejects_browsers_whose_state_survives_the_reset(fake_driver):
+    """
+    Test Case: Verifies that a browser is not handed out if storage could not be cleared.
+    """
+    pool = DriverPool(lambda: fake_driver(script_default=["session-username=standard_user", 1, 0]), BASE_URL)
+    with pytest.raises(WebDriverException):
+        pool.acquire()
+
+
+def test_pool_hands_out_browsers_warmed_up_in_the_background(launch_browser):
+    """
+    Test Case: Verifies that spare browsers are launched, reset and warmed before a test asks for them.
+    """
+    launched = threading.Event()
+
+    def launch():
+        launched.set()
+        return launch_browser()
+
+    pool = DriverPool(launch, BASE_URL, spares=1)
+    assert launched.wait(5), "Expected a spare browser to be launched before the first acquire."
+
+    first = pool.acquire()
+    first.storage["cart-contents"] = "[4, 5]"
+    pool.release(first)
+    second = pool.acquire()
+    third = pool.acquire()
+    pool.close()
+
+    assert first.current_url == BASE_URL and first.async_scripts, \
+        "Expected the spare to be on the base URL with its assets."
+    assert second.storage == {}, "Expected the released browser to be reset in the background."
+    assert second is not third, "Expected two different browsers for overlapping tests."
+    assert pool.stats()["prewarmed"] == 3, f"Expected every test to get a warm browser, but got {pool.stats()}."
+
+
+def test_pool_does_not_launch_spares_beyond_the_memory_limit(launch_browser):
+    """
+    Test Case: Verifies that no spare is started while another browser would exceed the memory limit.
+    """
+    pool = DriverPool(launch_browser, BASE_URL, spares=2, memory_limit_mb=500)
+    driver = pool.acquire()
+    pool.close()
+
+    assert pool.stats()["launched"] == 1, f"Expected a single browser within 500 MB, but got {pool.stats()}."
+    assert pool.stats()["memory_skips"] > 0, "Expected the memory limit to hold back the spares."
+    assert driver.current_url == BASE_URL, \
+        f"Expected the test to get a browser on the base URL, but got {driver.current_url}."
@@ -0,0 +1,88 @@
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException
+from pages.base_page import PageSettings
+from pages.element_cache import element_cache_stats
+from pages.products_page import ProductsPage
+
+
+class FakeElement:
+    def __init__(self, text):
+        self._text = text
+        self.stale = False
+
+    @property
+    def text(self):
+        if self.stale:
+            raise StaleElementReferenceException("stale element reference")
+        return self._text
+
+    def is_displayed(self):
+        return not self.stale
+
+    def is_enabled(self):
+        return True
+
+    def click(self):
+        pass
+
+
+@pytest.fixture
+def title_browser(fake_driver):
+    """
+    Provides a fake browser that finds a fresh "Products" title element on every lookup.
+    """
+    elements = []
+    browser = fake_driver(element_factory=lambda by, value: elements.append(FakeElement("Products")) or elements[-1])
+    browser.elements = elements
+    return browser
+
+
+def test_cached_elements_are_reused_until_the_page_changes(title_browser):
+    """
+    Test Case: Verifies that repeated reads reuse the located element and a click invalidates it.
+    """
+    element_cache_stats.clear()
+    browser = title_browser
+    page = ProductsPage(browser, PageSettings(cache_elements=True))
+
+    texts = [page.get_products_title_text() for _ in range(3)]
+    assert page.is_products_page_displayed(), "Expected the cached title to be displayed."
+    lookups_before_click = len(browser.lookups)
+    page.add_sauce_labs_backpack_to_cart()
+    page.get_products_title_text()
+
+    assert texts == ["Products"] * 3, f"Unexpected title texts: {texts}."
+    assert lookups_before_click == 1, f"Expected a single lookup for 4 reads, but got {lookups_before_click}."
+    assert len(browser.lookups) == 3, \
+        f"Expected the click and a fresh lookup after it, but got {len(browser.lookups)} lookups."
+    stats = element_cache_stats.summary()["ProductsPage"]
+    assert (stats["hits"], stats["misses"], stats["invalidations"]) == (3, 2, 1), f"Unexpected cache stats: {stats}."
+
+
+def test_stale_cached_elements_are_looked_up_again(title_browser):
+    """
+    Test Case: Verifies that an element that went stale (e.g. after a re-render) is dropped and located again.
+    """
+    element_cache_stats.clear()
+    browser = title_browser
+    page = ProductsPage(browser, PageSettings(cache_elements=True))
+    page.get_products_title_text()
+    browser.elements[0].stale = True
+
+    assert page.get_products_title_text() == "Products", "Expected the title to be read from a fresh element."
+    assert len(browser.lookups) == 2, \
+        f"Expected one fresh lookup after the element went stale, but got {len(browser.lookups)}."
+    assert element_cache_stats.summary()["ProductsPage"]["stale"] == 1, "Expected the stale element to be counted."
+    assert ProductsPage(browser).element_cache is None, "Expected the cache to be off by default."
+
+
+def test_pages_created_while_navigating_inherit_the_settings(title_browser):
+    """
+    Test Case: Verifies that a page opened from another page uses the same page settings.
+    """
+    settings = PageSettings(cache_elements=True)
+
+    cart_page = ProductsPage(title_browser, settings).click_shopping_cart_icon()
+
+    assert cart_page.settings is settings and cart_page.element_cache is not None, \
+        f"Expected the cart page to inherit {settings}, but got {cart_page.settings}."
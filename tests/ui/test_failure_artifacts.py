@@ -0,0 +1,87 @@
+import base64
+import gzip
+import threading
+import pytest
+from browser.artifacts import ArtifactLimits, ArtifactWriter
+
+SCREENSHOT = b"\xff\xd8\xff" + bytes(4000)
+PAGE_SOURCE = "<html><body>" + "<div class='inventory_item'>Sauce Labs Backpack</div>" * 500 + "</body></html>"
+
+
+@pytest.fixture
+def failed_browser(fake_driver):
+    """
+    Provides a fake browser on a failed test's page, with console errors from it and the previous test.
+    """
+    return fake_driver(
+        cdp_results={"Page.captureScreenshot": {"data": base64.b64encode(SCREENSHOT).decode()}},
+        logs={"browser": [
+            {"level": "SEVERE", "timestamp": 1_000, "message": "left over from the previous test"},
+            {"level": "SEVERE", "timestamp": 5_000, "message": "TypeError: Cannot read properties of undefined"},
+        ]},
+        page_source=PAGE_SOURCE,
+    )
+
+
+def test_failure_artifacts_are_encoded_in_the_background(failed_browser):
+    """
+    Test Case: Verifies that the screenshot, gzipped DOM and console log of a failure are encoded off the test thread.
+    """
+    writer = ArtifactWriter()
+    threads = []
+    encode_dom = writer._encode_dom
+    writer._encode_dom = lambda dom: threads.append(threading.current_thread().name) or encode_dom(dom)
+
+    future = writer.submit(writer.capture(failed_browser, since=2))
+    attachments = {artifact.name: artifact for artifact in writer.collect(future)}
+    writer.close()
+
+    screenshot = attachments["screenshot"]
+    assert failed_browser.cdp_commands[0][1]["format"] == "jpeg", \
+        f"Expected a JPEG screenshot to be taken, but got {failed_browser.cdp_commands}."
+    assert (screenshot.mime_type, screenshot.extension, screenshot.body) == ("image/jpeg", "jpg", SCREENSHOT), \
+        "Expected the decoded JPEG screenshot."
+    assert threads and threads[0].startswith("artifacts"), \
+        f"Expected the artifacts to be encoded in the background, not on {threads}."
+    dom = attachments["page DOM"].body
+    assert gzip.decompress(dom).decode() == PAGE_SOURCE and len(dom) < len(PAGE_SOURCE) / 10, \
+        f"Expected a gzip-compressed DOM snapshot, but got {len(dom)} bytes."
+    console = attachments["browser console"].body.decode()
+    assert "TypeError" in console and "previous test" not in console, \
+        f"Expected only this test's console entries, but got: {console}"
+    assert writer.stats()["failures"] == 1 and writer.stats()["omitted"] == 0, f"Unexpected stats: {writer.stats()}."
+
+
+def test_failure_artifacts_respect_the_size_limits(failed_browser):
+    """
+    Test Case: Verifies that an oversized screenshot is left out with a note and the DOM is cut off.
+    """
+    writer = ArtifactWriter(ArtifactLimits(max_screenshot_kb=1, max_dom_kb=2))
+    encoded = writer.collect(writer.submit(writer.capture(failed_browser)))
+    attachments = {artifact.name: artifact for artifact in encoded}
+    writer.close()
+
+    console = attachments["browser console"].body.decode()
+    dom = gzip.decompress(attachments["page DOM"].body).decode()
+    assert "screenshot" not in attachments and "screenshot omitted" in console, \
+        f"Expected the 4 KB screenshot to be left out with a note, but got: {console}"
+    assert dom.startswith("<html>") and "cut off after 2 KB" in dom and len(dom) < 2200, \
+        f"Expected the DOM to be cut off after 2 KB, but got {len(dom)} characters."
+    assert writer.stats()["omitted"] == 1, f"Expected one omitted artifact, but got {writer.stats()}."
+
+
+def test_artifacts_still_encoding_after_the_timeout_are_skipped(failed_browser):
+    """
+    Test Case: Verifies that a teardown waits only up to the attach timeout for slow encoding.
+    """
+    writer = ArtifactWriter(ArtifactLimits(attach_timeout=0.05))
+    release = threading.Event()
+    encode_dom = writer._encode_dom
+    writer._encode_dom = lambda dom: release.wait(5) and encode_dom(dom)
+
+    attachments = writer.collect(writer.submit(writer.capture(failed_browser)))
+    release.set()
+    writer.close()
+
+    assert attachments == [] and writer.stats()["errors"] == 1, \
+        f"Expected nothing to be attached after the timeout, but got {len(attachments)} artifacts, {writer.stats()}."
@@ -9,6 +9,7 @@ class TestNavigation:
     such as logging out and resetting the application state.
     """
 
+    @pytest.mark.real_login
     def test_logout_from_burger_menu(self, logged_in_standard_user):
         """
         Tests the user can successfully log out via the burger menu.
@@ -38,7 +39,7 @@ class TestNavigation:
         3. Add a random number of products to the cart.
         4. Assert the shopping cart badge count matches the number of products added.
         5. Click the burger menu and then the 'Reset App State' button.
-        6. Assert the shopping cart badge count is now zero.
+        6. Assert the shopping cart badge is gone.
         7. Assert the count of 'Add to cart' buttons is back to the initial number.
         8. Assert there are no 'Remove' buttons visible.
         """
@@ -54,15 +55,13 @@ class TestNavigation:
         # Open the side menu and click the reset button
         products_page.click_burger_menu()
         products_page.click_burger_menu_reset()
-        # Verify the cart badge count is reset to 0
-        cart_after_reset = products_page.get_shopping_cart_badge_count()
-        assert cart_after_reset == 0, \
-            f"Expected cart badge count to be 0 after reset, but got {cart_after_reset}."
+        # Verify the cart badge is gone after the reset
+        assert products_page.is_shopping_cart_badge_absent(), \
+            "Expected the cart badge to be gone after reset, but it is still displayed."
         # Verify the number of "Add to cart" buttons has been restored to the initial count
         final_add_buttons = products_page.get_count_of_add_to_cart_buttons()
-        remove_buttons = products_page.get_count_remove_buttons()
         assert final_add_buttons == initial_add_buttons, \
             f"Expected {initial_add_buttons} 'Add to cart' buttons, but found {final_add_buttons}."
         # Verify that there are no "Remove" buttons left after the reset
-        assert remove_buttons == 0, \
-            f"Expected 0 'Remove' buttons, but found {remove_buttons}."
\ No newline at end of file
+        assert products_page.are_remove_buttons_absent(), \
+            "Expected no 'Remove' buttons after reset, but some are still displayed."
\ No newline at end of file
@@ -0,0 +1,46 @@
+import pytest
+from selenium.common.exceptions import JavascriptException, TimeoutException
+from selenium.webdriver.common.by import By
+from pages.waits import ObserverWait
+
+
+def test_wait_resumes_after_a_page_load_and_returns_the_element(fake_driver):
+    """
+    Test Case: Verifies that a wait interrupted by a full page load continues on the new page.
+    """
+    element = object()
+    unloaded = JavascriptException("document unloaded while waiting for result")
+    browser = fake_driver(async_script_results=[unloaded, element])
+
+    assert ObserverWait(browser).until_clickable((By.ID, "checkout")) is element, "Expected the clickable element."
+    assert len(browser.async_scripts) == 2, \
+        f"Expected the wait to be resumed once, but got {len(browser.async_scripts)} scripts."
+    strategy, query, condition, expected, timeout_ms = browser.async_scripts[0][1]
+    assert (strategy, query, condition) == ("css", '[id="checkout"]', "clickable"), \
+        f"Unexpected wait script arguments: {browser.async_scripts[0][1]}."
+    assert 0 < timeout_ms <= 10_000, f"Expected the deadline to be passed to the script, but got {timeout_ms} ms."
+
+
+def test_wait_raises_timeout_when_the_condition_never_holds(fake_driver):
+    """
+    Test Case: Verifies that a wait whose script keeps resolving with nothing raises TimeoutException.
+    """
+    browser = fake_driver()
+
+    with pytest.raises(TimeoutException, match="URL did not become"):
+        ObserverWait(browser, timeout=0.05).until_url("https://www.saucedemo.com/inventory.html")
+    assert browser.async_scripts[0][1][2:4] == ("url", "https://www.saucedemo.com/inventory.html"), \
+        f"Unexpected wait script arguments: {browser.async_scripts[0][1]}."
+
+
+def test_genuine_script_error_is_raised_instead_of_retried(fake_driver):
+    """
+    Test Case: Verifies that a script error other than a page unload propagates at once instead of timing out.
+    """
+    browser = fake_driver(async_script_results=[
+        JavascriptException("javascript error: Failed to execute 'evaluate' on 'Document'")
+    ])
+
+    with pytest.raises(JavascriptException, match="Failed to execute 'evaluate'"):
+        ObserverWait(browser).until_visible((By.XPATH, "//div[@class='broken'"))
+    assert len(browser.async_scripts) == 1, f"Expected no retries, but got {len(browser.async_scripts)} scripts."
@@ -0,0 +1,41 @@
+import pytest
+from selenium.webdriver.common.by import By
+from pages.cart_page import CartPage
+from pages.products_page import ProductsPage
+
+
+def test_prices_are_read_in_a_single_round_trip(fake_driver):
+    """
+    Test Case: Verifies that all product prices are read with one script call instead of one call per element.
+    """
+    browser = fake_driver(script_results=[[{"value": "$29.99"}, {"value": "$9.99"}, {"value": "$15.99"}]])
+
+    prices = ProductsPage(browser).get_products_prices()
+
+    assert prices == [29.99, 9.99, 15.99], f"Unexpected prices: {prices}."
+    assert [args for _, args in browser.scripts] == \
+        [("xpath", "//div[@class='inventory_item_price']", [["value", {"kind": "text"}]])], \
+        f"Expected a single extraction call, but got {browser.scripts}."
+
+
+def test_extraction_translates_field_specs_and_waits_for_the_elements(fake_driver):
+    """
+    Test Case: Verifies that relative locators and attributes are translated and a missing match is polled again.
+    """
+    # The first call finds nothing yet (null), the second one reads the cart
+    browser = fake_driver(script_results=[None, [{"name": "Sauce Labs Backpack", "link": "item_4_title_link"}]])
+    page = CartPage(browser)
+
+    rows = page.extract_all(page.ADDED_PRODUCTS, {
+        "name": page.TEXT,
+        "link": (By.XPATH, "./parent::a", "@id"),
+    })
+
+    assert rows == [{"name": "Sauce Labs Backpack", "link": "item_4_title_link"}], f"Unexpected rows: {rows}."
+    assert len(browser.scripts) == 2, f"Expected the extraction to be retried once, but got {browser.scripts}."
+    strategy, query, fields = browser.scripts[0][1]
+    assert (strategy, query) == ("css", '[class~="inventory_item_name"]'), f"Unexpected locator: {query}."
+    assert fields[1] == ["link", {"kind": "attribute", "name": "id", "strategy": "xpath", "query": "./parent::a"}], \
+        f"Unexpected field spec: {fields[1]}."
+    with pytest.raises(ValueError):
+        page.extract_all((By.LINK_TEXT, "Sauce Labs Backpack"))
@@ -18,12 +18,20 @@ class TestProductsAndCart:
         assert products_page.get_shopping_cart_badge_count() == 1, \
             "Expected shopping cart badge count to be 1 after adding one item."
         # Assert the 'Add to cart' button for the backpack is no longer visible
-        assert not products_page.is_add_backpack_button_displayed(), \
+        assert products_page.is_add_backpack_button_absent(), \
             "The 'Add to cart' button for the backpack should be hidden after adding it."
         # Assert the 'Remove' button for the backpack is now visible
         assert products_page.is_remove_backpack_button_displayed(), \
             "The 'Remove' button for the backpack should be displayed after adding it."
 
+    @pytest.mark.load_resources
+    def test_product_images_are_loaded(self, logged_in_standard_user):
+        """
+        Tests that every product image on the inventory page is downloaded and displayed.
+        """
+        products_page = logged_in_standard_user
+        assert products_page.are_product_images_loaded(), "Not all product images were loaded."
+
     def test_add_random_items_to_cart_and_verify_badge(self, logged_in_standard_user):
         """
         Tests adding a random number of products to the cart and verifies the badge count.
@@ -81,13 +89,14 @@ class TestProductsAndCart:
         assert len(products_after_remove) == len(added_products) - 1, \
             "Incorrect number of items in cart after removing one."
         # Assert the removed product is no longer in the cart
-        assert not cart_page.is_item_in_cart_by_name(removed_product), \
+        assert cart_page.is_item_absent_from_cart(removed_product), \
             f"The removed product '{removed_product}' is still in the cart."
         # Create a new list of expected products after removal and compare
         expected_products = [name for name in added_products if name != removed_product]
         assert sorted(products_after_remove) == sorted(expected_products), \
             "The list of remaining products does not match the expected list."
 
+    @pytest.mark.real_login
     def test_successful_checkout_process(self, logged_in_standard_user):
         """
         Tests the entire successful checkout process, including price verification.
@@ -0,0 +1,116 @@
+import json
+import pytest
+from browser.driver_factory import chrome_options
+from browser.resource_blocking import ResourceBlocker, blocked_url_patterns
+
+BASE_URL = "https://www.saucedemo.com"
+IMAGE_URL = f"{BASE_URL}/static/media/sauce-backpack-1200x1500.0a0b85a3.jpg"
+INVENTORY_URL = f"{BASE_URL}/inventory.html"
+
+
+def run_test(browser, blocker, block, image_event, load_seconds):
+    """
+    Runs a test that loads the inventory page with one product image, as the driver fixture does.
+    """
+    browser.script_default = [INVENTORY_URL, load_seconds]
+    blocker.start(browser, block)
+    events = [
+        {"method": "Network.requestWillBeSent",
+         "params": {"requestId": "1", "type": "Document", "request": {"url": INVENTORY_URL}}},
+        {"method": "Network.requestWillBeSent",
+         "params": {"requestId": "2", "type": "Image", "request": {"url": IMAGE_URL}}},
+        image_event,
+    ]
+    # ChromeDriver's performance log wraps every DevTools event in a JSON message
+    browser.logs["performance"] = [{"message": json.dumps({"message": event})} for event in events]
+    blocker.finish(browser, block)
+    return browser
+
+
+def test_blocked_images_are_counted_and_priced_from_unblocked_loads(fake_driver):
+    """
+    Test Case: Verifies the blocked requests, bytes and load time saved, with the
+    image size learned from a test that loaded everything.
+    """
+    blocker = ResourceBlocker(blocked_url_patterns(["image"], ["*google-analytics.com*"]))
+
+    loaded = {"method": "Network.loadingFinished", "params": {"requestId": "2", "encodedDataLength": 48_000}}
+    unblocked = run_test(fake_driver(), blocker, False, loaded, 1.5)
+    failed = {"method": "Network.loadingFailed", "params": {"requestId": "2", "blockedReason": "inspector"}}
+    blocked = run_test(fake_driver(), blocker, True, failed, 0.5)
+
+    assert unblocked.cdp_commands[-1] == ("Network.setBlockedURLs", {"urls": []}), \
+        f"Expected nothing to be blocked for a load_resources test, but got {unblocked.cdp_commands[-1]}."
+    blocked_urls = blocked.cdp_commands[-1][1]["urls"]
+    assert "*.jpg" in blocked_urls and "*google-analytics.com*" in blocked_urls, \
+        f"Expected images and the extra pattern to be blocked, but got {blocked.cdp_commands[-1]}."
+    summary = blocker.summary()
+    assert (summary["requests_blocked"], summary["bytes_saved"], summary["unpriced"]) == (1, 48_000, 0), \
+        f"Unexpected blocking counters: {summary}."
+    assert summary["load_seconds_saved"] == pytest.approx(1.0), \
+        f"Expected 1 s of page load time saved, but got {summary['load_seconds_saved']}."
+
+
+@pytest.mark.parametrize("cache_event", [
+    {"method": "Network.requestServedFromCache", "params": {"requestId": "2"}},
+    {"method": "Network.responseReceived", "params": {"requestId": "2", "response": {"fromDiskCache": True}}},
+])
+def test_sizes_are_not_learned_from_cached_responses(cache_event):
+    """
+    Test Case: Verifies that an image served from the browser cache (e.g. preloaded by a spare
+    browser) does not price later blocked requests at 0 bytes.
+    """
+    blocker = ResourceBlocker(blocked_url_patterns(["image"]))
+    blocker.record([
+        {"method": "Network.requestWillBeSent",
+         "params": {"requestId": "2", "type": "Image", "request": {"url": IMAGE_URL}}},
+        cache_event,
+        {"method": "Network.loadingFinished", "params": {"requestId": "2", "encodedDataLength": 0}},
+    ], blocked=False)
+    blocker.record([
+        {"method": "Network.requestWillBeSent",
+         "params": {"requestId": "3", "type": "Image", "request": {"url": IMAGE_URL}}},
+        {"method": "Network.loadingFailed", "params": {"requestId": "3", "blockedReason": "inspector"}},
+    ], blocked=True)
+
+    summary = blocker.summary()
+    assert (summary["requests_blocked"], summary["bytes_saved"], summary["unpriced"]) == (1, 0, 1), \
+        f"Expected the blocked image to stay unpriced, but got {summary}."
+
+
+def test_worker_measurements_are_merged():
+    """
+    Test Case: Verifies that measurements dumped by an xdist worker add up in the controller.
+    """
+    worker = ResourceBlocker(["*.png"])
+    worker.record([
+        {"method": "Network.requestWillBeSent",
+         "params": {"requestId": "7", "type": "Image", "request": {"url": f"{BASE_URL}/logo.png"}}},
+        {"method": "Network.loadingFailed", "params": {"requestId": "7", "blockedReason": "inspector"}},
+    ], blocked=True)
+    controller = ResourceBlocker([])
+
+    controller.merge(json.loads(json.dumps(worker.dump())))
+
+    summary = controller.summary()
+    assert (summary["requests_blocked"], summary["unpriced"]) == (1, 1), f"Unexpected merged counters: {summary}."
+
+
+def test_unknown_resource_type_is_rejected():
+    """
+    Test Case: Verifies that a misspelled UI_BLOCK_RESOURCES type fails instead of blocking nothing.
+    """
+    with pytest.raises(ValueError, match="Unknown resource type 'images'"):
+        blocked_url_patterns(["images"])
+
+
+def test_performance_log_is_only_recorded_when_requested():
+    """
+    Test Case: Verifies that browsers only record DevTools network events when resources are blocked.
+    """
+    plain = chrome_options("/tmp/profile").to_capabilities()
+    measured = chrome_options("/tmp/profile", performance_log=True).to_capabilities()
+
+    assert plain["goog:loggingPrefs"] == {"browser": "ALL"}, f"Unexpected logging: {plain['goog:loggingPrefs']}."
+    assert measured["goog:loggingPrefs"]["performance"] == "ALL", \
+        f"Expected the performance log, but got {measured['goog:loggingPrefs']}."